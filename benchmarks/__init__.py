@@ -0,0 +1,6 @@
+# benchmarks/__init__.py
+# 성능 측정용 벤치마크 (python -m benchmarks run / compare)
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
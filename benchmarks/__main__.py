@@ -0,0 +1,7 @@
+# benchmarks/__main__.py
+import sys
+
+from benchmarks.runner import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+# benchmarks/corpus.py
+# 시드 고정 합성 한국어 Threads 게시물 생성기 (일반 글 / 키워드 스팸 / 유사 재게시 혼합)
+import html
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+from guidelines import COMMUNITY_GUIDELINES
+
+_CLEAN_SENTENCES = [
+    "오늘 점심은 회사 근처 국밥집에서 먹었어요",
+    "세금 신고 기간이 다가오니 서류를 미리 챙겨 두세요",
+    "직원에게 줘야 할 돈은 빨리 주는 게 맞다",
+    "마케팅 강의를 들으면서 배운 점을 정리해 봤습니다",
+    "법인 설립 후 첫 해에는 장부 정리가 제일 중요합니다",
+    "주말에는 가족들과 산책을 다녀왔어요",
+    "부가세 신고할 때 놓치기 쉬운 부분이 있어요",
+    "요즘 창업하시는 분들이 많이 물어보시는 질문입니다",
+    "비용 처리 기준은 업종마다 조금씩 다릅니다",
+    "오늘도 고객사 미팅 세 건 다녀왔습니다",
+    "정책자금은 요건 충족 시 검토가 가능합니다",
+    "사업계획서는 숫자보다 흐름이 먼저입니다",
+    "세무 상담은 케이스별로 상이하니 꼭 확인하세요",
+    "퇴근길에 읽은 책 한 구절이 계속 생각나네요",
+    "신규 거래처와 계약 조건을 다시 검토했어요",
+]
+
+# 일반 글 다양화용 문장 틀
+_TOPICS = ["부가세", "종합소득세", "법인세", "4대보험", "급여 정산", "연말정산", "세금계산서", "경비 처리",
+           "임대차 계약", "사업자 등록", "재고 관리", "거래처 정산", "인건비", "카드 매출", "감가상각"]
+_TEMPLATES = [
+    "{month}월에 {topic} 관련 문의가 {count}건 정도 있었어요",
+    "{topic} 때문에 {count}시간 넘게 자료를 정리했습니다",
+    "{topic} 처리할 때 {count}가지만 기억하면 덜 헷갈립니다",
+    "지난 {month}월 {topic} 마감은 생각보다 빨리 끝났네요",
+    "{topic} 기준이 올해 {count}번이나 바뀌었다고 하네요",
+]
+_FILLERS = ["진짜", "솔직히", "참고로", "요즘", "다들", "혹시", "그리고", "근데"]
+_DECORATIONS = ["!!", "🔥", "👉", "✅", "...", "~~", "💰", "📌"]
+
+
+def _guideline_phrases() -> List[str]:
+    phrases = []
+    for category_data in COMMUNITY_GUIDELINES.values():
+        for subcat_data in category_data.get("subcategories", {}).values():
+            phrases.extend(subcat_data.get("keywords", []))
+            phrases.extend(subcat_data.get("indicators", []))
+    return phrases
+
+
+class CorpusGenerator:
+    """
+    벤치마크용 합성 게시물 생성
+    - clean_ratio: 위반 키워드 없는 일반 글 비율
+    - repost_ratio: 앞서 생성한 게시물을 살짝 바꿔 다시 올린 유사 재게시 비율
+    - 나머지는 가이드라인 키워드/인디케이터를 섞은 스팸성 글
+    같은 seed 면 항상 같은 게시물 목록 생성
+    """
+
+    def __init__(self, seed: int = 42, clean_ratio: float = 0.5, repost_ratio: float = 0.2,
+                 username: str = "bench_user"):
+        self.seed = seed
+        self.clean_ratio = clean_ratio
+        self.repost_ratio = repost_ratio
+        self.username = username
+        self.phrases = _guideline_phrases()
+
+    def _clean_text(self, rng: random.Random) -> str:
+        lines = rng.sample(_CLEAN_SENTENCES, rng.randint(0, 2))
+        for _ in range(rng.randint(1, 3)):
+            lines.append(rng.choice(_TEMPLATES).format(
+                month=rng.randint(1, 12), topic=rng.choice(_TOPICS), count=rng.randint(2, 40)
+            ))
+        rng.shuffle(lines)
+        return "\n".join(lines)
+
+    def _spam_text(self, rng: random.Random) -> str:
+        parts = rng.sample(_CLEAN_SENTENCES, rng.randint(0, 2))
+        parts += rng.sample(self.phrases, rng.randint(1, 4))
+        rng.shuffle(parts)
+        if rng.random() < 0.5:
+            parts.append(rng.choice(_DECORATIONS))
+        return "\n".join(parts)
+
+    def _repost_text(self, rng: random.Random, original: str) -> str:
+        """
+        원본에서 한두 군데만 바꾼 재게시 (단어/장식 추가 또는 단어 삭제)
+        """
+        words = original.split(" ")
+        for _ in range(rng.randint(1, 2)):
+            edit = rng.random()
+            position = rng.randrange(len(words) + 1)
+            if edit < 0.4:
+                words.insert(position, rng.choice(_FILLERS))
+            elif edit < 0.7:
+                words.insert(position, rng.choice(_DECORATIONS))
+            elif len(words) > 1:
+                words.pop(min(position, len(words) - 1))
+        return " ".join(words)
+
+    def generate(self, size: int) -> List[dict]:
+        rng = random.Random(self.seed)
+        start = datetime(2025, 1, 1)
+        posts = []
+        for i in range(size):
+            roll = rng.random()
+            if posts and roll < self.repost_ratio:
+                text = self._repost_text(rng, rng.choice(posts)["text"])
+            elif roll < self.repost_ratio + self.clean_ratio:
+                text = self._clean_text(rng)
+            else:
+                text = self._spam_text(rng)
+
+            posted_at = start + timedelta(minutes=37 * i)
+            posts.append({
+                "username": self.username,
+                "text": text,
+                "datetime": posted_at.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "link": f"https://www.threads.net/@{self.username}/post/B{i:07d}",
+                "likes": rng.randint(0, 500),
+                "replies": rng.randint(0, 50),
+                "reposts": rng.randint(0, 20),
+            })
+        return posts
+
+
+def render_html(posts: List[dict]) -> str:
+    """
+    ThreadsHTMLParser 가 읽는 구조(컨테이너/본문/시간/링크/통계 셀렉터)의 피드 HTML
+    """
+    blocks = []
+    for post in posts:
+        text_spans = "".join(
+            f"<span><span>{html.escape(line)}</span></span>" for line in post["text"].split("\n") if line
+        )
+        href = post["link"].replace("https://www.threads.net", "")
+        stats = "".join(
+            f'<span class="x1o0tod">{post[key]}</span>' for key in ("likes", "replies", "reposts")
+        )
+        blocks.append(
+            '<div data-pressable-container="true">'
+            f'<a href="/@{post["username"]}"><span><span>{post["username"]}</span></span></a>'
+            f'<a href="{href}"><time datetime="{post["datetime"]}">{post["datetime"][:10]}</time></a>'
+            f'<div class="x1a6qonq">{text_spans}</div>'
+            f'<div class="x6s0dn4 x17zd0t2">{stats}</div>'
+            '</div>'
+        )
+    return f"<html><body>{''.join(blocks)}</body></html>"
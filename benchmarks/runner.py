@@ -0,0 +1,185 @@
+# benchmarks/runner.py
+# 벤치마크 실행 (JSON 결과 저장) + 기준 결과 대비 성능 저하 비교
+import argparse
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.corpus import CorpusGenerator, render_html
+from analyzer import GuidelineAnalyzer, generate_summary
+from csv_export import save_results_csv
+from html_parser import ThreadsHTMLParser
+
+# 기본 성능 저하 판정 기준 (중앙값 기준 15% 이상 느려지면 저하)
+DEFAULT_THRESHOLD = 0.15
+
+
+def _time(func: Callable[[], None], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def build_benchmarks(posts: List[dict], duplicate_sample: int,
+                     parse_sample: int) -> List[Tuple[str, int, Optional[Callable], Callable]]:
+    """
+    (이름, 처리 건수, 준비 함수, 측정 함수) 목록
+    준비 함수(분석 결과/HTML 생성 등)는 실행하는 벤치마크만 측정 전에 1회 호출 (--only 로 제외하면 비용 없음)
+    _find_duplicates(전체 비교)와 HTML 파싱은 비용이 커서 앞부분 표본만 사용
+    """
+    analyzer = GuidelineAnalyzer()
+    dup_posts = posts[:duplicate_sample]
+    html_posts = posts[:parse_sample]
+    parser = ThreadsHTMLParser()
+    state = {}
+
+    def prepare_results():
+        if "results" not in state:
+            state["results"] = analyzer.analyze_all_posts(posts)
+
+    def prepare_html():
+        if "feed_html" not in state:
+            state["feed_html"] = render_html(html_posts)
+
+    def prepare_csv():
+        prepare_results()
+        if "output_dir" not in state:
+            state["output_dir"] = tempfile.mkdtemp(prefix="threads_bench_")
+
+    def analyze_post():
+        for post in posts:
+            analyzer.analyze_post(post)
+
+    def analyze_all_posts():
+        analyzer.analyze_all_posts(posts)
+
+    def find_duplicates():
+        for i, post in enumerate(dup_posts):
+            analyzer._find_duplicates(post["text"], dup_posts, i)
+
+    def parse_multiple_posts():
+        parser.parse_multiple_posts(state["feed_html"])
+
+    def summary():
+        generate_summary(state["results"])
+
+    def csv_export():
+        save_results_csv(state["results"], os.path.join(state["output_dir"], "bench.csv"))
+
+    # 분석 결과는 게시물마다 1개이므로 결과 건수 = 게시물 수
+    return [
+        ("analyze_post", len(posts), None, analyze_post),
+        ("analyze_all_posts", len(posts), None, analyze_all_posts),
+        ("find_duplicates", len(dup_posts), None, find_duplicates),
+        ("parse_multiple_posts", len(html_posts), prepare_html, parse_multiple_posts),
+        ("generate_summary", len(posts), prepare_results, summary),
+        ("csv_export", len(posts), prepare_csv, csv_export),
+    ]
+
+
+def run(size: int, seed: int, repeat: int, duplicate_sample: int, parse_sample: int,
+        only: List[str] = None) -> Dict:
+    posts = CorpusGenerator(seed=seed).generate(size)
+    print(f"[*] 합성 게시물 {len(posts)}개 생성 (seed={seed})")
+
+    benchmarks = {}
+    for name, items, setup, func in build_benchmarks(posts, duplicate_sample, parse_sample):
+        if only and name not in only:
+            continue
+        if setup is not None:
+            setup()
+        timings = _time(func, repeat)
+        median = statistics.median(timings)
+        benchmarks[name] = {
+            "items": items,
+            "repeat": repeat,
+            "min_seconds": round(min(timings), 6),
+            "median_seconds": round(median, 6),
+            "items_per_second": round(items / median, 1) if median > 0 else None,
+        }
+        print(f"  • {name}: {median:.4f}s ({items}건)")
+
+    return {
+        "meta": {
+            "size": size,
+            "seed": seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    벤치마크별 중앙값 비교, 반환: [{"name", "baseline", "current", "ratio", "regression"}]
+    (한쪽에만 있는 벤치마크는 제외)
+    """
+    rows = []
+    for name, base in baseline.get("benchmarks", {}).items():
+        cur = current.get("benchmarks", {}).get(name)
+        if cur is None:
+            continue
+        ratio = cur["median_seconds"] / base["median_seconds"] if base["median_seconds"] > 0 else 1.0
+        rows.append({
+            "name": name,
+            "baseline": base["median_seconds"],
+            "current": cur["median_seconds"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+
+def _load(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Threads 분석기 벤치마크")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="벤치마크 실행 후 JSON 저장")
+    run_parser.add_argument("--size", type=int, default=1000, help="합성 게시물 수 (1k~1M)")
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--duplicate-sample", type=int, default=500, help="_find_duplicates 표본 크기")
+    run_parser.add_argument("--parse-sample", type=int, default=2000, help="HTML 파싱 표본 크기")
+    run_parser.add_argument("--only", nargs="*", help="실행할 벤치마크 이름")
+    run_parser.add_argument("--output", default="bench_results.json")
+
+    compare_parser = commands.add_parser("compare", help="기준 결과 대비 성능 저하 확인")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="허용 저하 비율 (0.15 = 15%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        result = run(args.size, args.seed, args.repeat, args.duplicate_sample, args.parse_sample, args.only)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"✅ 벤치마크 결과 저장: {args.output}")
+        return 0
+
+    rows = compare(_load(args.baseline), _load(args.current), args.threshold)
+    regressions = [row for row in rows if row["regression"]]
+    for row in rows:
+        mark = "❌" if row["regression"] else "✅"
+        print(f"{mark} {row['name']}: {row['baseline']:.4f}s -> {row['current']:.4f}s (x{row['ratio']})")
+    if regressions:
+        print(f"[!] 성능 저하 {len(regressions)}건 (허용 {args.threshold:.0%})")
+        return 1
+    print("✅ 성능 저하 없음")
+    return 0
@@ -0,0 +1,137 @@
+# src/analysis_cache.py
+# 본문 해시 + 규칙 버전 기반 게시물 분석 결과 캐시 (SQLite, LRU 크기 제한)
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Optional
+
+import guidelines
+
+# 분석 결과 형식/로직이 바뀌면 올려서 기존 캐시 무효화
+# (2: 문자열 대신 규칙 인덱스/위치 + 점수만 저장)
+CACHE_FORMAT_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    ruleset TEXT NOT NULL,
+    result TEXT NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_access ON entries (last_access);
+"""
+
+
+def ruleset_version() -> str:
+    """
+    guidelines.py 내용 + 캐시 형식 버전 해시 (규칙이 바뀌면 자동으로 달라짐)
+    """
+    with open(guidelines.__file__, "rb") as f:
+        source = f.read()
+    digest = hashlib.blake2b(source, digest_size=16)
+    digest.update(str(CACHE_FORMAT_VERSION).encode("ascii"))
+    return digest.hexdigest()
+
+
+def text_key(text: str) -> str:
+    """
+    분석 결과는 소문자 변환된 본문에만 의존하므로 소문자 본문 해시를 키로 사용
+    """
+    return hashlib.blake2b(text.lower().encode("utf-8"), digest_size=16).hexdigest()
+
+
+class AnalysisCache:
+    """
+    (본문 해시, 규칙 버전) -> analyze_post 매칭 결과 (규칙 인덱스/위치 + 위험 점수)
+    - 규칙 버전이 다른 항목은 열 때 삭제
+    - max_entries 초과 시 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    - 쓰기는 commit_every 건마다 묶어서 커밋
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 200000, commit_every: int = 500):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.commit_every = commit_every
+        self.ruleset = ruleset_version()
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+
+        dirname = os.path.dirname(db_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        # 스트리밍 분석 시 분석 스레드에서 사용 (동시 사용은 하지 않음)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+
+        stale = self.conn.execute("DELETE FROM entries WHERE ruleset != ?", (self.ruleset,)).rowcount
+        self.conn.commit()
+        if stale:
+            print(f"[*] 가이드라인 변경으로 분석 캐시 {stale}개 무효화")
+        self._size = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, text: str) -> Optional[dict]:
+        key = text_key(text)
+        row = self.conn.execute(
+            "SELECT result FROM entries WHERE key = ? AND ruleset = ?", (key, self.ruleset)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        self._after_write()
+        return json.loads(row[0])
+
+    def put(self, text: str, payload: dict) -> None:
+        """
+        payload: 본문에만 의존하는 분석 결과 (JSON 직렬화 가능한 dict)
+        """
+        result = json.dumps(payload, separators=(",", ":"))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries (key, ruleset, result, last_access) VALUES (?, ?, ?, ?)",
+            (text_key(text), self.ruleset, result, time.time())
+        )
+        # 교체된 경우도 +1 (상한 초과 시 _evict 에서 정확히 다시 셈)
+        self._size += 1
+        if self._size > self.max_entries:
+            self._evict()
+        self._after_write()
+
+    def _evict(self) -> None:
+        """
+        상한의 90% 까지 LRU 제거 (매 삽입마다 제거하지 않도록 여유 확보)
+        """
+        self._size = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if self._size <= self.max_entries:
+            return
+        target = int(self.max_entries * 0.9)
+        self.conn.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_access LIMIT ?)",
+            (self._size - target,)
+        )
+        self._size = target
+
+    def _after_write(self) -> None:
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+
+    def flush(self) -> None:
+        self.conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
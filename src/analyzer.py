@@ -1,97 +1,109 @@
 # src/analyzer.py
+import math
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 from guidelines import COMMUNITY_GUIDELINES, SEVERITY_SCORES, COMBINATION_BONUS
+from compiled_guidelines import CompiledGuidelines
+from batch_scoring import BatchRiskScorer
+from results import AnalysisResult, RiskLevel
+from summary import SummaryAccumulator
+from metrics import Metrics
+from dedup import (
+    candidate_sets, comparable_text, exact_duplicate_groups, IncrementalDuplicateIndex, MinHasher, LSH_BANDS, LSH_ROWS
+)
 
 class GuidelineAnalyzer:
-    def __init__(self):
+    def __init__(self, lsh_bands: int = LSH_BANDS, lsh_rows: int = LSH_ROWS, fingerprint_index=None,
+                 workers: int = 1, cache=None, metrics: Metrics = None):
         self.guidelines = COMMUNITY_GUIDELINES
         self.severity_scores = SEVERITY_SCORES
         self.combination_bonus = COMBINATION_BONUS
+        # 키워드/인디케이터/점수 테이블을 1회만 컴파일
+        self.compiled = CompiledGuidelines(self.guidelines, self.severity_scores, self.combination_bonus)
+        self.batch_scorer = BatchRiskScorer(self.compiled)
+        # 중복 후보 탐색용 LSH 설정 (bands↑: 재현율↑, rows↑: 후보 수↓)
+        self.lsh_bands = lsh_bands
+        self.lsh_rows = lsh_rows
+        # 이전 실행 게시물과의 중복 검사용 FingerprintIndex (선택)
+        self.fingerprint_index = fingerprint_index
+        # analyze_all_posts 병렬 처리 프로세스 수 (1 이하면 단일 프로세스)
+        self.workers = workers
+        # 본문 해시 기반 분석 결과 캐시 AnalysisCache (선택)
+        self.cache = cache
+        # 단계별 시간/카운터 계측 (analysis.*)
+        self.metrics = metrics if metrics is not None else Metrics()
     
-    def analyze_post(self, post: dict) -> dict:
+    def analyze_post(self, post: dict) -> AnalysisResult:
         """
         단일 게시물을 공식 가이드라인 기준으로 분석
         """
-        text = post.get("text", "")
+        if self.cache is not None:
+            cached = self._analyze_from_cache(post)
+            if cached is not None:
+                return cached
         
-        analysis = {
-            "username": post.get("username", ""),
-            "text": text,
-            "datetime": post.get("datetime", ""),
-            "link": post.get("link", ""),
-            "likes": post.get("likes", 0),
-            "replies": post.get("replies", 0),
-            "reposts": post.get("reposts", 0),
-            "violations": [],
-            "violation_details": [],
-            "risk_score": 0,
-            "risk_level": "✅ 안전",
-            "official_policy_refs": [],
-            "recommendations": []
-        }
+        analysis, detected = self._match_post(post)
+        analysis.set_risk_score(self._calculate_risk_score(
+            [(rule.category, rule.subcategory) for rule in detected],
+            [{"base_score": rule.base_score} for rule in detected]
+        ))
         
-        detected_subcategories = []
-        
-        for category, category_data in self.guidelines.items():
-            for subcategory, subcat_data in category_data.get("subcategories", {}).items():
-                violation = self._check_violation(text, subcat_data)
-                
-                if violation["is_violation"]:
-                    detected_subcategories.append((category, subcategory))
-                    base_score = self.severity_scores.get(category, {}).get(subcategory, 50)
-                    
-                    analysis["violations"].append({
-                        "category": category,
-                        "subcategory": subcategory,
-                        "matched_indicators": violation["matched_indicators"],
-                        "matched_keywords": violation["matched_keywords"],
-                        "base_score": base_score
-                    })
-                    
-                    matched_items = violation['matched_keywords'][:3] if violation['matched_keywords'] else violation['matched_indicators'][:1]
-                    analysis["violation_details"].append(
-                        f"[{category}/{subcategory}] {', '.join(matched_items)}"
-                    )
-                    
-                    analysis["official_policy_refs"].append(
-                        f"커뮤니티 규정 > {category.replace('_', ' ')} > {subcategory.replace('_', ' ')}"
-                    )
-        
-        analysis["risk_score"] = self._calculate_risk_score(detected_subcategories, analysis["violations"])
-        analysis["risk_level"] = self._get_risk_level(analysis["risk_score"])
-        analysis["recommendations"] = self._generate_recommendations(analysis["violations"])
+        if self.cache is not None:
+            self._cache_put(analysis)
         
         return analysis
     
-    def _check_violation(self, text: str, subcat_data: dict) -> dict:
+    def analyze_posts(self, posts: list) -> list:
         """
-        위반 여부 검사
+        여러 게시물 규칙 분석 (중복 검사 없음)
+        위험 점수는 BatchRiskScorer 로 한 번에 계산 (analyze_post 와 동일한 결과)
         """
-        result = {
-            "is_violation": False,
-            "matched_indicators": [],
-            "matched_keywords": []
-        }
-        
-        text_lower = text.lower()
+        analyses = [None] * len(posts)
+        matched = []
         
-        # 키워드 매칭
-        for keyword in subcat_data.get("keywords", []):
-            if keyword.lower() in text_lower:
-                result["matched_keywords"].append(keyword)
-        
-        # 인디케이터 매칭
-        for indicator in subcat_data.get("indicators", []):
-            indicator_words = [w for w in indicator.split() if len(w) > 2]
-            if len(indicator_words) > 0:
-                match_count = sum(1 for w in indicator_words if w.lower() in text_lower)
-                if match_count / len(indicator_words) >= 0.3:
-                    result["matched_indicators"].append(indicator)
+        for i, post in enumerate(posts):
+            if self.cache is not None:
+                analyses[i] = self._analyze_from_cache(post)
+                if analyses[i] is not None:
+                    continue
+            analysis, detected = self._match_post(post)
+            matched.append((i, analysis, [rule.index for rule in detected]))
         
-        if len(result["matched_keywords"]) >= 1 or len(result["matched_indicators"]) >= 1:
-            result["is_violation"] = True
+        scores = self.batch_scorer.score([indices for _, _, indices in matched])
+        for (i, analysis, _), score in zip(matched, scores):
+            analysis.set_risk_score(score)
+            if self.cache is not None:
+                self._cache_put(analysis)
+            analyses[i] = analysis
         
-        return result
+        return analyses
+    
+    def _match_post(self, post: dict) -> tuple:
+        """
+        규칙 매칭 (위험 점수 제외)
+        반환: (분석 결과, 탐지된 CompiledSubcategory 목록)
+        """
+        detected = []
+        matches = []
+        for rule, keyword_positions, indicator_positions in self.compiled.match(post.get("text", "")):
+            detected.append(rule)
+            matches.append((rule.index, keyword_positions, indicator_positions))
+        return AnalysisResult(self.compiled, post, tuple(matches)), detected
+    
+    def _analyze_from_cache(self, post: dict):
+        """
+        캐시에 있으면 매칭 없이 분석 결과 구성, 없으면 None
+        """
+        cached = self.cache.get(post.get("text", ""))
+        if cached is None:
+            return None
+        matches = tuple(
+            (index, tuple(keywords), tuple(indicators)) for index, keywords, indicators in cached["matches"]
+        )
+        return AnalysisResult(self.compiled, post, matches, cached["risk_score"])
+    
+    def _cache_put(self, analysis: AnalysisResult) -> None:
+        self.cache.put(analysis.text, {"matches": analysis.matches, "risk_score": analysis.risk_score})
     
     def _calculate_risk_score(self, detected_subcategories: list, violations: list) -> int:
         """
@@ -104,15 +116,7 @@ class GuidelineAnalyzer:
         max_score = max(base_scores) if base_scores else 0
         additional_score = min(len(violations) - 1, 3) * 10
         
-        combination_score = 0
-        for i, (cat1, sub1) in enumerate(detected_subcategories):
-            for cat2, sub2 in detected_subcategories[i+1:]:
-                key1 = (sub1, sub2)
-                key2 = (sub2, sub1)
-                if key1 in self.combination_bonus:
-                    combination_score += self.combination_bonus[key1]
-                elif key2 in self.combination_bonus:
-                    combination_score += self.combination_bonus[key2]
+        combination_score = self.compiled.combination_score([sub for _, sub in detected_subcategories])
         
         return min(max_score + additional_score + combination_score, 100)
     
@@ -120,16 +124,7 @@ class GuidelineAnalyzer:
         """
         위험 등급
         """
-        if score >= 80:
-            return "🔴 매우 높음 (삭제 가능성 높음)"
-        elif score >= 60:
-            return "🟠 높음 (경고/제한 가능성)"
-        elif score >= 40:
-            return "🟡 중간 (주의 필요)"
-        elif score >= 20:
-            return "🟢 낮음"
-        else:
-            return "✅ 안전"
+        return RiskLevel.from_score(score).label
     
     def _generate_recommendations(self, violations: list) -> list:
         """
@@ -145,127 +140,205 @@ class GuidelineAnalyzer:
                 continue
             seen.add(sub)
             
-            if sub == "직업_사기":
-                recommendations.append(
-                    "⚠️ [직업 사기 오인] '업종만 괜찮으면', '쉽게', '보장' 제거 → '요건 충족 시 검토 가능'으로 변경"
-                )
-            elif sub == "가짜_문서_사기":
-                recommendations.append(
-                    "⚠️ [가짜 문서 사기 오인] '인증 가자', '대행' 제거 → '인증 요건 안내', '공식 절차 확인 필요'로 변경"
-                )
-            elif sub == "반복_게시":
-                recommendations.append(
-                    "⚠️ [스팸 탐지] 동일/유사 문구 반복 게시 금지 → 문장 구조/표현을 다르게 작성"
-                )
-            elif sub == "참여_유도":
-                recommendations.append(
-                    "⚠️ [참여 유도 스팸] 'DM 주세요', '좋아요 누르면' 등 과도한 CTA 최소화"
-                )
-            elif sub == "기만적_오해_유발":
-                recommendations.append(
-                    "⚠️ [과장/기만 오인] '100%', '무조건', '보장' 제거 → '가능성', '검토 필요'로 완화"
-                )
-            elif sub == "투자_금전_사기":
-                recommendations.append(
-                    "⚠️ [투자 사기 오인] 수익 보장, 무위험 투자 표현 절대 금지"
-                )
+            rule = self.compiled.by_name.get(sub)
+            if rule is not None and rule.recommendation:
+                recommendations.append(rule.recommendation)
         
         return recommendations
     
-    def analyze_all_posts(self, posts: list) -> list:
+    def analyze_all_posts(self, posts: list, workers: int = None) -> list:
         """
         전체 게시물 분석 + 중복 검사
+        (workers > 1 이면 게시물 분석/MinHash 서명을 프로세스 풀에서 병렬 처리,
+         중복 검사 병합은 메인 프로세스에서 수행하므로 결과와 순서는 단일 처리와 동일)
         """
+        workers = self.workers if workers is None else workers
+        metrics = self.metrics
+        metrics.incr("analysis.posts", len(posts))
+        
         results = []
+        with metrics.span("analysis.rules"):
+            analyses, signatures = self._analyze_batch(posts, workers)
+        with metrics.span("analysis.duplicates"):
+            duplicates_by_index = self._find_all_duplicates([post["text"] for post in posts], signatures)
         
-        for i, post in enumerate(posts):
-            analysis = self.analyze_post(post)
-            
-            # 중복 검사
-            duplicates = self._find_duplicates(post["text"], posts, i)
-            
-            if duplicates:
-                analysis["violations"].append({
-                    "category": "스팸",
-                    "subcategory": "반복_게시",
-                    "matched_indicators": [f"{len(duplicates)}개의 유사 게시물 발견"],
-                    "matched_keywords": [],
-                    "base_score": 80
-                })
-                analysis["violation_details"].append(
-                    f"[스팸/반복_게시] {len(duplicates)}개의 유사 게시물 발견"
-                )
-                analysis["official_policy_refs"].append(
-                    "커뮤니티 규정 > 스팸 > 반복적인 콘텐츠 게시"
-                )
-                analysis["recommendations"].append(
-                    "⚠️ [스팸 탐지] 동일/유사 문구 반복 게시 금지"
-                )
-                analysis["risk_score"] = min(analysis["risk_score"] + 30, 100)
-                analysis["risk_level"] = self._get_risk_level(analysis["risk_score"])
-            
-            analysis["is_duplicate"] = len(duplicates) > 0
-            analysis["duplicate_count"] = len(duplicates)
-            
+        # 이전 실행에서 분석한 게시물과의 중복
+        history_by_index = [[] for _ in posts]
+        if self.fingerprint_index is not None:
+            with metrics.span("analysis.history"):
+                history_by_index = self.fingerprint_index.find_matches(posts, signatures=signatures)
+        
+        for i, analysis in enumerate(analyses):
+            duplicates, group_size = duplicates_by_index[i]
+            self._apply_duplicates(analysis, duplicates, group_size, history_by_index[i])
             results.append(analysis)
         
+        if self.fingerprint_index is not None:
+            with metrics.span("analysis.history"):
+                self.fingerprint_index.add_posts(posts, signatures=signatures)
+        
+        return results
+    
+    def analyze_stream(self, posts, flush_every: int = 200):
+        """
+        게시물이 들어오는 대로 분석 결과를 하나씩 반환하는 제너레이터
+        - 중복 검사는 증분 인덱스로 '이전에 들어온 게시물'과만 비교
+          (먼저 들어온 게시물은 이후 중복이 생겨도 이미 반환된 결과가 바뀌지 않음)
+        - fingerprint_index 가 있으면 이전 실행 게시물과도 비교하고 flush_every 개마다 저장
+        """
+        duplicate_index = IncrementalDuplicateIndex(self.lsh_bands, self.lsh_rows)
+        metrics = self.metrics
+        stream_keys = set()
+        pending = []
+        
+        try:
+            for post in posts:
+                metrics.incr("analysis.posts")
+                with metrics.span("analysis.rules"):
+                    analysis = self.analyze_post(post)
+                with metrics.span("analysis.duplicates"):
+                    duplicates, group_size = duplicate_index.add(post.get("text", ""))
+                
+                history_duplicates = []
+                if self.fingerprint_index is not None:
+                    with metrics.span("analysis.history"):
+                        stream_keys.add(self.fingerprint_index.post_key(post))
+                        history_duplicates = self.fingerprint_index.find_matches([post], exclude_keys=stream_keys)[0]
+                        pending.append(post)
+                        if len(pending) >= flush_every:
+                            self.fingerprint_index.add_posts(pending)
+                            pending = []
+                
+                self._apply_duplicates(analysis, duplicates, group_size, history_duplicates)
+                yield analysis
+        finally:
+            if self.fingerprint_index is not None and pending:
+                self.fingerprint_index.add_posts(pending)
+    
+    def _apply_duplicates(self, analysis: AnalysisResult, duplicates: list, group_size: int,
+                          history_duplicates: list) -> None:
+        """
+        중복 검사 결과를 분석 결과에 반영 (반복_게시 위반 + 점수 가산)
+        """
+        analysis.set_duplicates(len(duplicates) + len(history_duplicates), group_size, len(history_duplicates))
+    
+    def _analyze_batch(self, posts: list, workers: int) -> tuple:
+        """
+        게시물별 규칙 분석 (+ 병렬 처리 시 MinHash 서명)
+        반환: (분석 결과 목록, 서명 목록 또는 None)
+        """
+        if workers <= 1 or len(posts) < workers * 2:
+            return self.analyze_posts(posts), None
+        
+        # 캐시 적중 게시물은 메인 프로세스에서 처리, 워커는 서명만 계산
+        cached = [None] * len(posts)
+        if self.cache is not None:
+            cached = [self._analyze_from_cache(post) for post in posts]
+        items = [(post, cached_analysis is None) for post, cached_analysis in zip(posts, cached)]
+        
+        # 워커당 여러 청크를 받도록 나눠 부하 분산
+        chunk_size = max(1, math.ceil(len(items) / (workers * 4)))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        
+        analyses = []
+        signatures = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.lsh_bands, self.lsh_rows)
+        ) as executor:
+            for chunk_analyses, chunk_signatures in executor.map(_analyze_chunk, chunks):
+                analyses.extend(chunk_analyses)
+                signatures.extend(chunk_signatures)
+        
+        for i in range(len(posts)):
+            if cached[i] is not None:
+                analyses[i] = cached[i]
+            else:
+                # 워커에서 넘어온 결과에 규칙 테이블 재연결
+                analyses[i].ruleset = self.compiled
+                if self.cache is not None:
+                    self._cache_put(analyses[i])
+        return analyses, signatures
+    
+    def _find_all_duplicates(self, texts: list, signatures: list = None) -> list:
+        """
+        전체 게시물 중복 검사
+        1) 정규화 해시로 완전 중복 그룹화 (O(n))
+        2) 그룹 대표 게시물끼리만 MinHash/LSH 후보 + SequenceMatcher 검증
+        반환: 인덱스별 (중복 목록, 완전 중복 그룹 크기)
+        유사도는 원문이 아닌 정규화 텍스트(comparable_text) 기준:
+        같은 그룹 구성원끼리는 100.0, 다른 그룹 구성원과는 두 그룹 대표의 유사도 (구성원 쌍의 실제 값과 같음)
+        """
+        groups = exact_duplicate_groups(texts)
+        representatives = [{"text": comparable_text(texts[group[0]])} for group in groups]
+        rep_signatures = [signatures[group[0]] for group in groups] if signatures is not None else None
+        candidates = candidate_sets(
+            [texts[group[0]] for group in groups], self.lsh_bands, self.lsh_rows, signatures=rep_signatures
+        )
+        
+        results = [None] * len(texts)
+        for group_index, group in enumerate(groups):
+            similar_groups = self._find_duplicates(
+                representatives[group_index]["text"], representatives, group_index,
+                candidates=candidates[group_index]
+            )
+            for member in group:
+                duplicates = [{"index": other, "similarity": 100.0} for other in group if other != member]
+                for similar in similar_groups:
+                    duplicates.extend(
+                        {"index": other, "similarity": similar["similarity"]}
+                        for other in groups[similar["index"]]
+                    )
+                duplicates.sort(key=lambda d: d["index"])
+                results[member] = (duplicates, len(group))
         return results
     
-    def _find_duplicates(self, text: str, all_posts: list, current_index: int, threshold: float = 0.8) -> list:
+    def _find_duplicates(self, text: str, all_posts: list, current_index: int, threshold: float = 0.8,
+                         candidates=None) -> list:
         """
         유사 게시물 찾기
+        (candidates 가 주어지면 해당 인덱스만 비교, 없으면 전체 비교)
         """
+        indices = sorted(candidates) if candidates is not None else range(len(all_posts))
+        
         duplicates = []
-        for i, post in enumerate(all_posts):
+        for i in indices:
             if i != current_index:
-                similarity = SequenceMatcher(None, text, post["text"]).ratio()
+                matcher = SequenceMatcher(None, text, all_posts[i]["text"])
+                # 상한값으로 먼저 걸러 ratio() 계산 최소화 (결과 동일)
+                if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                    continue
+                similarity = matcher.ratio()
                 if similarity >= threshold:
                     duplicates.append({"index": i, "similarity": round(similarity * 100, 1)})
         return duplicates
 
 
+# 프로세스 풀 워커 상태 (워커마다 1회만 규칙 컴파일)
+_worker_analyzer = None
+_worker_hasher = None
+
+
+def _init_worker(lsh_bands: int, lsh_rows: int) -> None:
+    global _worker_analyzer, _worker_hasher
+    _worker_analyzer = GuidelineAnalyzer(lsh_bands=lsh_bands, lsh_rows=lsh_rows)
+    _worker_hasher = MinHasher(num_perm=lsh_bands * lsh_rows)
+
+
+def _analyze_chunk(items: list) -> tuple:
+    """
+    items: [(게시물, 분석 필요 여부)] - 캐시 적중 게시물은 서명만 계산
+    """
+    to_analyze = [post for post, needs_analysis in items if needs_analysis]
+    analyzed = iter(_worker_analyzer.analyze_posts(to_analyze))
+    analyses = [next(analyzed) if needs_analysis else None for _, needs_analysis in items]
+    signatures = [_worker_hasher.signature(post["text"]) for post, _ in items]
+    return analyses, signatures
+
+
 def generate_summary(results: list) -> dict:
     """
     전체 분석 요약
     """
-    total = len(results)
-    if total == 0:
-        return {
-            "total_posts": 0,
-            "critical_count": 0,
-            "high_risk_count": 0,
-            "medium_risk_count": 0,
-            "low_risk_count": 0,
-            "safe_count": 0,
-            "duplicate_count": 0,
-            "average_risk_score": 0,
-            "top_violations": []
-        }
-    
-    critical = sum(1 for r in results if "매우 높음" in r["risk_level"])
-    high = sum(1 for r in results if "높음" in r["risk_level"] and "매우" not in r["risk_level"])
-    medium = sum(1 for r in results if "중간" in r["risk_level"])
-    low = sum(1 for r in results if "낮음" in r["risk_level"])
-    safe = sum(1 for r in results if "안전" in r["risk_level"])
-    duplicates = sum(1 for r in results if r.get("is_duplicate", False))
-    
-    all_violations = []
-    for r in results:
-        for v in r.get("violations", []):
-            all_violations.append(f"{v['category']}/{v['subcategory']}")
-    
-    from collections import Counter
-    violation_counts = Counter(all_violations)
-    top_violations = violation_counts.most_common(5)
-    
-    return {
-        "total_posts": total,
-        "critical_count": critical,
-        "high_risk_count": high,
-        "medium_risk_count": medium,
-        "low_risk_count": low,
-        "safe_count": safe,
-        "duplicate_count": duplicates,
-        "average_risk_score": round(sum(r["risk_score"] for r in results) / total, 1),
-        "top_violations": top_violations
-    }
+    return SummaryAccumulator().update(results).to_dict()
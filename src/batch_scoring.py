@@ -0,0 +1,51 @@
+# src/batch_scoring.py
+# 게시물 x 하위 카테고리 행렬 기반 위험 점수 일괄 계산 (NumPy)
+from typing import List, Sequence
+
+import numpy as np
+
+from compiled_guidelines import CompiledGuidelines
+
+
+class BatchRiskScorer:
+    """
+    GuidelineAnalyzer._calculate_risk_score 와 같은 점수를 여러 게시물에 대해 한 번에 계산
+    점수 = min(최대 심각도 + min(위반 수 - 1, 3) * 10 + 조합 보너스, 100)
+    조합 보너스 = sum_{i<j} M_i * M_j * B_ij  ->  ((M @ B) * M).sum(axis=1)
+    (B: 정의 순서상 앞 하위 카테고리 i, 뒤 하위 카테고리 j 의 보너스만 채운 상삼각 행렬)
+    """
+
+    def __init__(self, compiled: CompiledGuidelines):
+        rules = compiled.subcategories
+        size = len(rules)
+        self.size = size
+        self.severity = np.array([rule.base_score for rule in rules], dtype=np.int64)
+
+        bonus = np.zeros((size, size), dtype=np.int64)
+        for i, first in enumerate(rules):
+            for j in range(i + 1, size):
+                bonus[i, j] = compiled.combination_lookup.get((first.subcategory, rules[j].subcategory), 0)
+        self.bonus = bonus
+
+    def matrix(self, detected: Sequence[Sequence[int]]) -> np.ndarray:
+        """
+        게시물별 탐지된 하위 카테고리 인덱스 목록 -> 0/1 행렬
+        """
+        matrix = np.zeros((len(detected), self.size), dtype=np.int64)
+        rows = [row for row, indices in enumerate(detected) for _ in indices]
+        cols = [index for indices in detected for index in indices]
+        matrix[rows, cols] = 1
+        return matrix
+
+    def score(self, detected: Sequence[Sequence[int]]) -> List[int]:
+        if not detected:
+            return []
+        matrix = self.matrix(detected)
+
+        max_score = (matrix * self.severity).max(axis=1)
+        additional = np.clip(matrix.sum(axis=1) - 1, 0, 3) * 10
+        combination = ((matrix @ self.bonus) * matrix).sum(axis=1)
+
+        scores = np.minimum(max_score + additional + combination, 100)
+        scores[matrix.sum(axis=1) == 0] = 0
+        return scores.tolist()
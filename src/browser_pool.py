@@ -0,0 +1,201 @@
+# src/browser_pool.py
+# 크롤링 브라우저/컨텍스트 재사용 (한 프로세스의 여러 크롤링이 같은 브라우저를 공유)
+import asyncio
+import json
+import os
+
+from playwright.async_api import async_playwright
+
+from metrics import Metrics
+from rate_limiter import RateLimiter
+from resource_blocker import ResourceBlocker
+
+COOKIES_FILE = "threads_cookies.json"
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
+
+LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--no-sandbox',
+    '--disable-dev-shm-usage'
+)
+
+_HIDE_WEBDRIVER_JS = """
+    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+"""
+
+
+async def interactive_login(playwright, cookies_file: str = COOKIES_FILE, user_data_dir: str = None) -> list:
+    """
+    브라우저를 열어 수동 로그인 후 쿠키 저장
+    (user_data_dir 를 주면 그 프로필에 로그인 상태가 남음)
+    """
+    if user_data_dir:
+        context = await playwright.chromium.launch_persistent_context(
+            user_data_dir, headless=False, args=['--no-sandbox'],
+            viewport={"width": 1280, "height": 800}
+        )
+        browser = None
+    else:
+        browser = await playwright.chromium.launch(
+            headless=False,  # 브라우저 보이게
+            args=['--no-sandbox']
+        )
+        context = await browser.new_context(
+            viewport={"width": 1280, "height": 800}
+        )
+    page = await context.new_page()
+
+    print("=" * 50)
+    print("Threads 로그인이 필요합니다")
+    print("=" * 50)
+    print("\n1. 브라우저에서 Threads에 로그인하세요")
+    print("2. 로그인 완료 후 이 터미널에서 Enter를 누르세요\n")
+
+    # Threads 로그인 페이지로 이동
+    await page.goto("https://www.threads.net/login", wait_until="networkidle")
+
+    # 사용자가 로그인할 때까지 대기 (이벤트 루프를 막지 않도록 별도 스레드에서 입력 대기)
+    await asyncio.to_thread(input, ">>> 로그인 완료 후 Enter를 누르세요...")
+
+    # 쿠키 저장
+    cookies = await context.cookies()
+    with open(cookies_file, 'w') as f:
+        json.dump(cookies, f, indent=2)
+
+    print(f"\n✅ 쿠키 저장 완료: {cookies_file}")
+    print(f"   저장된 쿠키: {len(cookies)}개")
+
+    await context.close()
+    if browser is not None:
+        await browser.close()
+    return cookies
+
+
+class BrowserPool:
+    """
+    브라우저 1개 + 컨텍스트 1개를 띄워 두고 크롤링마다 페이지만 새로 엶
+    - persistent=False: 일반 브라우저 + 쿠키 파일 로드 (기존 방식)
+    - persistent=True: launch_persistent_context(user_data_dir) - 로그인 상태가 프로필에 남아 쿠키 파일 불필요
+    - 세션 만료 시 relogin(): 별도 브라우저에서 수동 로그인 후 같은 컨텍스트에 쿠키만 다시 넣음
+      (공유 컨텍스트를 닫지 않으므로 다른 크롤링/상세 페이지 방문은 그대로 진행, persistent 는 쿠키가 프로필에 저장됨)
+    - rate_limiter: 이 브라우저로 여는 모든 페이지가 공유하는 요청 속도 제한 (페이지마다 429 감지 연결)
+    """
+
+    def __init__(self, persistent: bool = False, user_data_dir: str = "browser_profile",
+                 cookies_file: str = COOKIES_FILE, resource_blocker: ResourceBlocker = None,
+                 rate_limiter: RateLimiter = None, metrics: Metrics = None):
+        self.persistent = persistent
+        self.user_data_dir = user_data_dir
+        self.cookies_file = cookies_file
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.resource_blocker = resource_blocker if resource_blocker is not None else ResourceBlocker()
+        if self.resource_blocker.metrics is None:
+            self.resource_blocker.metrics = self.metrics
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(metrics=self.metrics)
+
+        self.context = None
+        self.login_generation = 0
+        self._playwright = None
+        self._browser = None
+        self._start_lock = asyncio.Lock()
+        self._login_lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self.context is not None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _needs_login(self) -> bool:
+        if self.persistent and os.path.isdir(self.user_data_dir) and os.listdir(self.user_data_dir):
+            return False
+        return not os.path.exists(self.cookies_file)
+
+    async def start(self):
+        """
+        브라우저/컨텍스트 시작 (이미 시작했으면 그대로 반환)
+        """
+        async with self._start_lock:
+            if self.context is not None:
+                return self.context
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            if self._needs_login():
+                print("[!] 쿠키 파일이 없습니다. 먼저 로그인이 필요합니다.")
+                await interactive_login(self._playwright, self.cookies_file,
+                                        self.user_data_dir if self.persistent else None)
+            with self.metrics.span("scrape.browser_launch"):
+                await self._launch()
+            return self.context
+
+    async def _launch(self) -> None:
+        blocker = self.resource_blocker
+        options = dict(
+            user_agent=USER_AGENT,
+            locale="ko-KR",
+            viewport={"width": 1920, "height": 1080},
+            **blocker.context_options
+        )
+        args = list(LAUNCH_ARGS) + blocker.launch_args
+        if self.persistent:
+            self.context = await self._playwright.chromium.launch_persistent_context(
+                self.user_data_dir, headless=True, args=args, **options
+            )
+        else:
+            self._browser = await self._playwright.chromium.launch(headless=True, args=args)
+            self.context = await self._browser.new_context(**options)
+        await blocker.attach(self.context)
+        await self.context.add_init_script(_HIDE_WEBDRIVER_JS)
+
+        # 저장된 쿠키 로드 (persistent 는 프로필이 비어 있을 때만 쿠키 파일로 초기화)
+        if not self.persistent or not await self.context.cookies():
+            await self._load_cookies()
+
+    async def _load_cookies(self) -> None:
+        try:
+            with open(self.cookies_file, 'r') as f:
+                cookies = json.load(f)
+            await self.context.add_cookies(cookies)
+            print(f"[*] 쿠키 로드 완료: {len(cookies)}개")
+        except Exception as e:
+            print(f"[!] 쿠키 로드 실패: {e}")
+
+    async def new_page(self):
+        if self.context is None:
+            await self.start()
+        page = await self.context.new_page()
+        self.rate_limiter.attach(page)
+        return page
+
+    async def relogin(self, generation: int) -> None:
+        """
+        세션 만료 시 다시 로그인
+        generation: 만료를 확인한 시점의 login_generation (그 사이 다른 크롤링이 이미 다시 로그인했으면 건너뜀)
+        """
+        async with self._login_lock:
+            if generation != self.login_generation:
+                return
+            print("[!] 로그인 세션 만료. 다시 로그인합니다...")
+            # persistent 프로필은 사용 중이라 로그인 창에서 열 수 없으므로 두 방식 모두 임시 브라우저로 로그인
+            cookies = await interactive_login(self._playwright, self.cookies_file)
+            await self.context.clear_cookies()
+            await self.context.add_cookies(cookies)
+            self.login_generation += 1
+
+    async def close(self) -> None:
+        if self.context is not None:
+            await self.context.close()
+            self.context = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
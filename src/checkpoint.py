@@ -0,0 +1,186 @@
+# src/checkpoint.py
+# 크롤링 진행 상태 체크포인트 (추가 전용 JSONL) - 중단된 크롤링 재개용
+import json
+import os
+import re
+from datetime import datetime
+from typing import List
+
+
+class CrawlCheckpoint:
+    """
+    (계정, 기간)별 크롤링 상태를 한 줄씩 추가 기록
+    - {"type": "meta"}    : 계정/기간
+    - {"type": "pinned"}  : 고정글 링크
+    - {"type": "seen"}    : 확인한 링크 (기간 밖 게시물 포함)
+    - {"type": "post"}    : 수집한 게시물
+    - {"type": "state"}   : consecutive_old
+    - {"type": "analyzed"}: 분석 결과를 내보낸 게시물 링크 (재개 시 다시 분석하지 않음)
+    - {"type": "done"}    : 정상 종료 (다음 실행은 새로 시작)
+    쓰기 도중 중단되어 마지막 줄이 깨져 있으면 그 줄만 무시
+    """
+
+    def __init__(self, directory: str, username: str, start_date: str, end_date: str, flush_every: int = 20):
+        self.username = username.replace("@", "")
+        self.start_date = start_date
+        self.end_date = end_date
+        self.flush_every = flush_every
+        safe_name = re.sub(r"[^\w.-]", "_", self.username)
+        self.path = os.path.join(directory, f"{safe_name}_{start_date}_to_{end_date}.jsonl")
+
+        self._file = None
+        self._unflushed = 0
+        # False 면 수집 게시물을 파일에만 기록하고 메모리에 보관하지 않음 (release_posts 참고)
+        self.keep_posts = True
+        self._reset()
+
+    def _reset(self) -> None:
+        self.posts: List[dict] = []
+        self.seen_links = set()
+        self.pinned_links = set()
+        self.analyzed_links = set()
+        self.consecutive_old = 0
+        self.done = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    @property
+    def resumable(self) -> bool:
+        return bool(self.posts or self.seen_links) and not self.done
+
+    def load(self) -> bool:
+        """
+        이전 체크포인트 읽기, 재개할 상태가 있으면 True
+        """
+        self._reset()
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self._apply(record)
+        return self.resumable
+
+    def _apply(self, record: dict) -> None:
+        kind = record.get("type")
+        if kind == "meta":
+            if (record.get("username"), record.get("start_date"), record.get("end_date")) != (
+                    self.username, self.start_date, self.end_date):
+                raise ValueError(f"체크포인트 대상이 다릅니다: {self.path}")
+        elif kind == "pinned":
+            self.pinned_links.update(record["links"])
+        elif kind == "seen":
+            self.seen_links.update(record["links"])
+        elif kind == "post":
+            self.posts.append(record["post"])
+            self.seen_links.add(record["post"].get("link", ""))
+        elif kind == "state":
+            self.consecutive_old = record.get("consecutive_old", 0)
+        elif kind == "analyzed":
+            self.analyzed_links.update(record["links"])
+        elif kind == "done":
+            self.done = True
+
+    def start(self) -> None:
+        """
+        기록 시작 (재개할 상태가 없으면 파일을 새로 만듦)
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if not self.resumable:
+            self._reset()
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._write({
+                "type": "meta", "username": self.username,
+                "start_date": self.start_date, "end_date": self.end_date,
+                "created_at": datetime.now().isoformat()
+            })
+            self.flush()
+        else:
+            self._open_append()
+
+    def _open_append(self) -> None:
+        # 마지막 줄이 중간에 끊겼으면 다음 기록이 이어 붙지 않도록 줄바꿈 추가
+        truncated = False
+        with open(self.path, "rb") as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                truncated = f.read(1) != b"\n"
+        self._file = open(self.path, "a", encoding="utf-8")
+        if truncated:
+            self._file.write("\n")
+
+    def _write(self, record: dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def add_pinned(self, links) -> None:
+        links = [link for link in links if link not in self.pinned_links]
+        if links:
+            self.pinned_links.update(links)
+            self._write({"type": "pinned", "links": links})
+
+    def add_seen(self, links) -> None:
+        links = [link for link in links if link not in self.seen_links]
+        if links:
+            self.seen_links.update(links)
+            self._write({"type": "seen", "links": links})
+
+    def release_posts(self) -> None:
+        """
+        재개한 게시물을 다른 저장소(post sink)로 옮긴 뒤 메모리에서 비움
+        이후 add_post 는 파일에만 기록 (seen_links 는 재개/중복 확인용으로 유지)
+        """
+        self.keep_posts = False
+        self.posts = []
+
+    def add_post(self, post: dict) -> None:
+        if self.keep_posts:
+            self.posts.append(post)
+        self.seen_links.add(post.get("link", ""))
+        self._write({"type": "post", "post": post})
+
+    def save_state(self, consecutive_old: int) -> None:
+        self.consecutive_old = consecutive_old
+        self._write({"type": "state", "consecutive_old": consecutive_old})
+
+    def mark_analyzed(self, links) -> None:
+        """
+        분석 결과를 CSV 로 내보낸 게시물 링크 기록 (크롤링이 끝난 뒤 호출, 파일을 잠시 다시 엶)
+        정상 종료한 체크포인트는 다음 실행이 새로 시작하므로 기록하지 않음
+        """
+        if self.done or not os.path.exists(self.path):
+            return
+        links = [link for link in links if link and link not in self.analyzed_links]
+        if not links:
+            return
+        reopen = self._file is None
+        if reopen:
+            self._open_append()
+        self.analyzed_links.update(links)
+        self._write({"type": "analyzed", "links": links})
+        if reopen:
+            self.close()
+
+    def finish(self) -> None:
+        self.done = True
+        self._write({"type": "done", "finished_at": datetime.now().isoformat()})
+        self.close()
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unflushed = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
@@ -0,0 +1,148 @@
+# src/compiled_guidelines.py
+# 가이드라인 규칙을 1회 컴파일하여 게시물마다 반복되는 문자열 처리 제거
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from guidelines import (
+    COMMUNITY_GUIDELINES, SEVERITY_SCORES, COMBINATION_BONUS, RECOMMENDATIONS,
+    INDICATOR_WORD_MIN_LENGTH, INDICATOR_MATCH_RATIO, DEFAULT_SEVERITY_SCORE
+)
+from keyword_matcher import KeywordAutomaton
+from results import DUPLICATE_CATEGORY, DUPLICATE_SUBCATEGORY
+
+# 오토마톤 태그 종류
+_KEYWORD = 0
+_INDICATOR_WORD = 1
+
+
+class CompiledSubcategory:
+    """
+    하위 카테고리 하나의 컴파일된 규칙
+    """
+    __slots__ = ("index", "category", "subcategory", "keywords", "indicators",
+                 "indicator_word_counts", "base_score", "policy_ref", "recommendation")
+
+    def __init__(self, index: int, category: str, subcategory: str, subcat_data: dict, base_score: int):
+        self.index = index
+        self.category = category
+        self.subcategory = subcategory
+        self.keywords = tuple(subcat_data.get("keywords", []))
+        self.indicators = tuple(subcat_data.get("indicators", []))
+        # 인디케이터별 비교 대상 단어 수 (매칭 비율의 분모)
+        self.indicator_word_counts = tuple(
+            len(self._indicator_words(indicator)) for indicator in self.indicators
+        )
+        self.base_score = base_score
+        self.policy_ref = f"커뮤니티 규정 > {category.replace('_', ' ')} > {subcategory.replace('_', ' ')}"
+        self.recommendation = RECOMMENDATIONS.get(subcategory)
+
+    @staticmethod
+    def _indicator_words(indicator: str) -> List[str]:
+        return [w for w in indicator.split() if len(w) >= INDICATOR_WORD_MIN_LENGTH]
+
+
+class CompiledGuidelines:
+    """
+    커뮤니티 가이드라인 컴파일 결과
+    - 키워드 + 인디케이터 단어를 하나의 오토마톤으로 묶어 게시물당 1회 순회
+    - 심각도 점수 / 조합 보너스 조회 테이블
+    """
+
+    def __init__(self, guidelines: dict = None, severity_scores: dict = None,
+                 combination_bonus: dict = None, indicator_match_ratio: float = INDICATOR_MATCH_RATIO):
+        guidelines = COMMUNITY_GUIDELINES if guidelines is None else guidelines
+        severity_scores = SEVERITY_SCORES if severity_scores is None else severity_scores
+        combination_bonus = COMBINATION_BONUS if combination_bonus is None else combination_bonus
+
+        self.indicator_match_ratio = indicator_match_ratio
+        self.subcategories: List[CompiledSubcategory] = []
+        self.by_name: Dict[str, CompiledSubcategory] = {}
+
+        automaton = KeywordAutomaton()
+        # 인디케이터 단어(소문자) -> [(하위카테고리 인덱스, 인디케이터 위치, 등장 횟수)]
+        word_refs: Dict[str, List[Tuple[int, int, int]]] = defaultdict(list)
+
+        for category, category_data in guidelines.items():
+            for subcategory, subcat_data in category_data.get("subcategories", {}).items():
+                base_score = severity_scores.get(category, {}).get(subcategory, DEFAULT_SEVERITY_SCORE)
+                entry = CompiledSubcategory(len(self.subcategories), category, subcategory, subcat_data, base_score)
+                self.subcategories.append(entry)
+                self.by_name[subcategory] = entry
+
+                for pos, keyword in enumerate(entry.keywords):
+                    automaton.add(keyword, (_KEYWORD, entry.index, pos))
+
+                for pos, indicator in enumerate(entry.indicators):
+                    word_counts = defaultdict(int)
+                    for word in CompiledSubcategory._indicator_words(indicator):
+                        word_counts[word.lower()] += 1
+                    for word, count in word_counts.items():
+                        if word not in word_refs:
+                            automaton.add(word, (_INDICATOR_WORD, word))
+                        word_refs[word].append((entry.index, pos, count))
+
+        self.automaton = automaton.build()
+        self.word_refs = dict(word_refs)
+
+        # 중복 검사 위반(스팸/반복_게시)을 집계할 때 사용할 규칙 인덱스 (없으면 -1)
+        duplicate_rule = self.by_name.get(DUPLICATE_SUBCATEGORY)
+        self.duplicate_rule_index = (
+            duplicate_rule.index if duplicate_rule and duplicate_rule.category == DUPLICATE_CATEGORY else -1
+        )
+
+        # (하위1, 하위2) 조합 보너스: 정방향 키 우선, 없으면 역방향 키
+        self.combination_lookup = {(b, a): v for (a, b), v in combination_bonus.items()}
+        self.combination_lookup.update(combination_bonus)
+
+    def violation_name(self, index: int) -> str:
+        """
+        규칙 인덱스 -> "카테고리/하위카테고리" (-1 은 중복 검사 위반)
+        """
+        if index < 0:
+            return f"{DUPLICATE_CATEGORY}/{DUPLICATE_SUBCATEGORY}"
+        rule = self.subcategories[index]
+        return f"{rule.category}/{rule.subcategory}"
+
+    def match(self, text: str) -> List[Tuple[CompiledSubcategory, Tuple[int, ...], Tuple[int, ...]]]:
+        """
+        게시물 1회 순회로 위반 하위 카테고리 탐지
+        반환: [(하위 카테고리, 매칭 키워드 위치, 매칭 인디케이터 위치)] (가이드라인 정의 순서)
+        """
+        hits = self.automaton.search(text.lower())
+        if not hits:
+            return []
+
+        keyword_hits = defaultdict(list)
+        indicator_hits = defaultdict(int)
+        for tag in hits:
+            if tag[0] == _KEYWORD:
+                keyword_hits[tag[1]].append(tag[2])
+            else:
+                for ref_index, ref_pos, count in self.word_refs[tag[1]]:
+                    indicator_hits[(ref_index, ref_pos)] += count
+
+        matched_indicators = defaultdict(list)
+        for (ref_index, ref_pos), count in indicator_hits.items():
+            entry = self.subcategories[ref_index]
+            if count / entry.indicator_word_counts[ref_pos] >= self.indicator_match_ratio:
+                matched_indicators[ref_index].append(ref_pos)
+
+        matches = []
+        for index in sorted(keyword_hits.keys() | matched_indicators.keys()):
+            matches.append((
+                self.subcategories[index],
+                tuple(sorted(keyword_hits.get(index, ()))),
+                tuple(sorted(matched_indicators.get(index, ())))
+            ))
+        return matches
+
+    def combination_score(self, subcategories: List[str]) -> int:
+        """
+        탐지된 하위 카테고리 쌍별 조합 보너스 합계
+        """
+        score = 0
+        lookup = self.combination_lookup
+        for i, sub1 in enumerate(subcategories):
+            for sub2 in subcategories[i + 1:]:
+                score += lookup.get((sub1, sub2), 0)
+        return score
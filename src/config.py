@@ -7,5 +7,92 @@ START_DATE = os.getenv("START_DATE", "2025-01-01")
 END_DATE = os.getenv("END_DATE", "2026-12-31")
 SKIP_PINNED = int(os.getenv("SKIP_PINNED", "10"))  # 상위 고정글 제외 개수
 
+# 중복 탐지 (MinHash/LSH) 설정: 밴드↑ 재현율↑ / 행↑ 후보 수↓
+DEDUP_LSH_BANDS = int(os.getenv("DEDUP_LSH_BANDS", "20"))
+DEDUP_LSH_ROWS = int(os.getenv("DEDUP_LSH_ROWS", "3"))
+
+# 분석 병렬 프로세스 수 (1 = 단일 프로세스)
+ANALYZER_WORKERS = int(os.getenv("ANALYZER_WORKERS", "1"))
+
+# 스트리밍 분석 (크롤링 중 수집되는 대로 분석, 중복은 먼저 수집된 게시물과만 비교)
+STREAM_ANALYSIS = os.getenv("STREAM_ANALYSIS", "0") == "1"
+
+# 게시물 추출 방식
+# - incremental: 스크롤마다 아직 읽지 않은 게시물 컨테이너만 page.evaluate 로 추출
+# - html: 스크롤마다 전체 HTML 을 BeautifulSoup 으로 다시 파싱 (기존 방식, 기본값)
+# - network: 피드 JSON 응답에서 게시물 생성 (실제 좋아요/답글/리포스트 수, 응답이 없으면 incremental 로 대체)
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "html")
+
+# 스크롤 대기 방식
+# - SCROLL_ADAPTIVE=1: 컨테이너 증가/피드 요청 완료/스크롤 높이 증가 신호를 기다림 (신호 없을 때만 대기 시간 증가)
+# - SCROLL_ADAPTIVE=0: 스크롤마다 고정 3초 대기 (기존 방식)
+SCROLL_ADAPTIVE = os.getenv("SCROLL_ADAPTIVE", "1") == "1"
+SCROLL_MIN_WAIT_MS = int(os.getenv("SCROLL_MIN_WAIT_MS", "400"))
+SCROLL_MAX_WAIT_MS = int(os.getenv("SCROLL_MAX_WAIT_MS", "3000"))
+SCROLL_BACKOFF = float(os.getenv("SCROLL_BACKOFF", "1.5"))
+SCROLL_POLL_MS = int(os.getenv("SCROLL_POLL_MS", "100"))
+# 신호 없이 이 시간이 지나면 수집 종료
+SCROLL_STUCK_TIMEOUT_MS = int(os.getenv("SCROLL_STUCK_TIMEOUT_MS", "20000"))
+
+# 크롤링 브라우저 경량화 (이미지/영상/폰트/분석 스크립트 요청 차단, 피드 API 는 유지)
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "0") == "1"
+BLOCK_RESOURCE_TYPES = tuple(t.strip() for t in os.getenv("BLOCK_RESOURCE_TYPES", "image,media,font").split(",") if t.strip())
+# 요청별 전송량 집계 (차단 전후 비교용, 요청마다 크기를 조회하므로 필요할 때만 사용)
+MEASURE_TRANSFER = os.getenv("MEASURE_TRANSFER", "0") == "1"
+
+# 크롤링 브라우저 프로필 재사용 (launch_persistent_context, 로그인 상태를 프로필 디렉터리에 유지)
+# 0 이면 실행마다 새 브라우저에 threads_cookies.json 을 로드 (기존 방식)
+PERSISTENT_BROWSER = os.getenv("PERSISTENT_BROWSER", "0") == "1"
+BROWSER_USER_DATA_DIR = os.getenv("BROWSER_USER_DATA_DIR", "browser_profile")
+
+# 상세 페이지 방문으로 좋아요/답글/리포스트 수 수집 (피드 화면에서는 0 으로 수집됨)
+FETCH_ENGAGEMENT = os.getenv("FETCH_ENGAGEMENT", "0") == "1"
+ENGAGEMENT_CONCURRENCY = int(os.getenv("ENGAGEMENT_CONCURRENCY", "4"))  # 동시에 여는 페이지 수
+# 게시물마다 답글 스레드를 펼쳐 작성자 본인 답글도 분석 (원게시물 링크로 연결, 참여 수도 함께 수집)
+CRAWL_REPLIES = os.getenv("CRAWL_REPLIES", "0") == "1"
+
+# 여러 계정 모드 (설정하면 THREADS_USERNAME 대신 사용)
+# THREADS_ACCOUNTS: "user1, user2:2025-01-01:2025-06-30" (기간 생략 시 START_DATE~END_DATE)
+# ACCOUNTS_FILE: 같은 형식을 한 줄에 하나씩 적은 파일 (# 뒤는 주석)
+THREADS_ACCOUNTS = os.getenv("THREADS_ACCOUNTS", "")
+ACCOUNTS_FILE = os.getenv("ACCOUNTS_FILE", "")
+ACCOUNT_CONCURRENCY = int(os.getenv("ACCOUNT_CONCURRENCY", "3"))  # 동시에 크롤링하는 계정 수
+
+# 크롤러 요청 속도 제한 (프로세스 전체 공유, 호스트별 토큰 버킷)
+# 페이지 이동/스크롤/상세 페이지 요청마다 토큰 1개, 429/로그인 화면 감지 시 속도를 낮추고 대기
+CRAWL_RATE_PER_SECOND = float(os.getenv("CRAWL_RATE_PER_SECOND", "5"))
+CRAWL_BURST = int(os.getenv("CRAWL_BURST", "10"))
+CRAWL_MAX_BACKOFF_SECONDS = float(os.getenv("CRAWL_MAX_BACKOFF_SECONDS", "60"))
+
 # 출력 설정
 OUTPUT_DIR = "output"
+
+# 실행 간 중복 탐지용 계정별 지문 DB
+CROSS_RUN_DEDUP = os.getenv("CROSS_RUN_DEDUP", "1") == "1"
+FINGERPRINT_DB = os.getenv("FINGERPRINT_DB", os.path.join(OUTPUT_DIR, "fingerprints.sqlite"))
+
+# 크롤링 체크포인트 (중단 후 같은 계정/기간으로 다시 실행하면 이어서 수집)
+CRAWL_CHECKPOINT = os.getenv("CRAWL_CHECKPOINT", "1") == "1"
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", os.path.join(OUTPUT_DIR, "checkpoints"))
+
+# 증분 크롤링 (계정별 최신 수집 게시물을 기록해 두고 다음 실행은 그 게시물에 닿으면 종료)
+# 결과 CSV/요약에는 새로 수집한 게시물만 포함 (이전 게시물과의 중복은 CROSS_RUN_DEDUP 으로 탐지)
+INCREMENTAL_CRAWL = os.getenv("INCREMENTAL_CRAWL", "0") == "1"
+HIGH_WATER_MARK_FILE = os.getenv("HIGH_WATER_MARK_FILE", os.path.join(OUTPUT_DIR, "high_water_marks.json"))
+
+# 긴 크롤링 메모리 제한
+# - POST_SINK="": 수집 게시물을 메모리에 보관 (기존 방식)
+# - POST_SINK=jsonl / sqlite: 수집 즉시 POST_SINK_DIR 의 (계정, 기간)별 파일에 기록, 상세 페이지 값도 파일에 반영하고
+#   분석은 파일을 읽으며 스트리밍 (결과는 CSV 에 바로 기록, STREAM_ANALYSIS 무시)
+# - DOM_TRIM_EVERY=N: N 스크롤마다 이미 수집한 게시물 DOM 을 비움 (0 이면 끔, 마지막 DOM_TRIM_KEEP 개는 남김)
+# - POST_LOG_EVERY=N: 수집 로그를 N개마다 1줄만 출력
+POST_SINK = os.getenv("POST_SINK", "")
+POST_SINK_DIR = os.getenv("POST_SINK_DIR", os.path.join(OUTPUT_DIR, "posts"))
+DOM_TRIM_EVERY = int(os.getenv("DOM_TRIM_EVERY", "0"))
+DOM_TRIM_KEEP = int(os.getenv("DOM_TRIM_KEEP", "30"))
+POST_LOG_EVERY = int(os.getenv("POST_LOG_EVERY", "1"))
+
+# 게시물 분석 결과 캐시 (guidelines.py 변경 시 자동 무효화)
+ANALYSIS_CACHE = os.getenv("ANALYSIS_CACHE", "1") == "1"
+ANALYSIS_CACHE_DB = os.getenv("ANALYSIS_CACHE_DB", os.path.join(OUTPUT_DIR, "analysis_cache.sqlite"))
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "200000"))
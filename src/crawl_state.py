@@ -0,0 +1,109 @@
+# src/crawl_state.py
+# 계정별 최신 수집 게시물(high-water mark) 저장 - 증분 크롤링용
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+
+from dateutil import parser as date_parser
+
+
+class HighWaterMarkStore:
+    """
+    계정 -> {"link", "datetime": 가장 최근 수집 게시물, "covered_since": 빠짐없이 수집된 시작일}
+    증분 크롤링은 요청 시작일이 covered_since 이후일 때만 기존 게시물에서 멈출 수 있음
+    (그 이전 기간은 수집된 적이 없으므로 전체 크롤링 필요)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.marks = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.marks = json.load(f)
+
+    @staticmethod
+    def _key(username: str) -> str:
+        return username.replace("@", "")
+
+    def get(self, username: str) -> Optional[dict]:
+        return self.marks.get(self._key(username))
+
+    def stop_point(self, username: str, start_date: str) -> Optional[dict]:
+        """
+        증분 크롤링에서 멈출 기준 (없거나 요청 기간을 다 덮지 못하면 None)
+        반환: {"link", "datetime": datetime}
+        """
+        mark = self.get(username)
+        if not mark or not mark.get("datetime"):
+            return None
+        if start_date < mark.get("covered_since", "9999-12-31"):
+            return None
+        return {"link": mark.get("link", ""), "datetime": _parse(mark["datetime"])}
+
+    def update(self, username: str, posts, start_date: str, end_date: str, complete: bool = True) -> None:
+        """
+        크롤링 결과로 갱신
+        - 수집 기간이 기존 기록과 이어지면 covered_since 는 더 이른 날짜로 유지
+        - 기존 기록보다 새 기간만 따로 수집했으면 이번 기간으로 교체
+        - 기존 기록보다 오래된 기간만 수집했으면 그대로 둠
+        - complete=False (시작일까지 닿기 전에 멈춘 크롤링): 실제로 본 가장 오래된 게시물 다음 날부터만 덮은 것으로 기록
+          (그 날의 더 이른 게시물은 못 봤을 수 있음)
+        """
+        previous = self.get(username)
+        # posts 는 파일 저장소(post sink)일 수 있으므로 한 번만 순회하며 가장 최신/가장 오래된 게시물만 남김
+        newest = oldest = None
+        for post in posts:
+            dt = _parse(post.get("datetime", ""))
+            if dt is None:
+                continue
+            if newest is None or dt > newest[0]:
+                newest = (dt, post)
+            if oldest is None or dt < oldest:
+                oldest = dt
+
+        if not complete:
+            if oldest is None:
+                return
+            start_date = max(start_date, (oldest + timedelta(days=1)).strftime("%Y-%m-%d"))
+            if start_date > end_date:
+                return
+
+        if previous and previous.get("datetime"):
+            previous_newest = previous["datetime"][:10]
+            if start_date <= previous_newest and end_date >= previous["covered_since"]:
+                mark = dict(previous, covered_since=min(previous["covered_since"], start_date))
+                if newest and newest[0] > _parse(previous["datetime"]):
+                    mark.update(link=newest[1].get("link", ""), datetime=newest[1].get("datetime", ""))
+            elif start_date > previous_newest and newest:
+                mark = {"link": newest[1].get("link", ""), "datetime": newest[1].get("datetime", ""),
+                        "covered_since": start_date}
+            else:
+                return
+        elif newest:
+            mark = {"link": newest[1].get("link", ""), "datetime": newest[1].get("datetime", ""),
+                    "covered_since": start_date}
+        else:
+            return
+
+        mark["updated_at"] = datetime.now().isoformat()
+        self.marks[self._key(username)] = mark
+        self.save()
+
+    def save(self) -> None:
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.marks, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _parse(datetime_str: str):
+    if not datetime_str:
+        return None
+    try:
+        return date_parser.parse(datetime_str).replace(tzinfo=None)
+    except (ValueError, OverflowError):
+        return None
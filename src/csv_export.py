@@ -0,0 +1,74 @@
+# src/csv_export.py
+# 분석 결과 CSV 내보내기
+import csv
+import heapq
+from typing import List
+
+import pandas as pd
+
+from summary import SummaryAccumulator
+
+
+def result_rows(results: list) -> List[dict]:
+    """
+    분석 결과(AnalysisResult) -> CSV 행 목록
+    """
+    rows = []
+    for r in results:
+        # 위반/정책/권고 문자열은 내보낼 때만 생성
+        violation_summary = "; ".join(r.violation_names())
+        policy_refs = "; ".join(r.official_policy_refs)
+
+        rows.append({
+            "사용자명": r.username,
+            "날짜시간": r.datetime,
+            "게시물내용": r.text,
+            "링크": r.link,
+            "원게시물": r.parent_link,
+            "좋아요": r.likes,
+            "답글": r.replies,
+            "위험점수": r.risk_score,
+            "위험등급": r.risk_level,
+            "위반항목": violation_summary,
+            "관련정책": policy_refs,
+            "중복여부": "예" if r.is_duplicate else "아니오",
+            "동일게시물수": r.duplicate_group_size or 1,
+            "이전게시물중복": r.history_duplicate_count or 0,
+            "권고사항": " | ".join(r.recommendations)
+        })
+    return rows
+
+
+def save_results_csv(results: list, csv_path: str) -> None:
+    df = pd.DataFrame(result_rows(results))
+    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+
+
+def export_results_stream(results, csv_path: str, top_n: int = 10) -> tuple:
+    """
+    분석 결과를 하나씩 받아 CSV 에 바로 기록하며 요약 누적 (결과 전체를 메모리에 두지 않음)
+    반환: (SummaryAccumulator, 위험 점수 상위 top_n 개 결과 - summary.txt 용)
+    결과가 없으면 CSV 를 만들지 않음
+    """
+    accumulator = SummaryAccumulator()
+    # (위험 점수, -순번, 결과) 최소 힙: 같은 점수면 먼저 나온 결과를 남김
+    top = []
+    f = writer = None
+    try:
+        for i, result in enumerate(results):
+            row = result_rows([result])[0]
+            if writer is None:
+                f = open(csv_path, "w", newline="", encoding="utf-8-sig")
+                writer = csv.DictWriter(f, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+            accumulator.add(result)
+            item = (result["risk_score"], -i, result)
+            if len(top) < top_n:
+                heapq.heappush(top, item)
+            else:
+                heapq.heappushpop(top, item)
+    finally:
+        if f is not None:
+            f.close()
+    return accumulator, [result for _, _, result in sorted(top, reverse=True)]
@@ -0,0 +1,194 @@
+# src/dedup.py
+# 완전 중복 해시 그룹화 + MinHash/LSH 밴딩 기반 유사 게시물 후보 탐색
+import random
+import zlib
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Hashable, Iterable, List, Set, Tuple
+
+from utils import clean_text, normalize_text, text_fingerprint
+
+SHINGLE_SIZE = 3  # 문자 n-gram 크기
+LSH_BANDS = 20  # 밴드 수 (늘리면 재현율↑, 속도↓)
+LSH_ROWS = 3  # 밴드당 행 수 (늘리면 정밀도↑, 재현율↓)
+MINHASH_SEED = 42
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """
+    공백 정리 + 소문자 변환 후 문자 n-gram 집합
+    """
+    text = clean_text(text).lower()
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """
+    문자 n-gram 집합의 MinHash 서명 생성
+    (프로세스/실행 간 동일한 서명을 위해 내장 hash() 대신 crc32 + 고정 시드 사용)
+    """
+
+    def __init__(self, num_perm: int = LSH_BANDS * LSH_ROWS, shingle_size: int = SHINGLE_SIZE,
+                 seed: int = MINHASH_SEED):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles(text, self.shingle_size)]
+        prime = _MERSENNE_PRIME
+        return tuple(
+            min([(a * h + b) % prime for h in hashes]) & _MAX_HASH
+            for a, b in self._perms
+        )
+
+
+class MinHashLSH:
+    """
+    MinHash 서명을 bands x rows 로 나눠 버킷에 넣는 LSH 인덱스
+    같은 버킷을 하나라도 공유하는 항목만 후보로 반환
+    대략적인 후보 임계 유사도(자카드): (1 / bands) ** (1 / rows)
+    """
+
+    def __init__(self, bands: int = LSH_BANDS, rows: int = LSH_ROWS):
+        if bands < 1 or rows < 1:
+            raise ValueError("bands, rows 는 1 이상이어야 합니다")
+        self.bands = bands
+        self.rows = rows
+        self._buckets = [defaultdict(list) for _ in range(bands)]
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, ...]]:
+        rows = self.rows
+        for band in range(self.bands):
+            yield signature[band * rows:(band + 1) * rows]
+
+    def insert(self, key: Hashable, signature: Tuple[int, ...]) -> None:
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket[band_key].append(key)
+
+    def query(self, signature: Tuple[int, ...]) -> Set[Hashable]:
+        candidates = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            keys = bucket.get(band_key)
+            if keys:
+                candidates.update(keys)
+        return candidates
+
+
+def candidate_sets(texts: List[str], bands: int = LSH_BANDS, rows: int = LSH_ROWS,
+                   signatures: List[Tuple[int, ...]] = None) -> List[Set[int]]:
+    """
+    각 텍스트 인덱스별 유사 후보 인덱스 집합 (자기 자신 제외)
+    (signatures: 미리 계산된 MinHash 서명, 없으면 여기서 계산)
+    """
+    lsh = MinHashLSH(bands, rows)
+    if signatures is None:
+        hasher = MinHasher(num_perm=bands * rows)
+        signatures = [hasher.signature(text) for text in texts]
+    for i, signature in enumerate(signatures):
+        lsh.insert(i, signature)
+
+    results = []
+    for i, signature in enumerate(signatures):
+        candidates = lsh.query(signature)
+        candidates.discard(i)
+        results.append(candidates)
+    return results
+
+
+def comparable_text(text: str) -> str:
+    """
+    유사도(SequenceMatcher) 비교용 텍스트 = 완전 중복 판별과 같은 정규화 텍스트 (비면 공백만 정리한 원문)
+    같은 완전 중복 그룹의 게시물은 모두 같은 값이므로 대표 게시물끼리의 유사도가 그룹 구성원 쌍에도 그대로 성립
+    """
+    return normalize_text(text) or clean_text(text)
+
+
+def exact_duplicate_groups(texts: List[str]) -> List[List[int]]:
+    """
+    정규화 텍스트 해시로 완전 중복 그룹화 (O(n), 첫 등장 순서 유지)
+    정규화 후 빈 문자열(이모지만 있는 게시물 등)은 그룹화하지 않음
+    """
+    buckets = {}
+    groups = []
+    for i, text in enumerate(texts):
+        key = text_fingerprint(text)
+        if not key or key not in buckets:
+            group = [i]
+            groups.append(group)
+            if key:
+                buckets[key] = group
+        else:
+            buckets[key].append(i)
+    return groups
+
+
+class IncrementalDuplicateIndex:
+    """
+    게시물을 하나씩 추가하며 이전 게시물과의 중복을 찾는 인덱스 (스트리밍 분석용)
+    - 완전 중복: 정규화 해시 그룹
+    - 유사 중복: 그룹 대표 텍스트만 MinHash/LSH 에 넣고 정규화 텍스트(comparable_text)를 SequenceMatcher 로 검증
+    텍스트는 그룹 대표만 보관하므로 완전 중복이 많을수록 메모리 사용이 적음
+    """
+
+    def __init__(self, bands: int = LSH_BANDS, rows: int = LSH_ROWS, threshold: float = 0.8):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm=bands * rows)
+        self.lsh = MinHashLSH(bands, rows)
+        self._buckets = {}  # 지문 -> 그룹 번호
+        self._groups: List[List[int]] = []  # 그룹 번호 -> 게시물 인덱스 목록
+        self._texts: List[str] = []  # 그룹 번호 -> 대표 비교용 텍스트
+        self._similar: List[List[Tuple[int, float]]] = []  # 그룹 번호 -> [(유사 그룹, 유사도)]
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, text: str, signature: Tuple[int, ...] = None) -> Tuple[List[dict], int]:
+        """
+        게시물 추가 후 (이전 게시물 중 중복 목록, 완전 중복 그룹 크기) 반환
+        """
+        index = self._count
+        self._count += 1
+
+        key = text_fingerprint(text)
+        group_id = self._buckets.get(key) if key else None
+
+        if group_id is None:
+            group_id = len(self._groups)
+            self._groups.append([])
+            compared = comparable_text(text)
+            self._texts.append(compared)
+            self._similar.append([])
+            if key:
+                self._buckets[key] = group_id
+
+            signature = signature if signature is not None else self.hasher.signature(text)
+            for other_id in sorted(self.lsh.query(signature)):
+                matcher = SequenceMatcher(None, compared, self._texts[other_id])
+                if matcher.real_quick_ratio() < self.threshold or matcher.quick_ratio() < self.threshold:
+                    continue
+                similarity = matcher.ratio()
+                if similarity >= self.threshold:
+                    similarity = round(similarity * 100, 1)
+                    self._similar[group_id].append((other_id, similarity))
+                    self._similar[other_id].append((group_id, similarity))
+            self.lsh.insert(group_id, signature)
+
+        group = self._groups[group_id]
+        duplicates = [{"index": other, "similarity": 100.0} for other in group]
+        for other_id, similarity in self._similar[group_id]:
+            duplicates.extend({"index": other, "similarity": similarity} for other in self._groups[other_id])
+        duplicates.sort(key=lambda d: d["index"])
+
+        group.append(index)
+        return duplicates, len(group)
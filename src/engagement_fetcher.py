@@ -0,0 +1,273 @@
+# src/engagement_fetcher.py
+# 게시물 상세 페이지를 여러 페이지로 동시에 열어 좋아요/답글/리포스트 수 + 작성자 본인 답글 수집
+import asyncio
+import re
+from typing import List, Optional
+
+from feed_capture import FeedCapture, extract_posts, json_payloads
+from html_parser import ThreadsHTMLParser
+from metrics import Metrics
+from rate_limiter import RateLimiter, THROTTLE_STATUSES
+
+_POST_CODE_RE = re.compile(r"/post/([^/?#]+)")
+_POST_AUTHOR_RE = re.compile(r"/@([^/?#]+)/post/")
+
+
+def post_code(link: str) -> str:
+    match = _POST_CODE_RE.search(link or "")
+    return match.group(1) if match else ""
+
+
+def post_author(link: str) -> str:
+    match = _POST_AUTHOR_RE.search(link or "")
+    return match.group(1) if match else ""
+
+
+def _page_posts(html: str) -> List[dict]:
+    """
+    상세 페이지의 게시물 전체 (JSON 데이터 우선, 없으면 화면 HTML), 페이지 순서 유지
+    """
+    capture = FeedCapture()
+    capture.feed_html(html)
+    if capture.post_count:
+        return list(capture.posts.values())
+    return ThreadsHTMLParser().parse_multiple_posts(html)
+
+
+def engagement_from_html(html: str, link: str) -> Optional[dict]:
+    """
+    상세 페이지 HTML -> {"likes", "replies", "reposts"} (해당 게시물을 찾지 못하면 None)
+    페이지에 포함된 JSON 데이터를 먼저 보고, 없으면 화면의 숫자(ThreadsHTMLParser)를 읽음
+    """
+    code = post_code(link)
+    if not code:
+        return None
+
+    for post in _page_posts(html):
+        if post_code(post.get("link", "")) == code:
+            return {"likes": post["likes"], "replies": post["replies"], "reposts": post["reposts"]}
+    return None
+
+
+def _thread_groups(html: str) -> List[List[dict]]:
+    """
+    상세 페이지의 스레드 묶음 (JSON 데이터의 thread_items 목록마다 1개, 목록 안 순서 유지)
+    JSON 데이터가 없으면 화면 HTML 의 게시물 전체를 한 묶음으로 봄
+    """
+    groups = []
+    for payload in json_payloads(html):
+        stack = [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                items = node.get("thread_items")
+                if isinstance(items, list):
+                    groups.append(extract_posts(items))
+                    continue
+                stack.extend(reversed(list(node.values())))
+            elif isinstance(node, list):
+                stack.extend(reversed(node))
+    if not groups:
+        groups.append(ThreadsHTMLParser().parse_multiple_posts(html))
+    return groups
+
+
+def thread_replies_from_html(html: str, link: str, author: str) -> List[dict]:
+    """
+    상세 페이지에서 원게시물에 이어지는 작성자 본인 답글만 추출 (parent_link 로 원게시물 연결)
+    원게시물이 있는 스레드 묶음에서 원게시물 바로 뒤부터 작성자 게시물이 이어지는 동안만 수집
+    (다른 사용자 답글 묶음, 작성자의 다른 게시물/관련 게시물 묶음은 제외)
+    """
+    code = post_code(link)
+    for group in _thread_groups(html):
+        codes = [post_code(post.get("link", "")) for post in group]
+        if code not in codes:
+            continue
+        replies = []
+        for post in group[codes.index(code) + 1:]:
+            if (post.get("username") or post_author(post.get("link", ""))).lstrip("@") != author:
+                break
+            replies.append(dict(post, parent_link=link))
+        return replies
+    return []
+
+
+def _apply_updates(posts, updates: List[tuple]) -> None:
+    """
+    모아 둔 (링크, 필드) 갱신을 저장소에 반영
+    posts 가 파일 저장소(post sink)면 읽어 온 dict 는 복사본이므로 순회가 끝난 뒤 저장소에 씀 (list 는 이미 반영됨)
+    """
+    if hasattr(posts, "update"):
+        for link, fields in updates:
+            posts.update(link, fields)
+
+
+class EngagementFetcher:
+    """
+    공유 브라우저 컨텍스트에 concurrency 개의 페이지를 열어 두고 게시물 링크를 나눠 방문
+    - asyncio.Semaphore 로 동시 방문 수 제한, 페이지는 큐로 돌려 씀
+    - 요청마다 rate_limiter 토큰 사용 (기본: browser_pool 의 공유 제한), 429/로그인 화면이면 백오프
+    - expand_threads(): 같은 방문에서 참여 수와 작성자 본인 답글을 함께 수집 (링크별 1회만 방문)
+    - posts 는 list 또는 파일 저장소(post sink): batch_size 개씩 읽어 방문하므로 게시물 전체를 메모리에 두지 않음
+    - 집계: engagement.fetched / engagement.not_found / engagement.errors / engagement.replies,
+      구간 engagement.fetch
+    """
+
+    def __init__(self, browser_pool, concurrency: int = 4, rate_limiter: RateLimiter = None,
+                 timeout_ms: int = 30000, batch_size: int = 200, metrics: Metrics = None):
+        self.browser_pool = browser_pool
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(self.concurrency, batch_size)
+        self.rate_limiter = rate_limiter if rate_limiter is not None else browser_pool.rate_limiter
+        self.timeout_ms = timeout_ms
+        self.metrics = metrics if metrics is not None else Metrics()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._pages = asyncio.Queue()
+        self._opened = []
+        # 답글 스레드를 펼친 게시물 링크
+        self._expanded = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _batches(self, posts, accept):
+        batch = []
+        for post in posts:
+            if accept(post):
+                batch.append(post)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    async def _acquire_page(self):
+        if self._pages.empty() and len(self._opened) < self.concurrency:
+            page = await self.browser_pool.new_page()
+            self._opened.append(page)
+            return page
+        return await self._pages.get()
+
+    async def _load(self, link: str) -> Optional[str]:
+        """
+        상세 페이지 HTML (실패/속도 제한/로그인 화면이면 None)
+        """
+        async with self._semaphore:
+            page = await self._acquire_page()
+            try:
+                await self.rate_limiter.acquire(link)
+                with self.metrics.span("engagement.fetch"):
+                    response = await page.goto(link, wait_until="domcontentloaded", timeout=self.timeout_ms)
+                    html = await page.content()
+                    final_url = page.url
+            except Exception as e:
+                self.metrics.incr("engagement.errors")
+                print(f"[!] 상세 페이지 실패: {link} ({e})")
+                return None
+            finally:
+                self._pages.put_nowait(page)
+
+        if response is not None and response.status in THROTTLE_STATUSES:
+            self.rate_limiter.throttled(link, f"http_{response.status}")
+            self.metrics.incr("engagement.errors")
+            return None
+        if "/login" in final_url:
+            self.rate_limiter.throttled(link, "login_wall")
+            self.metrics.incr("engagement.errors")
+            return None
+        self.rate_limiter.succeeded(link)
+        return html
+
+    async def fetch(self, link: str) -> Optional[dict]:
+        """
+        게시물 1개 상세 페이지 방문 후 참여 수 반환 (실패하면 None)
+        """
+        html = await self._load(link)
+        if html is None:
+            return None
+        stats = engagement_from_html(html, link)
+        self.metrics.incr("engagement.fetched" if stats is not None else "engagement.not_found")
+        return stats
+
+    async def enrich(self, posts, only_missing: bool = True) -> int:
+        """
+        게시물 dict 의 likes/replies/reposts 를 상세 페이지 값으로 채움, 채운 게시물 수 반환
+        only_missing=True 면 세 값이 모두 0 인 게시물만 방문 (network 모드로 이미 받은 게시물 제외)
+        """
+        def accept(post: dict) -> bool:
+            return bool(post.get("link")) and not (
+                only_missing and (post.get("likes") or post.get("replies") or post.get("reposts")))
+
+        async def enrich_one(post: dict):
+            return post, await self.fetch(post["link"])
+
+        visited = 0
+        updates = []
+        for batch in self._batches(posts, accept):
+            if not visited:
+                print(f"[*] 상세 페이지 방문 (동시 {self.concurrency}개)")
+            visited += len(batch)
+            for post, stats in await asyncio.gather(*(enrich_one(post) for post in batch)):
+                if stats is not None:
+                    post.update(stats)
+                    updates.append((post["link"], stats))
+        # 순회가 끝난 뒤 반영 (파일 저장소를 읽는 중에 쓰지 않도록)
+        _apply_updates(posts, updates)
+        if visited:
+            print(f"[*] 참여 수 수집: {len(updates)}/{visited}개")
+        return len(updates)
+
+    async def expand_threads(self, posts) -> List[dict]:
+        """
+        게시물마다 상세 페이지를 열어 작성자 본인 답글을 수집하고 posts 뒤에 추가, 새 답글 목록 반환
+        - 같은 방문에서 원게시물 참여 수도 채움
+        - 이미 펼친 게시물/답글은 다시 방문하지 않고, 이미 있는 링크의 답글은 추가하지 않음
+        """
+        def accept(post: dict) -> bool:
+            return bool(post.get("link")) and not post.get("parent_link") and post["link"] not in self._expanded
+
+        async def expand_one(post: dict):
+            html = await self._load(post["link"])
+            if html is None:
+                return post, None, []
+            stats = engagement_from_html(html, post["link"])
+            self.metrics.incr("engagement.fetched" if stats is not None else "engagement.not_found")
+            author = (post.get("username") or post_author(post["link"])).lstrip("@")
+            return post, stats, thread_replies_from_html(html, post["link"], author)
+
+        known = {post.get("link") for post in posts}
+        visited = 0
+        updates = []
+        new_replies = []
+        for batch in self._batches(posts, accept):
+            if not visited:
+                print(f"[*] 답글 스레드 펼치기 (동시 {self.concurrency}개)")
+            visited += len(batch)
+            self._expanded.update(post["link"] for post in batch)
+            for post, stats, replies in await asyncio.gather(*(expand_one(post) for post in batch)):
+                if stats is not None:
+                    post.update(stats)
+                    updates.append((post["link"], stats))
+                for reply in replies:
+                    if reply["link"] in known:
+                        continue
+                    known.add(reply["link"])
+                    new_replies.append(reply)
+        if not visited:
+            return []
+        # 순회가 끝난 뒤 반영/추가 (파일 저장소를 읽는 중에 쓰지 않도록)
+        _apply_updates(posts, updates)
+        posts.extend(new_replies)
+        self.metrics.incr("engagement.replies", len(new_replies))
+        print(f"[*] 작성자 답글 수집: {len(new_replies)}개")
+        return new_replies
+
+    async def close(self) -> None:
+        for page in self._opened:
+            if not page.is_closed():
+                await page.close()
+        self._opened = []
+        self._pages = asyncio.Queue()
@@ -0,0 +1,179 @@
+# src/feed_capture.py
+# 피드 JSON 응답(GraphQL/XHR) 수집 -> 게시물 dict 생성 (DOM 직렬화/HTML 파싱 없이 실제 좋아요/답글/리포스트 수 포함)
+import json
+import re
+from datetime import datetime, timezone
+from typing import Dict, List
+
+# 피드 데이터를 담을 수 있는 응답 경로
+_FEED_URL_PATTERNS = ("/graphql", "/api/")
+# 응답 앞에 붙는 XSSI 방지 접두사
+_JSON_PREFIXES = ("for (;;);", ")]}'")
+# 피드(게시물 목록) GraphQL 쿼리 이름 (요청 헤더 x-fb-friendly-name 또는 본문 fb_api_req_friendly_name)
+FEED_QUERY_NAMES = ("ProfileThreadsTab", "ProfileRepliesTab", "FeedQuery", "FeedPagination")
+_FRIENDLY_NAME_RE = re.compile(r"fb_api_req_friendly_name=([^&]+)")
+# 최초 페이지(SSR)에 포함된 JSON 데이터 스크립트
+_JSON_SCRIPT_RE = re.compile(r'<script type="application/json"[^>]*>(.*?)</script>', re.DOTALL)
+
+
+def _is_post_node(node: dict) -> bool:
+    return "code" in node and "taken_at" in node and ("caption" in node or "text_post_app_info" in node)
+
+
+def post_from_node(node: dict) -> dict:
+    """
+    피드 응답의 게시물 노드 -> 스크래퍼 게시물 dict (본문이 없으면 None)
+    """
+    caption = node.get("caption") or {}
+    text = (caption.get("text") or "").strip()
+    if not text:
+        return None
+
+    username = (node.get("user") or {}).get("username", "")
+    app_info = node.get("text_post_app_info") or {}
+    taken_at = node.get("taken_at")
+    post_datetime = ""
+    if taken_at:
+        post_datetime = datetime.fromtimestamp(int(taken_at), tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    return {
+        "username": username,
+        "text": text,
+        "datetime": post_datetime,
+        "link": f"https://www.threads.net/@{username}/post/{node['code']}",
+        "likes": node.get("like_count") or 0,
+        "replies": app_info.get("direct_reply_count") or 0,
+        "reposts": app_info.get("repost_count") or 0,
+        "scraped_at": datetime.now().isoformat()
+    }
+
+
+def extract_posts(payload) -> List[dict]:
+    """
+    JSON 데이터 전체를 순회하며 게시물 노드 추출 (응답 구조가 바뀌어도 노드 형태만 같으면 동작)
+    """
+    posts = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if _is_post_node(node):
+                post = post_from_node(node)
+                if post:
+                    posts.append(post)
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return posts
+
+
+def json_payloads(html: str) -> List:
+    """
+    페이지에 포함된 JSON 데이터 스크립트 중 게시물을 담은 것만 디코딩
+    """
+    payloads = []
+    for script in _JSON_SCRIPT_RE.findall(html):
+        if "thread_items" not in script and "taken_at" not in script:
+            continue
+        payload = decode_json(script)
+        if payload is not None:
+            payloads.append(payload)
+    return payloads
+
+
+def decode_json(body: str):
+    body = body.lstrip()
+    for prefix in _JSON_PREFIXES:
+        if body.startswith(prefix):
+            body = body[len(prefix):]
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+
+def is_feed_request(request) -> bool:
+    """
+    피드 게시물 목록 요청인지 (좋아요/로깅 등 다른 GraphQL 요청 제외)
+    """
+    if "/graphql" not in request.url:
+        return False
+    name = request.headers.get("x-fb-friendly-name", "")
+    if not name:
+        try:
+            body = request.post_data or ""
+        except Exception:
+            # 바이너리 본문
+            body = ""
+        match = _FRIENDLY_NAME_RE.search(body)
+        name = match.group(1) if match else ""
+    return any(query in name for query in FEED_QUERY_NAMES)
+
+
+class FeedCapture:
+    """
+    page.on("response") 로 피드 응답을 받아 게시물을 링크 기준으로 모음
+    drain() 은 마지막 호출 이후 새로 수집된 게시물만 반환
+    keep_posts=False 면 중복 확인용 링크만 남기고 drain() 한 게시물은 보관하지 않음 (긴 크롤링용)
+    """
+
+    def __init__(self, metrics=None, keep_posts: bool = True):
+        self.metrics = metrics
+        self.keep_posts = keep_posts
+        self.posts: Dict[str, dict] = {}
+        self._links = set()
+        self._pending: List[dict] = []
+
+    @property
+    def post_count(self) -> int:
+        return len(self._links)
+
+    def attach(self, page) -> None:
+        page.on("response", self._on_response)
+
+    async def _on_response(self, response) -> None:
+        if not any(pattern in response.url for pattern in _FEED_URL_PATTERNS):
+            return
+        if "json" not in response.headers.get("content-type", "") and "/graphql" not in response.url:
+            return
+        try:
+            body = await response.text()
+        except Exception:
+            # 리다이렉트/취소된 응답 등은 본문 없음
+            return
+        if self.metrics is not None:
+            self.metrics.incr("scrape.responses_captured")
+            self.metrics.incr("scrape.response_bytes", len(body))
+        self.feed_json(body)
+
+    def feed_json(self, body: str) -> int:
+        payload = decode_json(body)
+        if payload is None:
+            return 0
+        return self._add(extract_posts(payload))
+
+    def feed_html(self, html: str) -> int:
+        """
+        최초 페이지에 포함된 JSON 데이터에서 게시물 수집 (첫 피드는 XHR 없이 렌더링됨)
+        """
+        return sum(self._add(extract_posts(payload)) for payload in json_payloads(html))
+
+    def _add(self, posts: List[dict]) -> int:
+        added = 0
+        for post in posts:
+            if post["link"] in self._links:
+                continue
+            self._links.add(post["link"])
+            if self.keep_posts:
+                self.posts[post["link"]] = post
+            self._pending.append(post)
+            added += 1
+        if added and self.metrics is not None:
+            self.metrics.incr("scrape.posts_from_network", added)
+        return added
+
+    def drain(self) -> List[dict]:
+        posts, self._pending = self._pending, []
+        return posts
@@ -0,0 +1,200 @@
+# src/fingerprint_store.py
+# 계정별 게시물 지문(정규화 해시 + MinHash 서명) 영구 저장소 - 실행 간 중복 탐지
+import hashlib
+import os
+import sqlite3
+import zlib
+from array import array
+from difflib import SequenceMatcher
+from typing import Dict, List
+
+from dedup import comparable_text, MinHasher, LSH_BANDS, LSH_ROWS
+from utils import text_fingerprint
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL,
+    post_key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    link TEXT,
+    datetime TEXT,
+    text BLOB NOT NULL,
+    signature BLOB NOT NULL,
+    UNIQUE (username, post_key)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_fingerprint ON posts (username, fingerprint);
+CREATE TABLE IF NOT EXISTS bands (
+    username TEXT NOT NULL,
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    post_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bands_bucket ON bands (username, band, bucket);
+"""
+
+
+class FingerprintIndex:
+    """
+    이전 실행에서 분석한 게시물과의 유사도 검사용 SQLite 인덱스
+    - 완전 중복: 정규화 해시 인덱스 조회
+    - 유사 중복: MinHash LSH 밴드 버킷 인덱스 조회 후 SequenceMatcher 검증
+    조회 비용은 새 게시물 수에만 비례 (누적 이력 전체를 비교하지 않음)
+    """
+
+    def __init__(self, db_path: str, username: str, bands: int = LSH_BANDS, rows: int = LSH_ROWS):
+        self.db_path = db_path
+        self.username = username.replace("@", "")
+
+        dirname = os.path.dirname(db_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        # 스트리밍 분석 시 분석 스레드에서 사용 (동시 사용은 하지 않음)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+
+        # 저장된 서명과 호환되도록 최초 생성 시의 LSH 설정 유지
+        stored = dict(self.conn.execute("SELECT key, value FROM meta").fetchall())
+        if stored:
+            if (int(stored["bands"]), int(stored["rows"])) != (bands, rows):
+                print(f"[!] 지문 DB 설정 사용 (bands={stored['bands']}, rows={stored['rows']})")
+            bands, rows = int(stored["bands"]), int(stored["rows"])
+        else:
+            self.conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("bands", str(bands)), ("rows", str(rows))]
+            )
+            self.conn.commit()
+
+        self.bands = bands
+        self.rows = rows
+        self.hasher = MinHasher(num_perm=bands * rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @classmethod
+    def post_key(cls, post: dict) -> str:
+        return cls._post_key(post, text_fingerprint(post.get("text", "")))
+
+    @staticmethod
+    def _post_key(post: dict, fingerprint: str) -> str:
+        """
+        게시물 고유 키 (링크 우선, 없으면 지문 + 날짜)
+        """
+        if post.get("link"):
+            return post["link"]
+        return f"fp:{fingerprint}|{post.get('datetime', '')}"
+
+    def _band_buckets(self, signature) -> List[int]:
+        rows = self.rows
+        buckets = []
+        for band in range(self.bands):
+            band_bytes = array("I", signature[band * rows:(band + 1) * rows]).tobytes()
+            buckets.append(int.from_bytes(hashlib.blake2b(band_bytes, digest_size=8).digest(), "big", signed=True))
+        return buckets
+
+    def count(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM posts WHERE username = ?", (self.username,)
+        ).fetchone()[0]
+
+    def _signatures(self, posts: List[dict], signatures: list = None) -> list:
+        """
+        MinHash 서명 (미리 계산된 서명이 있고 LSH 설정이 같으면 재사용)
+        """
+        if signatures is not None and all(len(sig) == self.bands * self.rows for sig in signatures):
+            return signatures
+        return [self.hasher.signature(post.get("text", "")) for post in posts]
+
+    def find_matches(self, posts: List[dict], threshold: float = 0.8, signatures: list = None,
+                     exclude_keys: set = None) -> List[List[Dict]]:
+        """
+        게시물별로 이전에 저장된 유사 게시물 목록 반환
+        (이번 배치/exclude_keys 에 포함된 게시물은 실행 내 중복 검사에 맡기고 제외)
+        유사도는 실행 내 중복 검사와 같이 정규화 텍스트(comparable_text) 기준
+        """
+        signatures = self._signatures(posts, signatures)
+        fingerprints = [text_fingerprint(post.get("text", "")) for post in posts]
+        batch_keys = {self._post_key(post, fp) for post, fp in zip(posts, fingerprints)}
+        if exclude_keys:
+            batch_keys |= exclude_keys
+
+        results = []
+        for post, fingerprint, signature in zip(posts, fingerprints, signatures):
+            text = comparable_text(post.get("text", ""))
+
+            matches = {}
+            if fingerprint:
+                for row_id, row_key, link, dt in self.conn.execute(
+                    "SELECT id, post_key, link, datetime FROM posts WHERE username = ? AND fingerprint = ?",
+                    (self.username, fingerprint)
+                ):
+                    if row_key not in batch_keys:
+                        matches[row_id] = {"link": link, "datetime": dt, "similarity": 100.0}
+
+            candidate_ids = set()
+            for band, bucket in enumerate(self._band_buckets(signature)):
+                candidate_ids.update(
+                    row[0] for row in self.conn.execute(
+                        "SELECT post_id FROM bands WHERE username = ? AND band = ? AND bucket = ?",
+                        (self.username, band, bucket)
+                    )
+                )
+            candidate_ids.difference_update(matches)
+
+            for row_id in sorted(candidate_ids):
+                row = self.conn.execute(
+                    "SELECT post_key, link, datetime, text FROM posts WHERE id = ?", (row_id,)
+                ).fetchone()
+                if row is None or row[0] in batch_keys:
+                    continue
+                matcher = SequenceMatcher(None, text, comparable_text(zlib.decompress(row[3]).decode("utf-8")))
+                if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                    continue
+                similarity = matcher.ratio()
+                if similarity >= threshold:
+                    matches[row_id] = {"link": row[1], "datetime": row[2], "similarity": round(similarity * 100, 1)}
+
+            results.append([matches[row_id] for row_id in sorted(matches)])
+        return results
+
+    def add_posts(self, posts: List[dict], signatures: list = None) -> int:
+        """
+        게시물 지문 저장 (이미 저장된 게시물은 건너뜀), 새로 저장한 개수 반환
+        """
+        signatures = self._signatures(posts, signatures)
+        added = 0
+        with self.conn:
+            for post, signature in zip(posts, signatures):
+                text = post.get("text", "")
+                fingerprint = text_fingerprint(text)
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO posts (username, post_key, fingerprint, link, datetime, text, signature) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.username, self._post_key(post, fingerprint), fingerprint,
+                        post.get("link", ""), post.get("datetime", ""),
+                        zlib.compress(text.encode("utf-8")), array("I", signature).tobytes()
+                    )
+                )
+                if cursor.rowcount == 0:
+                    continue
+                post_id = cursor.lastrowid
+                self.conn.executemany(
+                    "INSERT INTO bands (username, band, bucket, post_id) VALUES (?, ?, ?, ?)",
+                    [(self.username, band, bucket, post_id)
+                     for band, bucket in enumerate(self._band_buckets(signature))]
+                )
+                added += 1
+        return added
@@ -122,3 +122,18 @@ COMBINATION_BONUS = {
     ("가짜_문서_사기", "참여_유도"): 25,
     ("기만적_오해_유발", "반복_게시"): 25
 }
+
+# 위반 유형별 권고사항
+RECOMMENDATIONS = {
+    "직업_사기": "⚠️ [직업 사기 오인] '업종만 괜찮으면', '쉽게', '보장' 제거 → '요건 충족 시 검토 가능'으로 변경",
+    "가짜_문서_사기": "⚠️ [가짜 문서 사기 오인] '인증 가자', '대행' 제거 → '인증 요건 안내', '공식 절차 확인 필요'로 변경",
+    "반복_게시": "⚠️ [스팸 탐지] 동일/유사 문구 반복 게시 금지 → 문장 구조/표현을 다르게 작성",
+    "참여_유도": "⚠️ [참여 유도 스팸] 'DM 주세요', '좋아요 누르면' 등 과도한 CTA 최소화",
+    "기만적_오해_유발": "⚠️ [과장/기만 오인] '100%', '무조건', '보장' 제거 → '가능성', '검토 필요'로 완화",
+    "투자_금전_사기": "⚠️ [투자 사기 오인] 수익 보장, 무위험 투자 표현 절대 금지"
+}
+
+# 인디케이터 매칭 기준
+INDICATOR_WORD_MIN_LENGTH = 3  # 인디케이터 문장에서 비교에 사용할 최소 단어 길이
+INDICATOR_MATCH_RATIO = 0.3  # 인디케이터 단어 중 본문에 포함되어야 하는 비율
+DEFAULT_SEVERITY_SCORE = 50  # SEVERITY_SCORES 에 없는 하위 카테고리 기본 점수
@@ -0,0 +1,94 @@
+# src/keyword_matcher.py
+# Aho-Corasick 기반 다중 키워드 매칭 엔진
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    """
+    여러 키워드를 한 번에 컴파일하여 텍스트를 한 번만 순회하며 모두 찾는 오토마톤
+    (keyword in text 를 키워드 수만큼 반복하던 방식 대체)
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]] = ()):
+        # 상태별 전이 / 실패 링크 / 출력(태그 목록)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Hashable]] = [[]]
+        self._alphabet: Set[str] = set()
+        self._built = False
+
+        for pattern, tag in patterns:
+            self.add(pattern, tag)
+
+    def add(self, pattern: str, tag: Hashable) -> None:
+        """
+        패턴 추가 (소문자로 정규화, build 이전에만 가능)
+        """
+        if self._built:
+            raise RuntimeError("이미 컴파일된 오토마톤에는 패턴을 추가할 수 없습니다")
+        pattern = pattern.lower()
+        if not pattern:
+            return
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+            self._alphabet.add(char)
+        self._output[state].append(tag)
+
+    def build(self) -> "KeywordAutomaton":
+        """
+        실패 링크 계산 (BFS)
+        """
+        queue = deque()
+        for next_state in self._goto[0].values():
+            self._fail[next_state] = 0
+            queue.append(next_state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # 실패 링크의 출력까지 미리 합쳐 검색 시 체인 순회 제거
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        self._built = True
+        return self
+
+    def search(self, text: str) -> Set[Hashable]:
+        """
+        텍스트를 한 번 순회하여 매칭된 모든 태그 반환
+        (text 는 호출 측에서 소문자로 변환해 전달)
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+
+        hits = set()
+        state = 0
+        for char in text:
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+        return hits
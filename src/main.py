@@ -1,136 +1,368 @@
 # src/main.py
 import asyncio
-import pandas as pd
 from datetime import datetime
 import os
+import queue
 import sys
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from config import THREADS_USERNAME, START_DATE, END_DATE, SKIP_PINNED, OUTPUT_DIR
+from config import (
+    THREADS_USERNAME, START_DATE, END_DATE, SKIP_PINNED, OUTPUT_DIR,
+    DEDUP_LSH_BANDS, DEDUP_LSH_ROWS, CROSS_RUN_DEDUP, FINGERPRINT_DB, ANALYZER_WORKERS,
+    STREAM_ANALYSIS, ANALYSIS_CACHE, ANALYSIS_CACHE_DB, ANALYSIS_CACHE_MAX_ENTRIES, EXTRACTION_MODE,
+    SCROLL_ADAPTIVE, SCROLL_MIN_WAIT_MS, SCROLL_MAX_WAIT_MS, SCROLL_BACKOFF, SCROLL_POLL_MS,
+    SCROLL_STUCK_TIMEOUT_MS, BLOCK_RESOURCES, BLOCK_RESOURCE_TYPES, MEASURE_TRANSFER, CRAWL_CHECKPOINT, CHECKPOINT_DIR,
+    INCREMENTAL_CRAWL, HIGH_WATER_MARK_FILE, PERSISTENT_BROWSER, BROWSER_USER_DATA_DIR,
+    FETCH_ENGAGEMENT, ENGAGEMENT_CONCURRENCY, CRAWL_REPLIES, CRAWL_RATE_PER_SECOND, CRAWL_BURST, CRAWL_MAX_BACKOFF_SECONDS,
+    THREADS_ACCOUNTS, ACCOUNTS_FILE, ACCOUNT_CONCURRENCY, POST_SINK, POST_SINK_DIR, DOM_TRIM_EVERY, DOM_TRIM_KEEP,
+    POST_LOG_EVERY
+)
 from scraper import ThreadsScraper
 from analyzer import GuidelineAnalyzer, generate_summary
+from fingerprint_store import FingerprintIndex
+from analysis_cache import AnalysisCache
+from csv_export import save_results_csv, export_results_stream
+from metrics import Metrics
+from scroll_scheduler import ScrollScheduler
+from resource_blocker import ResourceBlocker
+from checkpoint import CrawlCheckpoint
+from crawl_state import HighWaterMarkStore
+from browser_pool import BrowserPool
+from engagement_fetcher import EngagementFetcher
+from rate_limiter import RateLimiter
+from summary_export import print_summary, write_summary_file
+from multi_account import MultiAccountCrawler, load_accounts
+from post_sink import open_post_sink
+
+
+async def scrape_and_analyze(scraper: ThreadsScraper, analyzer: GuidelineAnalyzer) -> tuple:
+    """
+    크롤링 중 수집되는 게시물을 별도 스레드에서 바로 스트리밍 분석
+    """
+    post_queue = queue.Queue()
+    results = []
+    
+    def consume():
+        for result in analyzer.analyze_stream(iter(post_queue.get, None)):
+            results.append(result)
+            if result["risk_score"] >= 60:
+                print(f"[!] {result['risk_level']} ({result['risk_score']}): {result['text'][:35]}...")
+    
+    worker = threading.Thread(target=consume, daemon=True)
+    worker.start()
+    try:
+        posts = await scraper.scrape_posts(on_post=post_queue.put)
+    finally:
+        post_queue.put(None)
+        await asyncio.to_thread(worker.join)
+    
+    return posts, results
+
+
+def save_metrics(metrics: Metrics) -> str:
+    """
+    단계별 계측 결과 + 처리량 지표를 summary.txt 옆 metrics.json 으로 저장
+    """
+    analysis_seconds = sum(
+        metrics.total(name) for name in ("analysis.rules", "analysis.duplicates", "analysis.history")
+    )
+    scrolls = metrics.counters.get("scrape.scrolls", 0)
+    metrics.set("scrape.posts_per_second", metrics.rate("scrape.posts_collected", "scrape"))
+    metrics.set(
+        "analysis.posts_per_second",
+        round(metrics.counters.get("analysis.posts", 0) / analysis_seconds, 2) if analysis_seconds > 0 else None
+    )
+    metrics.set(
+        "scrape.parse_seconds_per_scroll",
+        round(metrics.total("scrape.parse") / scrolls, 4) if scrolls else None
+    )
+    
+    metrics_path = os.path.join(OUTPUT_DIR, "metrics.json")
+    metrics.write(metrics_path)
+    return metrics_path
+
+
+def build_browser_pool(metrics: Metrics) -> BrowserPool:
+    """
+    크롤링 브라우저 (같은 프로세스의 크롤링이 공유)
+    """
+    return BrowserPool(
+        persistent=PERSISTENT_BROWSER,
+        user_data_dir=BROWSER_USER_DATA_DIR,
+        resource_blocker=ResourceBlocker(
+            enabled=BLOCK_RESOURCES,
+            blocked_types=BLOCK_RESOURCE_TYPES,
+            measure_transfer=MEASURE_TRANSFER,
+            metrics=metrics
+        ),
+        rate_limiter=RateLimiter(
+            rate_per_second=CRAWL_RATE_PER_SECOND,
+            burst=CRAWL_BURST,
+            max_backoff_s=CRAWL_MAX_BACKOFF_SECONDS,
+            metrics=metrics
+        ),
+        metrics=metrics
+    )
+
+
+def build_scraper(username: str, start_date: str, end_date: str, browser_pool: BrowserPool,
+                  high_water_marks: HighWaterMarkStore, metrics: Metrics) -> ThreadsScraper:
+    return ThreadsScraper(
+        username=username,
+        start_date=start_date,
+        end_date=end_date,
+        skip_pinned=SKIP_PINNED,
+        metrics=metrics,
+        extraction_mode=EXTRACTION_MODE,
+        scroll_scheduler=ScrollScheduler(
+            adaptive=SCROLL_ADAPTIVE,
+            min_wait_ms=SCROLL_MIN_WAIT_MS,
+            max_wait_ms=SCROLL_MAX_WAIT_MS,
+            backoff=SCROLL_BACKOFF,
+            poll_ms=SCROLL_POLL_MS,
+            stuck_timeout_ms=SCROLL_STUCK_TIMEOUT_MS,
+            metrics=metrics
+        ),
+        browser_pool=browser_pool,
+        checkpoint=CrawlCheckpoint(CHECKPOINT_DIR, username, start_date, end_date)
+        if CRAWL_CHECKPOINT else None,
+        high_water_marks=high_water_marks,
+        incremental=INCREMENTAL_CRAWL,
+        post_sink=open_post_sink(POST_SINK, POST_SINK_DIR, username, start_date, end_date)
+        if POST_SINK else None,
+        log_every=POST_LOG_EVERY,
+        trim_dom_every=DOM_TRIM_EVERY,
+        trim_dom_keep=DOM_TRIM_KEEP
+    )
+
+
+async def visit_post_pages(posts, browser_pool: BrowserPool, metrics: Metrics) -> list:
+    """
+    상세 페이지 방문: 참여 수 채우기 + (CRAWL_REPLIES) 작성자 답글을 posts 뒤에 추가, 추가된 답글 반환
+    """
+    async with EngagementFetcher(
+        browser_pool,
+        concurrency=ENGAGEMENT_CONCURRENCY,
+        metrics=metrics
+    ) as fetcher:
+        with metrics.span("engagement"):
+            if CRAWL_REPLIES:
+                return await fetcher.expand_threads(posts)
+            await fetcher.enrich(posts)
+    return []
+
+
+async def run_accounts(accounts: list) -> None:
+    """
+    여러 계정 모드: 브라우저 1개를 공유해 ACCOUNT_CONCURRENCY 개까지 동시에 크롤링
+    (계정별 결과는 output/accounts/<계정>/, 합산 요약은 output/summary.txt)
+    """
+    print(f"계정: {len(accounts)}개 (동시 {ACCOUNT_CONCURRENCY}개)")
+    print(f"상위 고정글 제외: {SKIP_PINNED}개")
+    print("=" * 70)
+    if STREAM_ANALYSIS:
+        print("[*] 여러 계정 모드는 계정별 크롤링이 끝난 뒤 분석합니다 (STREAM_ANALYSIS 무시)")
+    
+    metrics = Metrics()
+    cache = None
+    if ANALYSIS_CACHE:
+        cache = AnalysisCache(ANALYSIS_CACHE_DB, max_entries=ANALYSIS_CACHE_MAX_ENTRIES)
+        print(f"[*] 분석 캐시: {len(cache)}개")
+    browser_pool = build_browser_pool(metrics)
+    high_water_marks = HighWaterMarkStore(HIGH_WATER_MARK_FILE)
+    
+    def analyze(username: str, posts):
+        """
+        결과를 하나씩 반환 (게시물 파일(post sink)이면 파일을 읽으며 스트리밍 분석)
+        """
+        fingerprint_index = None
+        if CROSS_RUN_DEDUP:
+            fingerprint_index = FingerprintIndex(FINGERPRINT_DB, username, DEDUP_LSH_BANDS, DEDUP_LSH_ROWS)
+        try:
+            analyzer = GuidelineAnalyzer(
+                lsh_bands=DEDUP_LSH_BANDS, lsh_rows=DEDUP_LSH_ROWS,
+                fingerprint_index=fingerprint_index,
+                workers=ANALYZER_WORKERS,
+                cache=cache,
+                metrics=metrics
+            )
+            print(f"\n[*] @{username}: {len(posts)}개 게시물 분석 중...")
+            if isinstance(posts, list):
+                yield from analyzer.analyze_all_posts(posts)
+            else:
+                yield from analyzer.analyze_stream(posts)
+        finally:
+            if fingerprint_index is not None:
+                fingerprint_index.close()
+    
+    async def enrich(posts: list) -> None:
+        await visit_post_pages(posts, browser_pool, metrics)
+    
+    crawler = MultiAccountCrawler(
+        accounts,
+        scraper_factory=lambda username, start_date, end_date: build_scraper(
+            username, start_date, end_date, browser_pool, high_water_marks, metrics
+        ),
+        analyze=analyze,
+        output_dir=OUTPUT_DIR,
+        concurrency=ACCOUNT_CONCURRENCY,
+        enrich=enrich if FETCH_ENGAGEMENT or CRAWL_REPLIES else None,
+        metrics=metrics
+    )
+    try:
+        with metrics.span("scrape"):
+            summary = await crawler.run()
+    finally:
+        await browser_pool.close()
+        if cache is not None:
+            print(f"[*] 분석 캐시 적중: {cache.hits}개 / 미적중: {cache.misses}개")
+            metrics.set("cache.hits", cache.hits)
+            metrics.set("cache.misses", cache.misses)
+            cache.close()
+    
+    print_summary(summary)
+    print(f"\n✅ 요약 저장: {os.path.join(OUTPUT_DIR, 'summary.txt')}")
+    metrics_path = save_metrics(metrics)
+    print(f"✅ 계측 저장: {metrics_path}")
+    print("\n분석 완료!")
 
 
 async def main():
     print("=" * 70)
     print("Threads 게시물 가이드라인 분석기 (Meta 공식 커뮤니티 규정 기반)")
     print("=" * 70)
+    accounts = load_accounts(THREADS_ACCOUNTS, ACCOUNTS_FILE, START_DATE, END_DATE)
+    if accounts:
+        await run_accounts(accounts)
+        return
     print(f"사용자: @{THREADS_USERNAME}")
     print(f"기간: {START_DATE} ~ {END_DATE}")
     print(f"상위 고정글 제외: {SKIP_PINNED}개")
     print("=" * 70)
     
-    # 1. 크롤링 (고정글 제외)
-    scraper = ThreadsScraper(
-        username=THREADS_USERNAME,
-        start_date=START_DATE,
-        end_date=END_DATE,
-        skip_pinned=SKIP_PINNED
+    metrics = Metrics()
+    fingerprint_index = None
+    if CROSS_RUN_DEDUP:
+        fingerprint_index = FingerprintIndex(FINGERPRINT_DB, THREADS_USERNAME, DEDUP_LSH_BANDS, DEDUP_LSH_ROWS)
+        print(f"[*] 이전 분석 게시물 지문: {fingerprint_index.count()}개")
+    
+    cache = None
+    if ANALYSIS_CACHE:
+        cache = AnalysisCache(ANALYSIS_CACHE_DB, max_entries=ANALYSIS_CACHE_MAX_ENTRIES)
+        print(f"[*] 분석 캐시: {len(cache)}개")
+    
+    analyzer = GuidelineAnalyzer(
+        lsh_bands=DEDUP_LSH_BANDS, lsh_rows=DEDUP_LSH_ROWS,
+        fingerprint_index=fingerprint_index,
+        workers=ANALYZER_WORKERS,
+        cache=cache,
+        metrics=metrics
     )
-    posts = await scraper.scrape_posts()
     
-    if not posts:
-        print("[!] 수집된 게시물이 없습니다.")
-        os.makedirs(OUTPUT_DIR, exist_ok=True)
-        with open(os.path.join(OUTPUT_DIR, "summary.txt"), "w", encoding="utf-8") as f:
-            f.write("수집된 게시물이 없습니다.\n")
-        return
+    browser_pool = build_browser_pool(metrics)
+    scraper = None
     
-    # 2. 분석
-    print(f"\n[*] {len(posts)}개 게시물을 Meta 커뮤니티 규정 기준으로 분석 중...")
-    analyzer = GuidelineAnalyzer()
-    results = analyzer.analyze_all_posts(posts)
+    try:
+        # 1. 크롤링 (고정글 제외)
+        scraper = build_scraper(
+            THREADS_USERNAME, START_DATE, END_DATE, browser_pool,
+            HighWaterMarkStore(HIGH_WATER_MARK_FILE), metrics
+        )
+        
+        post_sink = scraper.post_sink
+        results = None
+        with metrics.span("scrape"):
+            if STREAM_ANALYSIS and post_sink is None:
+                print("[*] 스트리밍 분석 모드: 수집과 동시에 분석합니다")
+                posts, results = await scrape_and_analyze(scraper, analyzer)
+            else:
+                if STREAM_ANALYSIS:
+                    print("[*] 게시물 파일 모드는 크롤링이 끝난 뒤 파일을 읽으며 분석합니다 (STREAM_ANALYSIS 무시)")
+                posts = await scraper.scrape_posts()
+        if post_sink is not None:
+            print(f"[*] 수집 게시물 파일: {post_sink.path}")
+        
+        if posts and (FETCH_ENGAGEMENT or CRAWL_REPLIES):
+            replies = await visit_post_pages(posts, browser_pool, metrics)
+            if results is not None:
+                # 스트리밍 분석 결과는 수집 시점의 값(0)을 갖고 있으므로 다시 반영
+                by_link = {post.get("link"): post for post in posts}
+                for result in results:
+                    if result.link in by_link:
+                        result.set_engagement(by_link[result.link])
+                if replies:
+                    # 답글은 크롤링이 끝난 뒤 수집되므로 따로 분석 (중복은 답글끼리 + 지문 DB 의 게시물과 비교)
+                    results.extend(analyzer.analyze_all_posts(replies))
+        # 분석 중에는 브라우저가 필요 없으므로 바로 종료
+        await browser_pool.close()
+        
+        # 스트리밍 분석은 크롤링이 중간에 실패해 posts 가 비어도 이미 분석한 결과가 있으면 내보냄
+        if not posts and not results:
+            print("[!] 수집된 게시물이 없습니다.")
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            with open(os.path.join(OUTPUT_DIR, "summary.txt"), "w", encoding="utf-8") as f:
+                f.write("수집된 게시물이 없습니다.\n")
+            save_metrics(metrics)
+            return
+        
+        # 2. 분석
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"threads_{THREADS_USERNAME}_{START_DATE}_to_{END_DATE}_{timestamp}"
+        csv_path = os.path.join(OUTPUT_DIR, f"{filename}.csv")
+        accumulator = None
+        if post_sink is not None:
+            # 파일을 읽으며 분석하고 결과는 CSV 에 바로 기록 (요약과 위험 상위 게시물만 메모리에 유지)
+            print(f"\n[*] {len(posts)}개 게시물을 Meta 커뮤니티 규정 기준으로 분석 중 (파일 스트리밍)...")
+            accumulator, results = export_results_stream(analyzer.analyze_stream(posts), csv_path)
+            if scraper.checkpoint is not None:
+                # 게시물 파일은 아래 finally 에서 닫히므로 CSV 를 기록한 직후 분석 완료 표시
+                scraper.checkpoint.mark_analyzed(post.get("link") for post in posts)
+        elif results is None:
+            print(f"\n[*] {len(posts)}개 게시물을 Meta 커뮤니티 규정 기준으로 분석 중...")
+            results = analyzer.analyze_all_posts(posts)
+    finally:
+        await browser_pool.close()
+        if scraper is not None and scraper.post_sink is not None:
+            scraper.post_sink.close()
+        if fingerprint_index is not None:
+            fingerprint_index.close()
+        if cache is not None:
+            print(f"[*] 분석 캐시 적중: {cache.hits}개 / 미적중: {cache.misses}개")
+            metrics.set("cache.hits", cache.hits)
+            metrics.set("cache.misses", cache.misses)
+            cache.close()
     
     # 3. 결과 요약
-    summary = generate_summary(results)
+    with metrics.span("export.summary"):
+        summary = accumulator.to_dict() if accumulator is not None else generate_summary(results)
     
-    print("\n" + "=" * 70)
-    print("분석 결과 요약")
-    print("=" * 70)
-    print(f"총 게시물: {summary['total_posts']}개")
-    print(f"🔴 매우 높음 (삭제 가능성): {summary['critical_count']}개")
-    print(f"🟠 높음 (경고/제한 가능성): {summary['high_risk_count']}개")
-    print(f"🟡 중간 (주의 필요): {summary['medium_risk_count']}개")
-    print(f"🟢 낮음: {summary['low_risk_count']}개")
-    print(f"✅ 안전: {summary['safe_count']}개")
-    print(f"반복/중복: {summary['duplicate_count']}개")
-    print(f"평균 위험 점수: {summary['average_risk_score']}/100")
-    
-    if summary['top_violations']:
-        print("\n[주요 위반 유형]")
-        for violation, count in summary['top_violations']:
-            print(f"  • {violation}: {count}건")
-    
-    # 4. CSV 저장
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    df_data = []
-    for r in results:
-        violation_summary = "; ".join([
-            f"{v['category']}/{v['subcategory']}" 
-            for v in r.get("violations", [])
-        ])
-        policy_refs = "; ".join(r.get("official_policy_refs", []))
-        
-        df_data.append({
-            "사용자명": r["username"],
-            "날짜시간": r["datetime"],
-            "게시물내용": r["text"],
-            "링크": r["link"],
-            "좋아요": r["likes"],
-            "답글": r["replies"],
-            "위험점수": r["risk_score"],
-            "위험등급": r["risk_level"],
-            "위반항목": violation_summary,
-            "관련정책": policy_refs,
-            "중복여부": "예" if r.get("is_duplicate", False) else "아니오",
-            "권고사항": " | ".join(r.get("recommendations", []))
-        })
-    
-    df = pd.DataFrame(df_data)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"threads_{THREADS_USERNAME}_{START_DATE}_to_{END_DATE}_{timestamp}"
-    
-    csv_path = os.path.join(OUTPUT_DIR, f"{filename}.csv")
-    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-    print(f"\n✅ CSV 저장: {csv_path}")
+    print_summary(summary)
+    
+    # 4. CSV 저장 (게시물 파일 모드는 분석하면서 이미 기록, results 는 위험 상위 게시물만)
+    if accumulator is None:
+        with metrics.span("export.csv"):
+            save_results_csv(results, csv_path)
+        if scraper.checkpoint is not None:
+            # 크롤링이 중간에 끊겼으면 다음 실행(재개)이 이미 내보낸 게시물을 다시 분석하지 않도록 기록
+            scraper.checkpoint.mark_analyzed(post.get("link") for post in posts)
+    # 게시물 파일 모드는 분석 결과가 없으면 CSV 를 만들지 않음
+    if accumulator is None or accumulator.total:
+        print(f"\n✅ CSV 저장: {csv_path}")
+    else:
+        print("\n[!] 분석 결과가 없어 CSV 를 만들지 않았습니다")
     
     # 5. 요약 파일 저장
-    summary_path = os.path.join(OUTPUT_DIR, "summary.txt")
-    with open(summary_path, "w", encoding="utf-8") as f:
-        f.write(f"# Threads 게시물 가이드라인 분석 결과\n\n")
-        f.write(f"### 요약\n")
-        f.write(f"- 총 게시물: **{summary['total_posts']}개**\n")
-        f.write(f"- 🔴 매우 높음: **{summary['critical_count']}개**\n")
-        f.write(f"- 🟠 높음: **{summary['high_risk_count']}개**\n")
-        f.write(f"- 🟡 중간: **{summary['medium_risk_count']}개**\n")
-        f.write(f"- 🟢 낮음: **{summary['low_risk_count']}개**\n")
-        f.write(f"- ✅ 안전: **{summary['safe_count']}개**\n")
-        f.write(f"- 반복/중복: **{summary['duplicate_count']}개**\n")
-        f.write(f"- 평균 위험 점수: **{summary['average_risk_score']}/100**\n\n")
-        
-        if summary['top_violations']:
-            f.write(f"### 주요 위반 유형\n")
-            for violation, count in summary['top_violations']:
-                f.write(f"- {violation}: {count}건\n")
-            f.write("\n")
-        
-        critical_posts = sorted(results, key=lambda x: x["risk_score"], reverse=True)[:10]
-        if critical_posts and critical_posts[0]["risk_score"] > 0:
-            f.write(f"### ⚠️ 주의 필요 게시물 (상위 10개)\n\n")
-            for i, post in enumerate(critical_posts, 1):
-                if post["risk_score"] > 0:
-                    text_preview = post["text"][:80].replace("\n", " ") + "..."
-                    f.write(f"**{i}. {post['risk_level']}** (점수: {post['risk_score']})\n")
-                    f.write(f"- 내용: {text_preview}\n")
-                    f.write(f"- 날짜: {post['datetime'][:10] if post['datetime'] else 'N/A'}\n")
-                    if post.get("recommendations"):
-                        f.write(f"- 권고: {post['recommendations'][0][:80]}...\n")
-                    f.write("\n")
+    with metrics.span("export.summary_file"):
+        summary_path = os.path.join(OUTPUT_DIR, "summary.txt")
+        write_summary_file(summary, results, summary_path)
     
     print(f"✅ 요약 저장: {summary_path}")
+    
+    metrics_path = save_metrics(metrics)
+    print(f"✅ 계측 저장: {metrics_path}")
     print("\n분석 완료!")
 
 
@@ -0,0 +1,96 @@
+# src/metrics.py
+# 단계별 소요 시간(span) + 카운터 계측 (실행 종료 시 metrics.json 저장)
+import json
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class Metrics:
+    """
+    가벼운 계측기
+    - with metrics.span("scrape.parse"): ...  -> 이름별 횟수/합계/최대 시간 누적
+    - metrics.incr("scrape.scrolls")          -> 카운터
+    - metrics.set("cache.hits", 10)           -> 임의 값
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans = defaultdict(lambda: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+        self.counters = defaultdict(int)
+        self.values = {}
+
+    @contextmanager
+    def span(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        span = self.spans[name]
+        span["count"] += 1
+        span["total_seconds"] += seconds
+        span["max_seconds"] = max(span["max_seconds"], seconds)
+
+    def total(self, name: str) -> float:
+        return self.spans[name]["total_seconds"] if name in self.spans else 0.0
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def set(self, name: str, value) -> None:
+        self.values[name] = value
+
+    def rate(self, count_name: str, span_name: str) -> Optional[float]:
+        """
+        카운터 / span 합계 시간 (초당 처리량), 시간이 없으면 None
+        """
+        seconds = self.total(span_name)
+        if seconds <= 0:
+            return None
+        return round(self.counters.get(count_name, 0) / seconds, 2)
+
+    @staticmethod
+    def peak_rss_mb() -> Optional[float]:
+        """
+        현재 프로세스 + 종료된 자식 프로세스(분석 워커) 중 최대 RSS (MB)
+        """
+        if resource is None:
+            return None
+        peak = max(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        )
+        # Linux 는 KB, macOS 는 바이트 단위
+        divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+        return round(peak / divisor, 1)
+
+    def to_dict(self) -> dict:
+        spans = {}
+        for name, span in sorted(self.spans.items()):
+            spans[name] = {
+                "count": span["count"],
+                "total_seconds": round(span["total_seconds"], 4),
+                "mean_seconds": round(span["total_seconds"] / span["count"], 4) if span["count"] else 0.0,
+                "max_seconds": round(span["max_seconds"], 4),
+            }
+        return {
+            "elapsed_seconds": round(time.perf_counter() - self.started, 3),
+            "peak_rss_mb": self.peak_rss_mb(),
+            "spans": spans,
+            "counters": dict(sorted(self.counters.items())),
+            "values": self.values,
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
@@ -0,0 +1,145 @@
+# src/multi_account.py
+# 여러 계정 동시 크롤링/분석 (공유 브라우저의 페이지로 동시 실행 수 제한)
+import asyncio
+import os
+import re
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from csv_export import export_results_stream
+from metrics import Metrics
+from summary import SummaryAccumulator
+from summary_export import write_combined_summary, write_summary_file
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def parse_accounts(spec: str, default_start: str, default_end: str) -> List[Tuple[str, str, str]]:
+    """
+    "user1, user2:2025-01-01:2025-06-30" (쉼표/줄바꿈 구분) -> [(username, start_date, end_date)]
+    기간을 생략하면 기본 기간, 같은 계정/기간은 한 번만
+    """
+    accounts = []
+    for entry in re.split(r"[,\n]", spec or ""):
+        entry = entry.split("#", 1)[0].strip()
+        if not entry:
+            continue
+        parts = [part.strip() for part in entry.split(":")]
+        if len(parts) not in (1, 3):
+            raise ValueError(f"계정 형식이 잘못되었습니다: {entry} (username 또는 username:시작일:종료일)")
+        username = parts[0].lstrip("@")
+        start_date, end_date = (parts[1], parts[2]) if len(parts) == 3 else (default_start, default_end)
+        if not _DATE_RE.match(start_date) or not _DATE_RE.match(end_date):
+            raise ValueError(f"날짜 형식이 잘못되었습니다: {entry} (YYYY-MM-DD)")
+        account = (username, start_date, end_date)
+        if account not in accounts:
+            accounts.append(account)
+    return accounts
+
+
+def load_accounts(spec: str, accounts_file: str, default_start: str, default_end: str) -> List[Tuple[str, str, str]]:
+    """
+    환경변수 목록 + 계정 파일(한 줄에 하나)을 합쳐 읽음
+    """
+    if accounts_file:
+        with open(accounts_file, "r", encoding="utf-8") as f:
+            spec = "\n".join(filter(None, [spec, f.read()]))
+    return parse_accounts(spec, default_start, default_end)
+
+
+class MultiAccountCrawler:
+    """
+    계정 목록을 concurrency 개까지 동시에 크롤링
+    - 크롤링: scraper_factory(username, start_date, end_date) 로 만든 스크래퍼 (같은 BrowserPool 공유)
+      enrich(posts): 크롤링 직후 상세 페이지 방문 (참여 수 채우기, 답글은 posts 에 추가)
+    - 분석: analyze(username, posts) -> results 를 별도 스레드에서 한 번에 하나씩 실행
+      (분석 중에도 다음 계정 크롤링은 계속 진행, 분석 캐시/지문 DB 동시 쓰기 방지)
+      results 는 목록 또는 제너레이터, 결과는 하나씩 CSV 에 바로 기록 (게시물 파일(post sink)과 함께 쓰면 메모리 일정)
+    - 계정이 끝날 때마다 output/accounts/<계정>/ 에 CSV/summary.txt 저장하고 합산 summary.txt 갱신
+    - 한 계정이 실패해도 나머지 계정은 계속 진행
+    """
+
+    def __init__(self, accounts: List[Tuple[str, str, str]], scraper_factory: Callable,
+                 analyze: Callable, output_dir: str, concurrency: int = 3,
+                 enrich: Callable = None, metrics: Metrics = None):
+        self.accounts = accounts
+        self.scraper_factory = scraper_factory
+        self.analyze = analyze
+        self.enrich = enrich
+        self.output_dir = output_dir
+        self.concurrency = max(1, concurrency)
+        self.metrics = metrics if metrics is not None else Metrics()
+
+        self.combined = SummaryAccumulator()
+        self.status = {
+            account: {"username": account[0], "start_date": account[1], "end_date": account[2], "status": "대기"}
+            for account in accounts
+        }
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._analysis_lock = asyncio.Lock()
+
+    async def run(self) -> dict:
+        """
+        모든 계정 처리 후 합산 요약 반환
+        """
+        print(f"[*] 계정 {len(self.accounts)}개 크롤링 (동시 {self.concurrency}개)")
+        await asyncio.gather(*(self._run_account(account) for account in self.accounts))
+        self._write_combined()
+        return self.combined.to_dict()
+
+    async def _run_account(self, account: Tuple[str, str, str]) -> None:
+        username, start_date, end_date = account
+        status = self.status[account]
+        scraper = None
+        try:
+            async with self._semaphore:
+                status["status"] = "크롤링"
+                scraper = self.scraper_factory(username, start_date, end_date)
+                posts = await scraper.scrape_posts()
+                if posts and self.enrich is not None:
+                    await self.enrich(posts)
+
+            status["status"] = "분석"
+            async with self._analysis_lock:
+                accumulator = await asyncio.to_thread(self._analyze_account, account, posts)
+            checkpoint = getattr(scraper, "checkpoint", None)
+            if checkpoint is not None and posts:
+                # 크롤링이 중간에 끊겼으면 다음 실행(재개)이 이미 내보낸 게시물을 다시 분석하지 않도록 기록
+                checkpoint.mark_analyzed(post.get("link") for post in posts)
+            self.combined.merge(accumulator)
+            status["summary"] = accumulator.to_dict()
+            status["status"] = "완료" if posts else "게시물 없음"
+            self.metrics.incr("accounts.completed")
+            print(f"[✓] @{username}: {accumulator.total}개 분석 완료")
+        except Exception as e:
+            status["status"] = f"실패: {e}"
+            self.metrics.incr("accounts.failed")
+            print(f"[에러] @{username}: {e}")
+        finally:
+            post_sink = getattr(scraper, "post_sink", None) if scraper is not None else None
+            if post_sink is not None:
+                post_sink.close()
+        self._write_combined()
+
+    def _account_dir(self, username: str) -> str:
+        return os.path.join(self.output_dir, "accounts", re.sub(r"[^\w.-]", "_", username))
+
+    def _analyze_account(self, account: Tuple[str, str, str], posts) -> SummaryAccumulator:
+        """
+        분석 결과를 하나씩 계정 폴더 CSV 에 기록하고 summary.txt 저장 (결과가 없으면 CSV 없음)
+        """
+        username, start_date, end_date = account
+        account_dir = self._account_dir(username)
+        os.makedirs(account_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        csv_path = os.path.join(account_dir, f"threads_{username}_{start_date}_to_{end_date}_{timestamp}.csv")
+        results = self.analyze(username, posts) if posts else []
+        accumulator, top_results = export_results_stream(results, csv_path)
+        write_summary_file(accumulator.to_dict(), top_results, os.path.join(account_dir, "summary.txt"))
+        return accumulator
+
+    def _write_combined(self) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        write_combined_summary(
+            self.combined.to_dict(), list(self.status.values()), os.path.join(self.output_dir, "summary.txt")
+        )
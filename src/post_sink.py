@@ -0,0 +1,201 @@
+# src/post_sink.py
+# 수집 게시물을 메모리 대신 파일로 바로 기록 (긴 크롤링에서도 메모리 일정)
+import json
+import os
+import re
+import sqlite3
+from typing import Iterator
+
+POST_SINK_KINDS = ("jsonl", "sqlite")
+
+# JSONL 갱신 기록 줄 (게시물 줄과 구분, json.dumps 기본 구분자 기준)
+_UPDATE_PREFIX = '{"_update": '
+
+
+class JsonlPostSink:
+    """
+    추가 전용 JSONL (한 줄에 게시물 1개)
+    list 처럼 append/extend/len/iter 를 지원하므로 스크래퍼의 posts 목록 대신 사용
+    iter 는 파일을 처음부터 다시 읽으므로 메모리에는 게시물 1개씩만 올라옴
+    update(link, fields): 갱신 기록 줄을 덧붙이고 읽을 때 합침 (갱신한 필드만 메모리에 올림)
+    """
+
+    def __init__(self, path: str, flush_every: int = 50):
+        self.path = path
+        self.flush_every = flush_every
+        self._file = None
+        self._count = 0
+        self._has_updates = False
+        self._unflushed = 0
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(_UPDATE_PREFIX):
+                        self._has_updates = True
+                    elif line.strip():
+                        self._count += 1
+
+    def clear(self) -> None:
+        self.close()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        open(self.path, "w", encoding="utf-8").close()
+        self._count = 0
+        self._has_updates = False
+
+    def _write(self, record: dict) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def append(self, post: dict) -> None:
+        self._write(post)
+        self._count += 1
+
+    def update(self, link: str, fields: dict) -> None:
+        self._write({"_update": link, "fields": fields})
+        self._has_updates = True
+
+    def extend(self, posts) -> None:
+        for post in posts:
+            self.append(post)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[dict]:
+        self.flush()
+        if not os.path.exists(self.path):
+            return
+        updates = self._read_updates() if self._has_updates else {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(_UPDATE_PREFIX):
+                    continue
+                try:
+                    post = json.loads(line)
+                except ValueError:
+                    # 중단되어 끊긴 마지막 줄
+                    continue
+                if post.get("link") in updates:
+                    post.update(updates[post["link"]])
+                yield post
+
+    def _read_updates(self) -> dict:
+        updates = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.startswith(_UPDATE_PREFIX):
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                updates.setdefault(record["_update"], {}).update(record["fields"])
+        return updates
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._unflushed = 0
+
+
+class SqlitePostSink:
+    """
+    SQLite 테이블 (수집 순서 + 링크 중복 시 무시)
+    JsonlPostSink 와 같은 인터페이스, 닫은 뒤에도 다시 읽으면 자동으로 연결
+    """
+
+    def __init__(self, path: str, commit_every: int = 200):
+        self.path = path
+        self.commit_every = commit_every
+        self._conn = None
+        self._count = 0
+        self._uncommitted = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS posts (seq INTEGER PRIMARY KEY AUTOINCREMENT, link TEXT UNIQUE, data TEXT)"
+            )
+            self._count = self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        return self._conn
+
+    def clear(self) -> None:
+        conn = self._connect()
+        conn.execute("DELETE FROM posts")
+        conn.commit()
+        self._count = 0
+        self._uncommitted = 0
+
+    def append(self, post: dict) -> None:
+        # 링크가 없는 게시물은 NULL 로 저장 (UNIQUE 제약에서 제외)
+        cursor = self._connect().execute(
+            "INSERT OR IGNORE INTO posts (link, data) VALUES (?, ?)",
+            (post.get("link") or None, json.dumps(post, ensure_ascii=False))
+        )
+        self._count += cursor.rowcount
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.flush()
+
+    def update(self, link: str, fields: dict) -> None:
+        conn = self._connect()
+        row = conn.execute("SELECT data FROM posts WHERE link = ?", (link,)).fetchone()
+        if row is None:
+            return
+        post = json.loads(row[0])
+        post.update(fields)
+        conn.execute("UPDATE posts SET data = ? WHERE link = ?", (json.dumps(post, ensure_ascii=False), link))
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.flush()
+
+    def extend(self, posts) -> None:
+        for post in posts:
+            self.append(post)
+
+    def __len__(self) -> int:
+        self._connect()
+        return self._count
+
+    def __iter__(self) -> Iterator[dict]:
+        self.flush()
+        for (data,) in self._connect().execute("SELECT data FROM posts ORDER BY seq"):
+            yield json.loads(data)
+
+    def flush(self) -> None:
+        if self._conn is not None:
+            self._conn.commit()
+        self._uncommitted = 0
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+        self._uncommitted = 0
+
+
+def open_post_sink(kind: str, directory: str, username: str, start_date: str, end_date: str):
+    """
+    (계정, 기간)별 게시물 파일 열기
+    """
+    if kind not in POST_SINK_KINDS:
+        raise ValueError(f"지원하지 않는 게시물 저장 방식: {kind} (가능: {', '.join(POST_SINK_KINDS)})")
+    safe_name = re.sub(r"[^\w.-]", "_", username.replace("@", ""))
+    path = os.path.join(directory, f"{safe_name}_{start_date}_to_{end_date}.{kind}")
+    if kind == "jsonl":
+        return JsonlPostSink(path)
+    return SqlitePostSink(path)
@@ -0,0 +1,125 @@
+# src/rate_limiter.py
+# 크롤러 요청 속도 제한 (호스트별 토큰 버킷 + 속도 제한 감지 시 적응형 백오프)
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from metrics import Metrics
+
+# 속도 제한 응답
+THROTTLE_STATUSES = (429,)
+
+
+class _HostState:
+    __slots__ = ("tokens", "updated", "factor", "strikes", "cooldown_until", "lock")
+
+    def __init__(self, burst: float):
+        self.tokens = burst
+        self.updated = time.monotonic()
+        # 현재 허용 속도 = rate_per_second * factor
+        self.factor = 1.0
+        self.strikes = 0
+        self.cooldown_until = 0.0
+        self.lock = asyncio.Lock()
+
+
+class RateLimiter:
+    """
+    프로세스 전체에서 공유하는 호스트별 토큰 버킷
+    - acquire(url): 페이지 이동/스크롤/상세 페이지 요청 전에 토큰 1개 사용 (없으면 대기, 호스트별 도착 순서대로)
+    - throttled(url, reason): 429/로그인 화면 감지 시 속도를 절반으로 줄이고
+      base_backoff_s * 2^(연속 감지 - 1) 초 (max_backoff_s 까지) 동안 해당 호스트 요청 중지
+      대기 중에 들어온 감지는 같은 사건으로 보고 무시 (동시에 열린 여러 페이지가 한 번에 보고하는 경우)
+    - succeeded(url): 정상 응답마다 속도를 recover_step 씩 원래 속도까지 회복
+    - rate_per_second <= 0 이면 속도 제한 없이 백오프만 적용
+    - 집계: ratelimit.wait(구간), ratelimit.throttled(+사유별), ratelimit.backoff_seconds
+    """
+
+    def __init__(self, rate_per_second: float = 5.0, burst: int = 10, base_backoff_s: float = 2.0,
+                 max_backoff_s: float = 60.0, min_factor: float = 0.1, recover_step: float = 0.05,
+                 metrics: Metrics = None):
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.min_factor = min_factor
+        self.recover_step = recover_step
+        self.metrics = metrics if metrics is not None else Metrics()
+        self._hosts = {}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlsplit(url).netloc or url
+
+    def _state(self, url: str) -> _HostState:
+        host = self._host(url)
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.burst)
+        return state
+
+    def current_rate(self, url: str) -> float:
+        return self.rate_per_second * self._state(url).factor
+
+    async def acquire(self, url: str) -> float:
+        """
+        토큰 1개를 얻을 때까지 대기, 기다린 시간(초) 반환
+        """
+        state = self._state(url)
+        started = time.monotonic()
+        async with state.lock:
+            while True:
+                now = time.monotonic()
+                if now < state.cooldown_until:
+                    await asyncio.sleep(state.cooldown_until - now)
+                    continue
+                if self.rate_per_second <= 0:
+                    break
+                rate = self.rate_per_second * state.factor
+                state.tokens = min(self.burst, state.tokens + (now - state.updated) * rate)
+                state.updated = now
+                if state.tokens >= 1:
+                    state.tokens -= 1
+                    break
+                await asyncio.sleep((1 - state.tokens) / rate)
+        waited = time.monotonic() - started
+        self.metrics.add_time("ratelimit.wait", waited)
+        return waited
+
+    def throttled(self, url: str, reason: str) -> float:
+        """
+        속도 제한 감지 보고, 적용한 대기 시간(초) 반환 (이미 대기 중이면 0)
+        """
+        state = self._state(url)
+        now = time.monotonic()
+        if now < state.cooldown_until:
+            return 0.0
+        state.strikes += 1
+        state.factor = max(self.min_factor, state.factor / 2)
+        delay = min(self.max_backoff_s, self.base_backoff_s * 2 ** (state.strikes - 1))
+        state.cooldown_until = now + delay
+        state.tokens = 0
+        state.updated = state.cooldown_until
+
+        self.metrics.incr("ratelimit.throttled")
+        self.metrics.incr(f"ratelimit.throttled.{reason}")
+        self.metrics.set(
+            "ratelimit.backoff_seconds", round(self.metrics.values.get("ratelimit.backoff_seconds", 0) + delay, 1)
+        )
+        print(f"[!] {self._host(url)} 속도 제한 감지 ({reason}): {delay:.0f}초 대기, 요청 속도 x{state.factor:.2f}")
+        return delay
+
+    def succeeded(self, url: str) -> None:
+        state = self._state(url)
+        state.strikes = 0
+        state.factor = min(1.0, state.factor + self.recover_step)
+
+    def attach(self, page) -> None:
+        """
+        페이지의 모든 응답에서 429 감지
+        """
+        page.on("response", self._on_response)
+
+    def _on_response(self, response) -> None:
+        if response.status in THROTTLE_STATUSES:
+            self.throttled(response.url, f"http_{response.status}")
@@ -0,0 +1,95 @@
+# src/resource_blocker.py
+# 크롤링 브라우저 경량화: 이미지/영상/폰트/분석 스크립트 요청 차단 + 전송량 집계
+from typing import Iterable
+
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+
+# 분석/추적 요청 (스크립트 포함 차단)
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "connect.facebook.net", "facebook.com/tr", "/logging_client_events", "/ajax/bz", "/falco"
+)
+
+# 피드 데이터 요청은 차단하지 않음 ("/api/graphql" 도 포함, 다른 /api/ 요청은 분석/로깅일 수 있으므로 일반 규칙 적용)
+_ALLOWED_URL_PATTERNS = ("/graphql",)
+
+# 차단 시 추가하는 브라우저 실행 옵션
+LIGHTWEIGHT_LAUNCH_ARGS = (
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--disable-extensions",
+    "--disable-background-networking",
+)
+
+
+class ResourceBlocker:
+    """
+    context.route 로 불필요한 요청을 중단
+    - measure_transfer=True 면 요청마다 전송량 집계 (요청마다 request.sizes() 를 호출하므로 기본은 끔,
+      enabled=False 와 함께 쓰면 차단 없이 전송량만 집계해 차단 전후 비교)
+    - 집계: scrape.blocked_requests(+유형별), scrape.transferred_requests / scrape.transferred_bytes
+    차단된 요청은 내려받지 않아 크기를 알 수 없으므로, 절약량은 차단 전후 transferred_bytes 로 비교
+    """
+
+    def __init__(self, enabled: bool = False, blocked_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 blocked_url_patterns: Iterable[str] = DEFAULT_BLOCKED_URL_PATTERNS,
+                 measure_transfer: bool = False, metrics=None):
+        self.enabled = enabled
+        self.measure_transfer = measure_transfer
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_url_patterns = tuple(blocked_url_patterns)
+        self.metrics = metrics
+        self.blocked_requests = 0
+        self.transferred_requests = 0
+        self.transferred_bytes = 0
+
+    @property
+    def launch_args(self) -> list:
+        return list(LIGHTWEIGHT_LAUNCH_ARGS) if self.enabled else []
+
+    @property
+    def context_options(self) -> dict:
+        # 서비스 워커를 거치는 요청은 route 로 가로챌 수 없음
+        return {"service_workers": "block"} if self.enabled else {}
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if any(pattern in url for pattern in _ALLOWED_URL_PATTERNS):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return any(pattern in url for pattern in self.blocked_url_patterns)
+
+    async def attach(self, context) -> None:
+        if self.enabled:
+            await context.route("**/*", self._route)
+        if self.measure_transfer:
+            context.on("requestfinished", self._on_request_finished)
+
+    async def _route(self, route) -> None:
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self.blocked_requests += 1
+            if self.metrics is not None:
+                self.metrics.incr("scrape.blocked_requests")
+                self.metrics.incr(f"scrape.blocked_requests.{request.resource_type}")
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _on_request_finished(self, request) -> None:
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+        size = sizes.get("responseBodySize", 0) + sizes.get("responseHeadersSize", 0)
+        self.transferred_requests += 1
+        self.transferred_bytes += size
+        if self.metrics is not None:
+            self.metrics.incr("scrape.transferred_requests")
+            self.metrics.incr("scrape.transferred_bytes", size)
+
+    def report(self) -> str:
+        report = f"[*] 요청 차단: {self.blocked_requests}개"
+        if self.measure_transfer:
+            report += f" / 전송: {self.transferred_requests}개, {self.transferred_bytes / 1024 / 1024:.1f}MB"
+        return report
@@ -0,0 +1,269 @@
+# src/results.py
+# 메모리 절약형 분석 결과 표현 (문자열은 내보낼 때만 생성)
+from enum import IntEnum
+from typing import List, Optional
+
+# 중복 검사로 추가되는 반복_게시 위반 표기
+DUPLICATE_CATEGORY = "스팸"
+DUPLICATE_SUBCATEGORY = "반복_게시"
+DUPLICATE_BASE_SCORE = 80
+DUPLICATE_SCORE_BONUS = 30
+DUPLICATE_POLICY_REF = "커뮤니티 규정 > 스팸 > 반복적인 콘텐츠 게시"
+DUPLICATE_RECOMMENDATION = "⚠️ [스팸 탐지] 동일/유사 문구 반복 게시 금지"
+
+
+class RiskLevel(IntEnum):
+    """
+    위험 등급 (정수 비교/집계용, 표시 문자열은 label)
+    """
+    SAFE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+    @classmethod
+    def from_score(cls, score: int) -> "RiskLevel":
+        if score >= 80:
+            return cls.CRITICAL
+        elif score >= 60:
+            return cls.HIGH
+        elif score >= 40:
+            return cls.MEDIUM
+        elif score >= 20:
+            return cls.LOW
+        return cls.SAFE
+
+    @classmethod
+    def from_label(cls, label: str) -> Optional["RiskLevel"]:
+        """
+        기존 dict 결과의 risk_level 문자열 -> 등급 (알 수 없으면 None)
+        """
+        if "매우 높음" in label:
+            return cls.CRITICAL
+        elif "높음" in label:
+            return cls.HIGH
+        elif "중간" in label:
+            return cls.MEDIUM
+        elif "낮음" in label:
+            return cls.LOW
+        elif "안전" in label:
+            return cls.SAFE
+        return None
+
+    @property
+    def label(self) -> str:
+        return _RISK_LABELS[self]
+
+
+_RISK_LABELS = {
+    RiskLevel.CRITICAL: "🔴 매우 높음 (삭제 가능성 높음)",
+    RiskLevel.HIGH: "🟠 높음 (경고/제한 가능성)",
+    RiskLevel.MEDIUM: "🟡 중간 (주의 필요)",
+    RiskLevel.LOW: "🟢 낮음",
+    RiskLevel.SAFE: "✅ 안전",
+}
+
+# 기존 dict 결과와 같은 키 순서
+_BASE_KEYS = (
+    "username", "text", "datetime", "link", "likes", "replies", "reposts",
+    "violations", "violation_details", "risk_score", "risk_level",
+    "official_policy_refs", "recommendations"
+)
+_DUPLICATE_KEYS = ("is_duplicate", "duplicate_count", "duplicate_group_size", "history_duplicate_count")
+# 답글(작성자 본인 답글)에만 있는 키
+_REPLY_KEYS = ("parent_link",)
+
+
+class AnalysisResult:
+    """
+    게시물 1개의 분석 결과
+    - 위반 항목은 (규칙 인덱스, 키워드 위치, 인디케이터 위치) 정수 튜플로만 보관
+    - 등급은 RiskLevel, 정책/권고 문구는 CompiledGuidelines 의 공유 문자열에서 필요할 때 생성
+    - 기존 dict 결과처럼 result["risk_level"], result.get(...) 으로도 읽을 수 있음
+    """
+    __slots__ = (
+        "ruleset", "username", "text", "datetime", "link", "likes", "replies", "reposts", "parent_link",
+        "matches", "risk_score", "risk_tier",
+        "duplicate_count", "duplicate_group_size", "history_duplicate_count"
+    )
+
+    def __init__(self, ruleset, post: dict, matches: tuple = (), risk_score: int = 0):
+        self.ruleset = ruleset
+        self.username = post.get("username", "")
+        self.text = post.get("text", "")
+        self.datetime = post.get("datetime", "")
+        self.link = post.get("link", "")
+        self.likes = post.get("likes", 0)
+        self.replies = post.get("replies", 0)
+        self.reposts = post.get("reposts", 0)
+        # 답글이면 원게시물 링크, 게시물이면 ""
+        self.parent_link = post.get("parent_link", "")
+        self.matches = matches
+        self.risk_score = risk_score
+        self.risk_tier = RiskLevel.from_score(risk_score)
+        # 중복 검사 전에는 None
+        self.duplicate_count = None
+        self.duplicate_group_size = None
+        self.history_duplicate_count = None
+
+    # --- 상태 ---
+
+    def set_risk_score(self, score: int) -> None:
+        self.risk_score = score
+        self.risk_tier = RiskLevel.from_score(score)
+
+    def set_duplicates(self, duplicate_count: int, group_size: int, history_count: int) -> None:
+        """
+        중복 검사 결과 반영 (중복이 있으면 점수 가산)
+        """
+        self.duplicate_count = duplicate_count
+        self.duplicate_group_size = group_size
+        self.history_duplicate_count = history_count
+        if duplicate_count:
+            self.set_risk_score(min(self.risk_score + DUPLICATE_SCORE_BONUS, 100))
+
+    def set_engagement(self, post: dict) -> None:
+        """
+        분석 후 채워진 좋아요/답글/리포스트 수 반영 (스트리밍 분석 후 상세 페이지 수집 시)
+        """
+        self.likes = post.get("likes", 0)
+        self.replies = post.get("replies", 0)
+        self.reposts = post.get("reposts", 0)
+
+    @property
+    def is_duplicate(self) -> bool:
+        return bool(self.duplicate_count)
+
+    def _state(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__[1:])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AnalysisResult):
+            return NotImplemented
+        return self._state() == other._state()
+
+    # 프로세스 간 전달 시 규칙 테이블은 제외 (받는 쪽에서 다시 연결)
+    def __getstate__(self) -> tuple:
+        return self._state()
+
+    def __setstate__(self, state: tuple) -> None:
+        self.ruleset = None
+        for name, value in zip(self.__slots__[1:], state):
+            setattr(self, name, value)
+
+    # --- 내보내기용 문자열 (호출 시 생성) ---
+
+    def _rules(self):
+        rules = self.ruleset.subcategories
+        return [(rules[index], keywords, indicators) for index, keywords, indicators in self.matches]
+
+    def _duplicate_indicators(self) -> List[str]:
+        indicators = [f"{self.duplicate_count}개의 유사 게시물 발견"]
+        if self.history_duplicate_count:
+            indicators.append(f"이전 분석 게시물 {self.history_duplicate_count}개와 유사")
+        return indicators
+
+    @property
+    def risk_level(self) -> str:
+        return self.risk_tier.label
+
+    @property
+    def violations(self) -> List[dict]:
+        violations = [
+            {
+                "category": rule.category,
+                "subcategory": rule.subcategory,
+                "matched_indicators": [rule.indicators[pos] for pos in indicators],
+                "matched_keywords": [rule.keywords[pos] for pos in keywords],
+                "base_score": rule.base_score
+            }
+            for rule, keywords, indicators in self._rules()
+        ]
+        if self.duplicate_count:
+            violations.append({
+                "category": DUPLICATE_CATEGORY,
+                "subcategory": DUPLICATE_SUBCATEGORY,
+                "matched_indicators": self._duplicate_indicators(),
+                "matched_keywords": [],
+                "base_score": DUPLICATE_BASE_SCORE
+            })
+        return violations
+
+    def violation_ids(self) -> List[int]:
+        """
+        위반 규칙 인덱스 목록 (중복 검사 위반은 반복_게시 규칙 인덱스로 표기)
+        """
+        ids = [index for index, _, _ in self.matches]
+        if self.duplicate_count:
+            ids.append(self.ruleset.duplicate_rule_index)
+        return ids
+
+    def violation_names(self) -> List[str]:
+        names = [f"{rule.category}/{rule.subcategory}" for rule, _, _ in self._rules()]
+        if self.duplicate_count:
+            names.append(f"{DUPLICATE_CATEGORY}/{DUPLICATE_SUBCATEGORY}")
+        return names
+
+    @property
+    def violation_details(self) -> List[str]:
+        details = []
+        for rule, keywords, indicators in self._rules():
+            if keywords:
+                matched_items = [rule.keywords[pos] for pos in keywords[:3]]
+            else:
+                matched_items = [rule.indicators[pos] for pos in indicators[:1]]
+            details.append(f"[{rule.category}/{rule.subcategory}] {', '.join(matched_items)}")
+        if self.duplicate_count:
+            details.append(f"[{DUPLICATE_CATEGORY}/{DUPLICATE_SUBCATEGORY}] {', '.join(self._duplicate_indicators())}")
+        return details
+
+    @property
+    def official_policy_refs(self) -> List[str]:
+        refs = [rule.policy_ref for rule, _, _ in self._rules()]
+        if self.duplicate_count:
+            refs.append(DUPLICATE_POLICY_REF)
+        return refs
+
+    @property
+    def recommendations(self) -> List[str]:
+        recommendations = []
+        seen = set()
+        for rule, _, _ in self._rules():
+            if rule.subcategory in seen:
+                continue
+            seen.add(rule.subcategory)
+            if rule.recommendation:
+                recommendations.append(rule.recommendation)
+        if self.duplicate_count:
+            recommendations.append(DUPLICATE_RECOMMENDATION)
+        return recommendations
+
+    # --- 기존 dict 결과 호환 ---
+
+    def keys(self) -> List[str]:
+        keys = _BASE_KEYS
+        if self.parent_link:
+            keys += _REPLY_KEYS
+        if self.duplicate_count is not None:
+            keys += _DUPLICATE_KEYS
+        return list(keys)
+
+    def __getitem__(self, key: str):
+        if (key not in _BASE_KEYS
+                and (key not in _DUPLICATE_KEYS or self.duplicate_count is None)
+                and (key not in _REPLY_KEYS or not self.parent_link)):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in self.keys()}
@@ -1,221 +1,417 @@
 # src/scraper.py - 수정 버전
 
 import asyncio
-import json
-import os
 from datetime import datetime
 from dateutil import parser as date_parser
 from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
+from metrics import Metrics
+from feed_capture import FeedCapture
+from scroll_scheduler import ScrollScheduler
+from resource_blocker import ResourceBlocker
+from checkpoint import CrawlCheckpoint
+from crawl_state import HighWaterMarkStore
+from browser_pool import BrowserPool, COOKIES_FILE, interactive_login
 
-COOKIES_FILE = "threads_cookies.json"
+EXTRACTION_MODES = ("incremental", "html", "network")
+
+# 아직 추출하지 않은 게시물 컨테이너만 읽고 표시 (_extract_post_from_element 와 같은 셀렉터)
+# 링크/본문이 아직 렌더링되지 않은 컨테이너는 표시하지 않고 다음 스크롤에서 다시 읽음
+_EXTRACT_NEW_POSTS_JS = """
+() => {
+    const MARK = 'data-threads-scraped';
+    // BeautifulSoup get_text(strip=True) 와 같이 텍스트 노드별로 공백 제거 후 연결
+    const stripText = (el) => {
+        const parts = [];
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            const value = walker.currentNode.nodeValue.trim();
+            if (value) parts.push(value);
+        }
+        return parts.join('');
+    };
+    const posts = [];
+    for (const container of document.querySelectorAll('[data-pressable-container="true"]:not([' + MARK + '])')) {
+        const linkEl = container.querySelector('a[href*="/post/"]');
+        const href = linkEl ? (linkEl.getAttribute('href') || '') : '';
+        const textContainer = container.querySelector('div.x1a6qonq');
+        const textParts = [];
+        if (textContainer) {
+            for (const span of textContainer.querySelectorAll('span > span')) {
+                const text = stripText(span);
+                if (text) textParts.push(text);
+            }
+        }
+        const text = textParts.join('\\n').trim();
+        if (!href || !text) continue;
+
+        const timeEl = container.querySelector('time[datetime]');
+        const usernameEl = container.querySelector('a[href^="/@"] span span');
+        container.setAttribute(MARK, '1');
+        posts.push({
+            href: href,
+            text: text,
+            datetime: timeEl ? timeEl.getAttribute('datetime') : '',
+            username: usernameEl ? stripText(usernameEl) : ''
+        });
+    }
+    return posts;
+}
+"""
+
+# 이미 수집한 게시물 컨테이너의 내용을 비워 긴 크롤링에서도 페이지 메모리를 일정하게 유지
+# 높이를 고정해 스크롤 위치가 바뀌지 않게 하고, 마지막 keep 개는 남김 (아직 렌더링 중일 수 있음)
+# onlyScraped: 증분 추출은 표시(data-threads-scraped)된 컨테이너만 비움 (network 모드는 응답에서 이미 수집)
+_TRIM_SCRAPED_JS = """
+([keep, onlyScraped]) => {
+    const selector = '[data-pressable-container="true"]:not([data-threads-trimmed])'
+        + (onlyScraped ? '[data-threads-scraped]' : '');
+    const containers = Array.from(document.querySelectorAll(selector));
+    let trimmed = 0;
+    for (const container of containers.slice(0, Math.max(0, containers.length - keep))) {
+        // 안쪽 컨테이너(인용 게시물)는 바깥 컨테이너와 함께 이미 비워짐
+        if (!container.isConnected) continue;
+        container.style.height = container.offsetHeight + 'px';
+        container.setAttribute('data-threads-scraped', '1');
+        container.setAttribute('data-threads-trimmed', '1');
+        container.replaceChildren();
+        trimmed++;
+    }
+    return trimmed;
+}
+"""
 
 class ThreadsScraper:
-    def __init__(self, username: str, start_date: str, end_date: str, skip_pinned: int = 10):
+    def __init__(self, username: str, start_date: str, end_date: str, skip_pinned: int = 10, metrics: Metrics = None,
+                 extraction_mode: str = "html", scroll_scheduler: ScrollScheduler = None,
+                 resource_blocker: ResourceBlocker = None, checkpoint: CrawlCheckpoint = None,
+                 high_water_marks: HighWaterMarkStore = None, incremental: bool = False,
+                 browser_pool: BrowserPool = None, post_sink=None, log_every: int = 1,
+                 trim_dom_every: int = 0, trim_dom_keep: int = 30):
         self.username = username.replace("@", "")
         self.base_url = f"https://www.threads.net/@{self.username}"
+        self.start_date_str = start_date
+        self.end_date_str = end_date
         self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
         self.end_date = datetime.strptime(end_date, "%Y-%m-%d").replace(hour=23, minute=59, second=59)
         self.skip_pinned = skip_pinned
         self.posts = []
+        # 단계별 시간/카운터 계측 (scrape.*)
+        self.metrics = metrics if metrics is not None else Metrics()
+        if extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(f"지원하지 않는 추출 방식: {extraction_mode} (가능: {', '.join(EXTRACTION_MODES)})")
+        self.extraction_mode = extraction_mode
+        # 추출한 링크 / 링크 -> 파싱한 날짜 (게시물마다 1회만 추출/날짜 파싱)
+        self._extracted = set()
+        self._post_dates = {}
+        # network 모드: 피드 JSON 응답 수집기
+        self._capture = None
+        # 스크롤 후 대기 방식 (기본: 신호 기반 적응형 대기)
+        self.scroll_scheduler = scroll_scheduler if scroll_scheduler is not None else ScrollScheduler()
+        if self.scroll_scheduler.metrics is None:
+            self.scroll_scheduler.metrics = self.metrics
+        # 이미지/영상/폰트/분석 요청 차단 (기본: 차단 없이 전송량만 집계)
+        self.resource_blocker = resource_blocker if resource_blocker is not None else ResourceBlocker()
+        if self.resource_blocker.metrics is None:
+            self.resource_blocker.metrics = self.metrics
+        # 중단된 크롤링 재개용 체크포인트 (선택)
+        self.checkpoint = checkpoint
+        # 계정별 최신 수집 게시물 기록 (incremental=True 면 이미 수집한 게시물에 닿으면 종료)
+        self.high_water_marks = high_water_marks
+        self.incremental = incremental
+        # 공유 브라우저 (없으면 크롤링마다 새로 띄우고 종료 시 닫음)
+        self.browser_pool = browser_pool
+        # 수집 게시물 저장소 (post_sink.JsonlPostSink 등, 없으면 메모리 list)
+        self.post_sink = post_sink
+        # 수집 로그는 log_every 개마다 1줄
+        self.log_every = max(1, log_every)
+        # trim_dom_every 스크롤마다 수집한 컨테이너 비우기 (0 이면 끔, html 모드는 전체 재파싱이라 사용 안 함)
+        self.trim_dom_every = trim_dom_every
+        self.trim_dom_keep = trim_dom_keep
     
     async def login_and_save_cookies(self):
         """
         브라우저를 열어 수동 로그인 후 쿠키 저장
         """
         async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=False,  # 브라우저 보이게
-                args=['--no-sandbox']
-            )
-            context = await browser.new_context(
-                viewport={"width": 1280, "height": 800}
-            )
-            page = await context.new_page()
+            await interactive_login(p, COOKIES_FILE)
+    
+    async def scrape_posts(self, on_post=None) -> list:
+        """
+        쿠키를 사용하여 로그인 상태로 크롤링
+        (on_post: 게시물이 수집될 때마다 호출되는 콜백, 스트리밍 분석용)
+        """
+        metrics = self.metrics
+        pool = self.browser_pool
+        owns_pool = pool is None
+        if owns_pool:
+            pool = BrowserPool(resource_blocker=self.resource_blocker, metrics=metrics)
+        blocker = pool.resource_blocker
+        checkpoint = self.checkpoint
+        if checkpoint is not None and not checkpoint.is_open:
+            if checkpoint.load():
+                print(f"[*] 체크포인트에서 재개: 수집 {len(checkpoint.posts)}개, 확인한 링크 {len(checkpoint.seen_links)}개")
+            checkpoint.start()
+        stop_point = None
+        if self.incremental and self.high_water_marks is not None:
+            stop_point = self.high_water_marks.stop_point(self.username, self.start_date_str)
+            if stop_point is not None:
+                print(f"[*] 증분 크롤링: {stop_point['datetime']} 이전 게시물에 닿으면 종료")
+            else:
+                print("[*] 증분 크롤링: 요청 기간을 덮는 이전 기록이 없어 전체 크롤링")
+        
+        page = None
+        scheduler = self.scroll_scheduler
+        limiter = pool.rate_limiter
+        
+        try:
+            # 공유 브라우저가 이미 떠 있으면 바로 반환 (쿠키 파일이 없으면 먼저 수동 로그인)
+            await pool.start()
+            page = await self._open_page(pool)
+            print(f"[*] {self.base_url} 접속 중...")
+            await self._load_profile(page, limiter)
             
-            print("=" * 50)
-            print("Threads 로그인이 필요합니다")
-            print("=" * 50)
-            print("\n1. 브라우저에서 Threads에 로그인하세요")
-            print("2. 로그인 완료 후 이 터미널에서 Enter를 누르세요\n")
+            # 로그인 상태 확인 (만료되면 브라우저를 다시 띄우지 않고 쿠키만 갱신 후 1회 재접속)
+            generation = pool.login_generation
+            if not await self._check_login_status(page):
+                # 요청이 많을 때도 로그인 화면이 나오므로 재접속 전에 속도도 낮춤
+                limiter.throttled(self.base_url, "login_wall")
+                await pool.relogin(generation)
+                await self._load_profile(page, limiter)
+                if not await self._check_login_status(page):
+                    raise RuntimeError("다시 로그인한 뒤에도 로그인 상태를 확인할 수 없습니다")
             
-            # Threads 로그인 페이지로 이동
-            await page.goto("https://www.threads.net/login", wait_until="networkidle")
+            print("[✓] 로그인 상태 확인됨")
             
-            # 사용자가 로그인할 때까지 대기
-            input(">>> 로그인 완료 후 Enter를 누르세요...")
+            # 이하 기존 크롤링 로직...
+            await page.click("body")
+            await page.wait_for_timeout(1000)
             
-            # 쿠키 저장
-            cookies = await context.cookies()
-            with open(COOKIES_FILE, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            self._extracted = set()
+            self._post_dates = {}
+            if self._capture is not None:
+                # 최초 피드는 페이지에 포함된 JSON 으로 렌더링되므로 1회만 읽음
+                with metrics.span("scrape.parse"):
+                    self._capture.feed_html(await page.content())
             
-            print(f"\n✅ 쿠키 저장 완료: {COOKIES_FILE}")
-            print(f"   저장된 쿠키: {len(cookies)}개")
+            # 스크롤하며 수집 (예외로 중단되어도 수집분은 self.posts 에 남도록 먼저 연결)
+            if self.post_sink is not None:
+                self.post_sink.clear()
+                posts_data = self.post_sink
+            else:
+                posts_data = []
+            collected_links = set()
+            consecutive_old = 0
+            self.posts = posts_data
             
-            await browser.close()
-    
-    async def scrape_posts(self) -> list:
-        """
-        쿠키를 사용하여 로그인 상태로 크롤링
-        """
-        # 쿠키 파일 확인
-        if not os.path.exists(COOKIES_FILE):
-            print("[!] 쿠키 파일이 없습니다. 먼저 로그인이 필요합니다.")
-            await self.login_and_save_cookies()
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage'
-                ]
-            )
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-                locale="ko-KR",
-                viewport={"width": 1920, "height": 1080}
-            )
+            # 고정글 식별
+            pinned_links = set()
+            if checkpoint is not None:
+                self._resume_posts(checkpoint, posts_data, on_post)
+                collected_links.update(checkpoint.seen_links)
+                pinned_links.update(checkpoint.pinned_links)
+                consecutive_old = checkpoint.consecutive_old
             
-            # 저장된 쿠키 로드
-            try:
-                with open(COOKIES_FILE, 'r') as f:
-                    cookies = json.load(f)
-                await context.add_cookies(cookies)
-                print(f"[*] 쿠키 로드 완료: {len(cookies)}개")
-            except Exception as e:
-                print(f"[!] 쿠키 로드 실패: {e}")
-                print("[!] 다시 로그인합니다...")
-                await browser.close()
-                await self.login_and_save_cookies()
-                return await self.scrape_posts()  # 재시도
+            with metrics.span("scrape.parse"):
+                initial_posts, _ = await self._extract_posts(page)
+            print(f"[*] 초기 로드: {len(initial_posts)}개")
             
-            await context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-            """)
+            for i, post in enumerate(initial_posts):
+                if i < self.skip_pinned and post.get("link"):
+                    pinned_links.add(post["link"])
+                    print(f"[PINNED] #{i+1}: {post['text'][:40]}...")
             
-            page = await context.new_page()
+            print(f"[*] 고정글 {len(pinned_links)}개 식별 완료\n")
+            if checkpoint is not None:
+                checkpoint.add_pinned(pinned_links)
             
-            try:
-                print(f"[*] {self.base_url} 접속 중...")
-                await page.goto(self.base_url, wait_until="networkidle", timeout=60000)
-                await page.wait_for_timeout(3000)
-                
-                # 로그인 상태 확인
-                is_logged_in = await self._check_login_status(page)
-                if not is_logged_in:
-                    print("[!] 로그인 세션 만료. 다시 로그인합니다...")
-                    await browser.close()
-                    os.remove(COOKIES_FILE)
-                    await self.login_and_save_cookies()
-                    return await self.scrape_posts()
-                
-                print("[✓] 로그인 상태 확인됨")
-                
-                # 이하 기존 크롤링 로직...
-                await page.click("body")
-                await page.wait_for_timeout(1000)
-                
-                # 고정글 식별
-                pinned_links = set()
-                initial_posts = self._parse_all_posts_from_html(await page.content())
-                print(f"[*] 초기 로드: {len(initial_posts)}개")
+            max_consecutive_old = 20
+            # 스레드 순서가 조금 뒤섞여도 멈추지 않도록 이미 수집한 게시물이 연속으로 나와야 종료
+            consecutive_known = 0
+            max_consecutive_known = 3
+            scroll_count = 0
+            max_scrolls = 500
+            last_post_count = len(initial_posts)
+            stuck_count = 0
+            # 새 게시물 없는 스크롤은 피드 끝에서도 정상적으로 나오므로 공유 속도 제한에 보고하지 않음
+            # (실제 서버 제한은 429 응답/로그인 화면으로만 감지)
+            max_stuck = 30
+            # 증분/응답 추출은 이미 읽은 게시물을 다시 반환하지 않으므로 초기 게시물을 첫 스크롤에서 처리
+            backlog = initial_posts if self.extraction_mode != "html" else []
+            
+            while scroll_count < max_scrolls:
+                scroll_count += 1
+                metrics.incr("scrape.scrolls")
                 
-                for i, post in enumerate(initial_posts):
-                    if i < self.skip_pinned and post.get("link"):
-                        pinned_links.add(post["link"])
-                        print(f"[PINNED] #{i+1}: {post['text'][:40]}...")
+                # Page Down 키로 스크롤 + 새 콘텐츠 대기
+                await limiter.acquire(self.base_url)
+                with metrics.span("scrape.scroll"):
+                    await scheduler.scroll(page)
                 
-                print(f"[*] 고정글 {len(pinned_links)}개 식별 완료\n")
+                with metrics.span("scrape.parse"):
+                    all_posts, current_count = await self._extract_posts(page)
+                metrics.incr("scrape.containers_parsed", len(all_posts))
+                if backlog:
+                    all_posts = backlog + all_posts
+                    backlog = []
                 
-                # 스크롤하며 수집
-                posts_data = []
-                collected_links = set()
-                consecutive_old = 0
-                max_consecutive_old = 20
-                scroll_count = 0
-                max_scrolls = 500
-                last_post_count = len(initial_posts)
-                stuck_count = 0
-                max_stuck = 30
+                if current_count > last_post_count:
+                    print(f"[*] 새 게시물 로드: {last_post_count} → {current_count}")
+                    stuck_count = 0
+                    last_post_count = current_count
+                    limiter.succeeded(self.base_url)
+                else:
+                    stuck_count += 1
+                    if stuck_count >= max_stuck:
+                        print(f"\n[*] {max_stuck}회 연속 새 게시물 없음, 종료")
+                        break
+                    if scheduler.exhausted:
+                        print(f"\n[*] {scheduler.idle_ms / 1000:.1f}초 동안 새 콘텐츠 신호 없음, 종료")
+                        break
                 
-                while scroll_count < max_scrolls:
-                    scroll_count += 1
-                    
-                    # Page Down 키로 스크롤
-                    for _ in range(5):
-                        await page.keyboard.press("PageDown")
-                        await page.wait_for_timeout(300)
+                new_links = []
+                for post in all_posts:
+                    link = post.get("link", "")
+                    if not link or link in collected_links or link in pinned_links:
+                        continue
                     
-                    await page.wait_for_timeout(1500)
+                    collected_links.add(link)
+                    new_links.append(link)
+                    if not post.get("text"):
+                        continue
                     
-                    all_posts = self._parse_all_posts_from_html(await page.content())
-                    current_count = len(all_posts)
+                    post_date = self._post_date(post)
                     
-                    if current_count > last_post_count:
-                        print(f"[*] 새 게시물 로드: {last_post_count} → {current_count}")
-                        stuck_count = 0
-                        last_post_count = current_count
-                    else:
-                        stuck_count += 1
-                        if stuck_count >= max_stuck:
-                            print(f"\n[*] {max_stuck}회 연속 새 게시물 없음, 종료")
-                            break
-                    
-                    for post in all_posts:
-                        link = post.get("link", "")
-                        if not link or link in collected_links or link in pinned_links:
-                            continue
-                        
-                        collected_links.add(link)
-                        if not post.get("text"):
-                            continue
-                        
-                        post_date = self._parse_date(post.get("datetime", ""))
-                        
-                        if post_date is None:
-                            posts_data.append(post)
-                            consecutive_old = 0
-                            print(f"[+] ({len(posts_data)}): (날짜없음) {post['text'][:35]}...")
-                            continue
-                        
-                        if post_date > self.end_date:
-                            consecutive_old = 0
-                            continue
-                        
-                        if post_date < self.start_date:
-                            consecutive_old += 1
-                            if consecutive_old >= max_consecutive_old:
-                                print(f"\n[*] 시작일 이전 {max_consecutive_old}개 연속, 종료")
-                                break
-                            continue
-                        
+                    if post_date is None:
                         posts_data.append(post)
+                        metrics.incr("scrape.posts_collected")
+                        if checkpoint is not None:
+                            checkpoint.add_post(post)
+                        if on_post:
+                            on_post(post)
                         consecutive_old = 0
-                        print(f"[+] ({len(posts_data)}): {post_date.date()} {post['text'][:35]}...")
+                        self._log_post(len(posts_data), "(날짜없음)", post["text"])
+                        continue
                     
-                    if consecutive_old >= max_consecutive_old:
-                        break
+                    if post_date > self.end_date:
+                        consecutive_old = 0
+                        continue
                     
-                    if scroll_count % 20 == 0:
-                        print(f"[*] 스크롤 #{scroll_count} (수집: {len(posts_data)}, 로드: {current_count})")
+                    if post_date < self.start_date:
+                        consecutive_old += 1
+                        if consecutive_old >= max_consecutive_old:
+                            print(f"\n[*] 시작일 이전 {max_consecutive_old}개 연속, 종료")
+                            break
+                        continue
+                    
+                    if stop_point is not None and (link == stop_point["link"] or post_date <= stop_point["datetime"]):
+                        consecutive_known += 1
+                        metrics.incr("scrape.known_posts")
+                        if consecutive_known >= max_consecutive_known:
+                            print(f"\n[*] 이미 수집한 게시물 {max_consecutive_known}개 연속, 종료")
+                            break
+                        continue
+                    consecutive_known = 0
+                    
+                    posts_data.append(post)
+                    metrics.incr("scrape.posts_collected")
+                    if checkpoint is not None:
+                        checkpoint.add_post(post)
+                    if on_post:
+                        on_post(post)
+                    consecutive_old = 0
+                    self._log_post(len(posts_data), post_date.date(), post["text"])
                 
-                self.posts = posts_data
-                print(f"\n{'='*50}")
-                print(f"[완료] 수집: {len(self.posts)}개")
-                print(f"{'='*50}")
+                if checkpoint is not None:
+                    checkpoint.add_seen(new_links)
+                    checkpoint.save_state(consecutive_old)
                 
-            except Exception as e:
-                print(f"[에러] {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                await browser.close()
+                if consecutive_old >= max_consecutive_old or consecutive_known >= max_consecutive_known:
+                    break
+                
+                if self.trim_dom_every and self.extraction_mode != "html" and scroll_count % self.trim_dom_every == 0:
+                    await self._trim_dom(page)
+                
+                if scroll_count % 20 == 0:
+                    print(f"[*] 스크롤 #{scroll_count} (수집: {len(posts_data)}, 로드: {current_count})")
+            
+            if checkpoint is not None:
+                checkpoint.finish()
+            # 시작일 이전 게시물/이미 수집한 게시물에 닿아 멈춘 경우만 요청 기간을 다 덮은 것으로 기록
+            # (새 게시물 없음/스크롤 신호 없음/최대 스크롤은 피드 끝인지 멈춘 것인지 알 수 없으므로 실제로 본 날짜까지만)
+            reached_end = consecutive_old >= max_consecutive_old or consecutive_known >= max_consecutive_known
+            if self.high_water_marks is not None:
+                self.high_water_marks.update(self.username, posts_data, self.start_date_str, self.end_date_str,
+                                             complete=reached_end)
+            print(f"\n{'='*50}")
+            print(f"[완료] 수집: {len(self.posts)}개")
+            print(f"{'='*50}")
+            print(blocker.report())
+            
+        except Exception as e:
+            print(f"[에러] {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+            if self.post_sink is not None:
+                self.post_sink.flush()
+            if page is not None and not page.is_closed():
+                await page.close()
+            if owns_pool:
+                await pool.close()
         
         return self.posts
     
+    def _resume_posts(self, checkpoint: CrawlCheckpoint, posts_data, on_post) -> None:
+        """
+        체크포인트의 게시물을 posts_data 로 옮김
+        이전 실행에서 이미 분석해 CSV 로 내보낸 게시물은 링크만 남기고 다시 분석하지 않음
+        """
+        resumed = [post for post in checkpoint.posts if post.get("link") not in checkpoint.analyzed_links]
+        if len(resumed) < len(checkpoint.posts):
+            print(f"[*] 이전 실행에서 분석한 게시물 {len(checkpoint.posts) - len(resumed)}개 제외")
+        posts_data.extend(resumed)
+        if self.post_sink is not None:
+            checkpoint.release_posts()
+        # 재개한 (아직 분석하지 않은) 게시물도 스트리밍 분석으로 전달
+        if on_post:
+            for post in resumed:
+                on_post(post)
+    
+    def _log_post(self, count: int, date_label, text: str) -> None:
+        if count % self.log_every == 0:
+            print(f"[+] ({count}): {date_label} {text[:35]}...")
+    
+    async def _trim_dom(self, page) -> None:
+        only_scraped = self._capture is None or not self._capture.post_count
+        with self.metrics.span("scrape.dom_trim"):
+            trimmed = await page.evaluate(_TRIM_SCRAPED_JS, [self.trim_dom_keep, only_scraped])
+        self.metrics.incr("scrape.dom_trimmed", trimmed)
+    
+    async def _load_profile(self, page, limiter) -> None:
+        await limiter.acquire(self.base_url)
+        with self.metrics.span("scrape.page_load"):
+            response = await page.goto(self.base_url, wait_until="networkidle", timeout=60000)
+            await page.wait_for_timeout(3000)
+        if response is not None and response.ok:
+            limiter.succeeded(self.base_url)
+    
+    async def _open_page(self, pool: BrowserPool):
+        """
+        공유 컨텍스트에 새 페이지를 열고 응답 수집기/스크롤 스케줄러 연결
+        """
+        page = await pool.new_page()
+        self._capture = None
+        if self.extraction_mode == "network":
+            # 첫 피드 응답도 받도록 페이지 이동 전에 등록
+            self._capture = FeedCapture(self.metrics, keep_posts=False)
+            self._capture.attach(page)
+        self.scroll_scheduler.reset()
+        self.scroll_scheduler.attach(page)
+        return page
+    
     async def _check_login_status(self, page) -> bool:
         """
         로그인 상태 확인
@@ -235,6 +431,62 @@ class ThreadsScraper:
         except:
             return False
     
+    async def _extract_posts(self, page) -> tuple:
+        """
+        현재 페이지 게시물 추출
+        반환: (처리할 게시물 목록, 지금까지 로드된 게시물 수)
+        - incremental: 이번에 새로 나타난 게시물만 반환, 로드 수는 지금까지 추출한 고유 링크 수
+        - network: 피드 응답에서 새로 수집된 게시물만 반환
+          (응답에서 게시물을 하나도 찾지 못했으면 incremental 방식으로 대체)
+        - html: 전체 HTML 재파싱 결과 전체 반환
+        """
+        if self.extraction_mode == "html":
+            posts = self._parse_all_posts_from_html(await page.content())
+            return posts, len(posts)
+        
+        if self._capture is not None and self._capture.post_count:
+            new_posts = []
+            for post in self._capture.drain():
+                if post["link"] not in self._extracted:
+                    self._extracted.add(post["link"])
+                    new_posts.append(post)
+            return new_posts, len(self._extracted)
+        
+        new_posts = []
+        for item in await page.evaluate(_EXTRACT_NEW_POSTS_JS):
+            link = self._absolute_link(item.get("href", ""))
+            if not link or link in self._extracted:
+                continue
+            post = {
+                "username": item.get("username", ""),
+                "text": item.get("text", ""),
+                "datetime": item.get("datetime") or "",
+                "link": link,
+                "likes": 0,
+                "replies": 0,
+                "reposts": 0,
+                "scraped_at": datetime.now().isoformat()
+            }
+            self._extracted.add(link)
+            new_posts.append(post)
+        return new_posts, len(self._extracted)
+    
+    def _post_date(self, post: dict):
+        """
+        링크별로 1회만 날짜 파싱
+        (html 모드만 같은 게시물을 매 스크롤 다시 읽으므로 기억, 나머지는 게시물마다 1회 호출)
+        """
+        if self.extraction_mode != "html":
+            return self._parse_date(post.get("datetime", ""))
+        link = post.get("link", "")
+        if link not in self._post_dates:
+            self._post_dates[link] = self._parse_date(post.get("datetime", ""))
+        return self._post_dates[link]
+    
+    @staticmethod
+    def _absolute_link(href: str) -> str:
+        return f"https://www.threads.net{href}" if href.startswith('/') else href
+    
     def _parse_all_posts_from_html(self, html: str) -> list:
         soup = BeautifulSoup(html, 'html.parser')
         posts = []
@@ -264,8 +516,7 @@ class ThreadsScraper:
         link_el = element.select_one('a[href*="/post/"]')
         post_link = ""
         if link_el:
-            href = link_el.get('href', '')
-            post_link = f"https://www.threads.net{href}" if href.startswith('/') else href
+            post_link = self._absolute_link(link_el.get('href', ''))
         
         username_el = element.select_one('a[href^="/@"] span span')
         username = username_el.get_text(strip=True) if username_el else ""
@@ -0,0 +1,119 @@
+# src/scroll_scheduler.py
+# 스크롤 후 고정 대기 대신 실제 신호(컨테이너 증가 / 피드 요청 완료 / 스크롤 높이 증가)를 기다리는 스케줄러
+import time
+
+from feed_capture import is_feed_request
+
+# 기존 고정 대기 (PageDown 5회 x 300ms + 1500ms)
+FIXED_WAIT_MS = 5 * 300 + 1500
+
+_SCROLL_STATE_JS = """
+() => ({
+    count: document.querySelectorAll('[data-pressable-container="true"]').length,
+    height: document.scrollingElement ? document.scrollingElement.scrollHeight : document.body.scrollHeight
+})
+"""
+
+
+class ScrollScheduler:
+    """
+    스크롤 1회 + 새 콘텐츠 대기
+    - adaptive=False: 기존 고정 대기 (PageDown 마다 300ms + 1500ms)
+    - adaptive=True: poll_ms 간격으로 신호 확인, 신호가 오면 즉시 다음 스크롤
+      신호 없이 wait_ms 가 지나면 다음 대기 시간을 backoff 배 늘림 (max_wait_ms 까지)
+      신호가 오면 min_wait_ms 로 초기화
+    - idle_ms: 마지막 신호 이후 누적 대기 시간 (stuck_timeout_ms 이상이면 exhausted)
+    """
+
+    def __init__(self, adaptive: bool = True, min_wait_ms: int = 400, max_wait_ms: int = 3000,
+                 backoff: float = 1.5, poll_ms: int = 100, stuck_timeout_ms: int = 20000, metrics=None):
+        self.adaptive = adaptive
+        self.min_wait_ms = min_wait_ms
+        self.max_wait_ms = max_wait_ms
+        self.backoff = backoff
+        self.poll_ms = poll_ms
+        self.stuck_timeout_ms = stuck_timeout_ms
+        self.metrics = metrics
+
+        self.wait_ms = min_wait_ms
+        self.idle_ms = 0
+        self.time_saved_ms = 0
+        self._inflight = 0
+        self._finished = 0
+
+    def reset(self) -> None:
+        """
+        새 크롤링 시작 시 대기/신호 상태 초기화 (절약 시간은 누적)
+        """
+        self.wait_ms = self.min_wait_ms
+        self.idle_ms = 0
+        self._inflight = 0
+        self._finished = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.adaptive and self.idle_ms >= self.stuck_timeout_ms
+
+    def attach(self, page) -> None:
+        """
+        피드 요청 진행/완료 추적 (페이지 이동 전에 등록)
+        """
+        if not self.adaptive:
+            return
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    def _on_request(self, request) -> None:
+        # 좋아요/로깅 등 다른 GraphQL 요청은 새 콘텐츠 신호로 보지 않음
+        if is_feed_request(request):
+            self._inflight += 1
+
+    def _on_request_done(self, request) -> None:
+        if is_feed_request(request):
+            self._inflight = max(0, self._inflight - 1)
+            self._finished += 1
+
+    async def scroll(self, page) -> bool:
+        """
+        스크롤 후 새 콘텐츠 대기, 신호를 받았으면 True
+        """
+        if not self.adaptive:
+            for _ in range(5):
+                await page.keyboard.press("PageDown")
+                await page.wait_for_timeout(300)
+            await page.wait_for_timeout(1500)
+            return True
+
+        started = time.perf_counter()
+        before = await page.evaluate(_SCROLL_STATE_JS)
+        finished_before = self._finished
+        for _ in range(5):
+            await page.keyboard.press("PageDown")
+
+        signal = False
+        while True:
+            await page.wait_for_timeout(self.poll_ms)
+            waited_ms = (time.perf_counter() - started) * 1000
+            state = await page.evaluate(_SCROLL_STATE_JS)
+            if (state["count"] > before["count"] or state["height"] > before["height"]
+                    or (self._finished > finished_before and self._inflight == 0)):
+                signal = True
+                break
+            if waited_ms >= self.wait_ms:
+                break
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        # 고정 대기보다 오래 걸린 스크롤은 절약 0 (음수로 합산하지 않음)
+        self.time_saved_ms += max(0.0, FIXED_WAIT_MS - elapsed_ms)
+        if signal:
+            self.wait_ms = self.min_wait_ms
+            self.idle_ms = 0
+        else:
+            self.wait_ms = min(int(self.wait_ms * self.backoff), self.max_wait_ms)
+            self.idle_ms += elapsed_ms
+
+        if self.metrics is not None:
+            self.metrics.incr("scrape.scroll_signals" if signal else "scrape.scroll_timeouts")
+            self.metrics.set("scrape.scroll_time_saved_seconds", round(self.time_saved_ms / 1000, 2))
+        return signal
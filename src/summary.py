@@ -0,0 +1,95 @@
+# src/summary.py
+# 분석 결과 요약 누적기 (결과당 O(1) 갱신, 샤드/실행별 부분 요약 병합)
+from collections import Counter
+
+from results import AnalysisResult, RiskLevel
+
+
+class SummaryAccumulator:
+    """
+    generate_summary 와 같은 요약을 결과를 하나씩 추가하며 계산
+    - 위험 등급은 정수 RiskLevel 로 집계 (기존 dict 결과는 risk_level 문자열로 판별)
+    - 위반 유형은 규칙 인덱스로 세고 to_dict() 시에만 이름으로 변환
+    - merge() 로 병렬 워커/다른 실행의 부분 요약을 합침 (추가 순서대로 합친 것과 동일)
+    """
+
+    def __init__(self, ruleset=None):
+        self.ruleset = ruleset
+        self.total = 0
+        self.score_total = 0
+        self.duplicates = 0
+        self.tiers = [0] * len(RiskLevel)
+        # 규칙 인덱스(정수) 또는 "카테고리/하위카테고리"(기존 dict 결과) -> 건수
+        self.violations = Counter()
+
+    def add(self, result) -> None:
+        self.total += 1
+        if isinstance(result, AnalysisResult):
+            if self.ruleset is None:
+                self.ruleset = result.ruleset
+            self.score_total += result.risk_score
+            self.tiers[result.risk_tier] += 1
+            if result.is_duplicate:
+                self.duplicates += 1
+            for index in result.violation_ids():
+                self.violations[index] += 1
+        else:
+            self.score_total += result["risk_score"]
+            tier = RiskLevel.from_label(result["risk_level"])
+            if tier is not None:
+                self.tiers[tier] += 1
+            if result.get("is_duplicate", False):
+                self.duplicates += 1
+            for v in result.get("violations", []):
+                self.violations[f"{v['category']}/{v['subcategory']}"] += 1
+
+    def update(self, results) -> "SummaryAccumulator":
+        for result in results:
+            self.add(result)
+        return self
+
+    def merge(self, other: "SummaryAccumulator") -> "SummaryAccumulator":
+        """
+        다른 부분 요약을 이 요약 뒤에 이어 붙임
+        """
+        if self.ruleset is None:
+            self.ruleset = other.ruleset
+        self.total += other.total
+        self.score_total += other.score_total
+        self.duplicates += other.duplicates
+        self.tiers = [a + b for a, b in zip(self.tiers, other.tiers)]
+        self.violations.update(other.violations)
+        return self
+
+    def _violation_counts(self) -> Counter:
+        counts = Counter()
+        for key, count in self.violations.items():
+            name = key if isinstance(key, str) else self.ruleset.violation_name(key)
+            counts[name] += count
+        return counts
+
+    def to_dict(self) -> dict:
+        if self.total == 0:
+            return {
+                "total_posts": 0,
+                "critical_count": 0,
+                "high_risk_count": 0,
+                "medium_risk_count": 0,
+                "low_risk_count": 0,
+                "safe_count": 0,
+                "duplicate_count": 0,
+                "average_risk_score": 0,
+                "top_violations": []
+            }
+
+        return {
+            "total_posts": self.total,
+            "critical_count": self.tiers[RiskLevel.CRITICAL],
+            "high_risk_count": self.tiers[RiskLevel.HIGH],
+            "medium_risk_count": self.tiers[RiskLevel.MEDIUM],
+            "low_risk_count": self.tiers[RiskLevel.LOW],
+            "safe_count": self.tiers[RiskLevel.SAFE],
+            "duplicate_count": self.duplicates,
+            "average_risk_score": round(self.score_total / self.total, 1),
+            "top_violations": self._violation_counts().most_common(5)
+        }
@@ -0,0 +1,82 @@
+# src/summary_export.py
+# 분석 요약 출력/summary.txt 저장 (단일 계정 + 여러 계정 합산)
+
+
+def print_summary(summary: dict) -> None:
+    print("\n" + "=" * 70)
+    print("분석 결과 요약")
+    print("=" * 70)
+    print(f"총 게시물: {summary['total_posts']}개")
+    print(f"🔴 매우 높음 (삭제 가능성): {summary['critical_count']}개")
+    print(f"🟠 높음 (경고/제한 가능성): {summary['high_risk_count']}개")
+    print(f"🟡 중간 (주의 필요): {summary['medium_risk_count']}개")
+    print(f"🟢 낮음: {summary['low_risk_count']}개")
+    print(f"✅ 안전: {summary['safe_count']}개")
+    print(f"반복/중복: {summary['duplicate_count']}개")
+    print(f"평균 위험 점수: {summary['average_risk_score']}/100")
+
+    if summary['top_violations']:
+        print("\n[주요 위반 유형]")
+        for violation, count in summary['top_violations']:
+            print(f"  • {violation}: {count}건")
+
+
+def _write_overview(f, summary: dict) -> None:
+    f.write(f"### 요약\n")
+    f.write(f"- 총 게시물: **{summary['total_posts']}개**\n")
+    f.write(f"- 🔴 매우 높음: **{summary['critical_count']}개**\n")
+    f.write(f"- 🟠 높음: **{summary['high_risk_count']}개**\n")
+    f.write(f"- 🟡 중간: **{summary['medium_risk_count']}개**\n")
+    f.write(f"- 🟢 낮음: **{summary['low_risk_count']}개**\n")
+    f.write(f"- ✅ 안전: **{summary['safe_count']}개**\n")
+    f.write(f"- 반복/중복: **{summary['duplicate_count']}개**\n")
+    f.write(f"- 평균 위험 점수: **{summary['average_risk_score']}/100**\n\n")
+
+    if summary['top_violations']:
+        f.write(f"### 주요 위반 유형\n")
+        for violation, count in summary['top_violations']:
+            f.write(f"- {violation}: {count}건\n")
+        f.write("\n")
+
+
+def write_summary_file(summary: dict, results: list, summary_path: str) -> None:
+    """
+    계정 1개의 요약 + 주의 필요 게시물 상위 10개
+    """
+    with open(summary_path, "w", encoding="utf-8") as f:
+        f.write(f"# Threads 게시물 가이드라인 분석 결과\n\n")
+        _write_overview(f, summary)
+
+        critical_posts = sorted(results, key=lambda x: x["risk_score"], reverse=True)[:10]
+        if critical_posts and critical_posts[0]["risk_score"] > 0:
+            f.write(f"### ⚠️ 주의 필요 게시물 (상위 10개)\n\n")
+            for i, post in enumerate(critical_posts, 1):
+                if post["risk_score"] > 0:
+                    text_preview = post["text"][:80].replace("\n", " ") + "..."
+                    f.write(f"**{i}. {post['risk_level']}** (점수: {post['risk_score']})\n")
+                    f.write(f"- 내용: {text_preview}\n")
+                    f.write(f"- 날짜: {post['datetime'][:10] if post['datetime'] else 'N/A'}\n")
+                    if post.get("recommendations"):
+                        f.write(f"- 권고: {post['recommendations'][0][:80]}...\n")
+                    f.write("\n")
+
+
+def write_combined_summary(summary: dict, accounts: list, summary_path: str) -> None:
+    """
+    여러 계정 합산 요약 + 계정별 표
+    accounts: [{"username", "start_date", "end_date", "status", "summary"(없을 수 있음)}]
+    """
+    with open(summary_path, "w", encoding="utf-8") as f:
+        f.write(f"# Threads 게시물 가이드라인 분석 결과 (계정 {len(accounts)}개)\n\n")
+        _write_overview(f, summary)
+
+        f.write("### 계정별 결과\n\n")
+        f.write("| 계정 | 기간 | 상태 | 게시물 | 🔴 | 🟠 | 평균 점수 |\n")
+        f.write("|------|------|------|--------|----|----|-----------|\n")
+        for account in accounts:
+            part = account.get("summary")
+            counts = (f"{part['total_posts']} | {part['critical_count']} | {part['high_risk_count']} | "
+                      f"{part['average_risk_score']}") if part else "- | - | - | -"
+            f.write(f"| @{account['username']} | {account['start_date']} ~ {account['end_date']} | "
+                    f"{account['status']} | {counts} |\n")
+        f.write("\n")
@@ -1,5 +1,7 @@
 # src/utils.py
+import hashlib
 import re
+import unicodedata
 from datetime import datetime
 from typing import List, Dict
 
@@ -15,6 +17,32 @@ def clean_text(text: str) -> str:
     text = text.strip()
     return text
 
+# 중복 비교 시 제거하는 유니코드 분류 (문장부호, 기호/이모지, 서식/결합 문자)
+_FOLDED_CATEGORIES = {
+    "Pc", "Pd", "Ps", "Pe", "Pi", "Pf", "Po",
+    "Sm", "Sc", "Sk", "So",
+    "Cf", "Mn"
+}
+
+def normalize_text(text: str) -> str:
+    """
+    중복 비교용 정규화 (공백 정리 + 유니코드 호환 정규화 + 소문자
+    + 문장부호/기호/이모지/제어 문자 제거)
+    """
+    text = unicodedata.normalize("NFKC", clean_text(text)).lower()
+    text = "".join(ch for ch in text if unicodedata.category(ch) not in _FOLDED_CATEGORIES)
+    return clean_text(text)
+
+def text_fingerprint(text: str) -> str:
+    """
+    정규화된 텍스트의 해시 (완전 중복 판별용)
+    정규화 결과가 비어 있으면 빈 문자열 반환
+    """
+    normalized = normalize_text(text)
+    if not normalized:
+        return ""
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
 def extract_hashtags(text: str) -> List[str]:
     """
     텍스트에서 해시태그 추출
@@ -4,6 +4,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from analyzer import GuidelineAnalyzer, generate_summary
+from keyword_matcher import KeywordAutomaton
 
 def test_basic_analysis():
     """
@@ -88,6 +89,275 @@ def test_duplicate_detection():
     print("✅ 중복 탐지 테스트 통과\n")
 
 
+def test_exact_duplicate_groups():
+    """
+    정규화 해시 기반 완전 중복 그룹 테스트 (공백/문장부호/이모지 차이 무시)
+    """
+    analyzer = GuidelineAnalyzer()
+    
+    posts = [
+        {"text": "법인 스팩업 기억해\n\n- 소부장인증 가자 -"},
+        {"text": "법인 스팩업   기억해 🔥\n소부장인증 가자!!"},
+        {"text": "오늘 점심 뭐 먹지?"},
+        {"text": "👍"},
+        {"text": "🔥"},
+    ]
+    
+    results = analyzer.analyze_all_posts(posts)
+    
+    print("=== 완전 중복 그룹 테스트 ===")
+    for i, r in enumerate(results):
+        print(f"게시물 {i+1}: 중복={r['duplicate_count']}, 그룹={r['duplicate_group_size']}")
+    
+    assert results[0]['duplicate_group_size'] == 2 and results[1]['duplicate_group_size'] == 2
+    assert results[0]['duplicate_count'] == 1 and results[1]['is_duplicate']
+    assert results[2]['duplicate_group_size'] == 1 and not results[2]['is_duplicate']
+    # 정규화 후 빈 텍스트는 서로 묶지 않음
+    assert not results[3]['is_duplicate'] and not results[4]['is_duplicate']
+    print("✅ 완전 중복 그룹 테스트 통과\n")
+
+
+def test_duplicate_similarity_meaning():
+    """
+    중복 유사도 기준 테스트 (정규화 텍스트 기준, 그룹 구성원도 실제 쌍의 값과 같음, 일괄/스트리밍 동일)
+    """
+    from difflib import SequenceMatcher
+    from dedup import IncrementalDuplicateIndex, comparable_text
+    
+    texts = [
+        "기업 설립한지 얼마 안되고 업종만 괜찮으면 법인 스팩업 기억해!!",
+        "🔥🔥 기업!! 설립한지... 얼마 안되고?? 업종만 괜찮으면!!! 법인 스팩업 기억해 🔥🔥🔥 ‼️‼️ ~~~ ###",
+        "기업 설립한지 얼마 안되고 업종만 괜찮으면 법인 스팩업 기억하세요",
+        "오늘 점심 뭐 먹지? 날씨가 좋네요.",
+    ]
+    
+    def similarity(i, j):
+        return round(SequenceMatcher(None, comparable_text(texts[i]), comparable_text(texts[j])).ratio() * 100, 1)
+    
+    batch = GuidelineAnalyzer()._find_all_duplicates(texts)
+    index = IncrementalDuplicateIndex()
+    stream = [index.add(text) for text in texts]
+    
+    print("=== 중복 유사도 기준 테스트 ===")
+    for i, (duplicates, group_size) in enumerate(batch):
+        print(f"게시물 {i+1}: {duplicates}, 그룹={group_size}")
+    
+    expected = [{j for j in range(len(texts)) if j != i and similarity(i, j) >= 80} for i in range(len(texts))]
+    assert [{d["index"] for d in duplicates} for duplicates, _ in batch] == expected
+    for i, (duplicates, _) in enumerate(batch):
+        assert all(d["similarity"] == similarity(i, d["index"]) for d in duplicates)
+        # 스트리밍은 앞선 게시물과의 중복만 반환
+        assert stream[i][0] == [d for d in duplicates if d["index"] < i]
+    # 원문 유사도는 0.8 미만이어도 정규화 텍스트가 비슷하면 중복으로 셈
+    assert SequenceMatcher(None, texts[1], texts[2]).ratio() < 0.8 and 2 in expected[1]
+    print("✅ 중복 유사도 기준 테스트 통과\n")
+
+
+def test_near_duplicate_candidates():
+    """
+    MinHash/LSH 유사 후보 탐색 테스트
+    """
+    from dedup import candidate_sets
+    
+    texts = [
+        "기업 설립한지 얼마 안되고 업종만 괜찮으면 법인 스팩업 기억해",
+        "기업 설립한지 얼마 안되고 업종만 괜찮으면 법인 스팩업 기억하세요",
+        "오늘 점심 뭐 먹지? 날씨가 좋네요.",
+    ]
+    
+    candidates = candidate_sets(texts)
+    
+    print("=== 유사 후보 탐색 테스트 ===")
+    print(f"후보: {candidates}")
+    
+    assert 1 in candidates[0] and 0 in candidates[1]
+    assert 0 not in candidates[2] and 1 not in candidates[2]
+    print("✅ 유사 후보 탐색 테스트 통과\n")
+
+
+def test_cross_run_duplicates():
+    """
+    실행 간 중복 탐지 테스트 (지문 DB)
+    """
+    import tempfile
+    from fingerprint_store import FingerprintIndex
+    
+    db_path = os.path.join(tempfile.mkdtemp(), "fingerprints.sqlite")
+    first_run = [
+        {"text": "기업 설립한지 얼마 안되고 업종만 괜찮으면 법인 스팩업 기억해", "link": "https://threads.net/@test/post/1"},
+        {"text": "오늘 점심 뭐 먹지? 날씨가 좋네요.", "link": "https://threads.net/@test/post/2"},
+    ]
+    second_run = [
+        {"text": "기업 설립한지 얼마 안되고 업종만 괜찮으면 법인 스팩업 기억하세요", "link": "https://threads.net/@test/post/3"},
+        {"text": "오늘 점심 뭐 먹지? 날씨가 좋네요.", "link": "https://threads.net/@test/post/2"},
+    ]
+    
+    with FingerprintIndex(db_path, "test") as index:
+        GuidelineAnalyzer(fingerprint_index=index).analyze_all_posts(first_run)
+    with FingerprintIndex(db_path, "test") as index:
+        results = GuidelineAnalyzer(fingerprint_index=index).analyze_all_posts(second_run)
+        stored = index.count()
+    
+    print("=== 실행 간 중복 탐지 테스트 ===")
+    for i, r in enumerate(results):
+        print(f"게시물 {i+1}: 이전 중복={r['history_duplicate_count']}, 중복={r['is_duplicate']}")
+    
+    assert results[0]['history_duplicate_count'] == 1 and results[0]['is_duplicate']
+    # 같은 게시물을 다시 분석한 경우는 중복이 아님
+    assert results[1]['history_duplicate_count'] == 0 and not results[1]['is_duplicate']
+    assert stored == 3
+    print("✅ 실행 간 중복 탐지 테스트 통과\n")
+
+
+def test_parallel_analysis():
+    """
+    병렬 분석 결과가 단일 처리와 동일한지 테스트
+    """
+    analyzer = GuidelineAnalyzer()
+    
+    posts = [
+        {"text": "기업 설립한지 얼마 안되고\n업종만 괜찮으면\n법인 스팩업 기억해", "link": f"https://threads.net/@test/post/{i}"}
+        if i % 3 == 0 else
+        {"text": f"오늘 점심 뭐 먹지? {i}번째 고민 중. DM 주세요", "link": f"https://threads.net/@test/post/{i}"}
+        for i in range(12)
+    ]
+    
+    serial = analyzer.analyze_all_posts(posts)
+    parallel = analyzer.analyze_all_posts(posts, workers=2)
+    
+    print("=== 병렬 분석 테스트 ===")
+    print(f"게시물: {len(posts)}개, 동일 결과: {serial == parallel}")
+    
+    assert serial == parallel
+    print("✅ 병렬 분석 테스트 통과\n")
+
+
+def test_stream_analysis():
+    """
+    스트리밍 분석 테스트 (이전 게시물과의 증분 중복 검사)
+    """
+    analyzer = GuidelineAnalyzer()
+    
+    posts = [
+        {"text": "이것은 테스트 게시물입니다. 반복됩니다."},
+        {"text": "완전히 다른 게시물입니다."},
+        {"text": "이것은 테스트 게시물입니다. 반복됩니다!!"},
+        {"text": "이것은 테스트 게시물입니다. 반복됩니다요."},
+    ]
+    
+    stream = analyzer.analyze_stream(iter(posts))
+    first = next(stream)
+    rest = list(stream)
+    
+    print("=== 스트리밍 분석 테스트 ===")
+    for i, r in enumerate([first] + rest):
+        print(f"게시물 {i+1}: 중복={r['duplicate_count']}")
+    
+    assert first['duplicate_count'] == 0
+    assert rest[0]['duplicate_count'] == 0
+    assert rest[1]['duplicate_count'] == 1 and rest[1]['duplicate_group_size'] == 2
+    assert rest[2]['duplicate_count'] == 2
+    print("✅ 스트리밍 분석 테스트 통과\n")
+
+
+def test_analysis_cache():
+    """
+    분석 결과 캐시 테스트 (적중 시 동일 결과, LRU 크기 제한)
+    """
+    import tempfile
+    from analysis_cache import AnalysisCache
+    
+    db_path = os.path.join(tempfile.mkdtemp(), "analysis_cache.sqlite")
+    post = {"text": "법인 스팩업 기억해\n업종만 괜찮으면 소부장인증 가자", "link": "https://threads.net/@test/post/1"}
+    expected = GuidelineAnalyzer().analyze_post(post)
+    
+    with AnalysisCache(db_path) as cache:
+        GuidelineAnalyzer(cache=cache).analyze_post(post)
+    with AnalysisCache(db_path, max_entries=2) as cache:
+        analyzer = GuidelineAnalyzer(cache=cache)
+        result = analyzer.analyze_post(post)
+        hits = cache.hits
+        for i in range(5):
+            analyzer.analyze_post({"text": f"다른 게시물 {i}"})
+        size = len(cache)
+    
+    print("=== 분석 캐시 테스트 ===")
+    print(f"적중: {hits}, 캐시 크기: {size}")
+    
+    assert hits == 1
+    assert result == expected
+    assert size <= 2
+    print("✅ 분석 캐시 테스트 통과\n")
+
+
+def test_batch_risk_scoring():
+    """
+    NumPy 일괄 위험 점수가 게시물별 계산과 같은지 테스트 (조합 보너스 포함)
+    """
+    analyzer = GuidelineAnalyzer()
+    rules = analyzer.compiled.subcategories
+    by_name = analyzer.compiled.by_name
+    
+    detected = [
+        [],
+        [by_name["직업_사기"].index],
+        [by_name["직업_사기"].index, by_name["반복_게시"].index],
+        [by_name["가짜_문서_사기"].index, by_name["참여_유도"].index, by_name["기만적_링크"].index],
+        list(range(len(rules))),
+    ]
+    
+    batch_scores = analyzer.batch_scorer.score(detected)
+    expected = [
+        analyzer._calculate_risk_score(
+            [(rules[i].category, rules[i].subcategory) for i in indices],
+            [{"base_score": rules[i].base_score} for i in indices]
+        )
+        for indices in detected
+    ]
+    
+    print("=== 일괄 위험 점수 테스트 ===")
+    print(f"일괄: {batch_scores}, 개별: {expected}")
+    
+    assert batch_scores == expected
+    assert batch_scores[2] == 100
+    print("✅ 일괄 위험 점수 테스트 통과\n")
+
+
+def test_compact_results():
+    """
+    정수 기반 분석 결과가 기존 dict 결과와 같은 값을 내보내는지 테스트
+    """
+    import pickle
+    from results import RiskLevel
+    
+    analyzer = GuidelineAnalyzer()
+    posts = [
+        {"text": "세무사 없이도 쉽게 정책자금 받을 수 있습니다! 100% 보장! DM 주세요", "link": "a"},
+        {"text": "세무사 없이도 쉽게 정책자금 받을 수 있습니다! 100% 보장! DM 주세요", "link": "b"},
+        {"text": "오늘 점심 맛있었다", "link": "c"},
+    ]
+    results = analyzer.analyze_all_posts(posts)
+    first = results[0]
+    
+    print("=== 정수 기반 결과 테스트 ===")
+    print(f"매칭: {first.matches}, 등급: {first.risk_tier!r}")
+    
+    assert first.risk_tier == RiskLevel.from_score(first.risk_score)
+    assert first["risk_level"] == first.risk_tier.label
+    assert first.violations[-1]["subcategory"] == "반복_게시"
+    assert first.recommendations[-1] == "⚠️ [스팸 탐지] 동일/유사 문구 반복 게시 금지"
+    assert first.to_dict()["is_duplicate"] is True
+    assert results[2].to_dict()["violations"] == []
+    assert results[2].risk_tier == RiskLevel.SAFE
+    
+    # 프로세스 간 전달 시 규칙 테이블은 빠지고 값은 유지
+    restored = pickle.loads(pickle.dumps(first))
+    assert restored.ruleset is None and restored == first
+    restored.ruleset = analyzer.compiled
+    assert restored.to_dict() == first.to_dict()
+    print("✅ 정수 기반 결과 테스트 통과\n")
+
+
 def test_summary_generation():
     """
     요약 생성 테스트
@@ -114,6 +384,1040 @@ def test_summary_generation():
     print("✅ 요약 생성 테스트 통과\n")
 
 
+def test_summary_merge():
+    """
+    부분 요약 병합 결과가 전체 요약과 같은지 테스트
+    """
+    from summary import SummaryAccumulator
+    
+    analyzer = GuidelineAnalyzer()
+    posts = [
+        {"text": "세무사 없이도 쉽게 정책자금 받을 수 있습니다! 100% 보장!", "link": "a"},
+        {"text": "세무사 없이도 쉽게 정책자금 받을 수 있습니다! 100% 보장!", "link": "b"},
+        {"text": "DM 주세요 좋아요 누르면 자료 드립니다", "link": "c"},
+        {"text": "오늘 점심 맛있었다", "link": "d"},
+    ]
+    results = analyzer.analyze_all_posts(posts)
+    
+    first = SummaryAccumulator().update(results[:2])
+    second = SummaryAccumulator().update(results[2:])
+    merged = first.merge(second).to_dict()
+    
+    print("=== 요약 병합 테스트 ===")
+    print(f"병합 요약: {merged}")
+    
+    assert merged == generate_summary(results)
+    assert merged == generate_summary([r.to_dict() for r in results])
+    assert merged['duplicate_count'] == 2
+    assert SummaryAccumulator().merge(SummaryAccumulator()).to_dict()['total_posts'] == 0
+    print("✅ 요약 병합 테스트 통과\n")
+
+
+def test_metrics():
+    """
+    분석 단계별 계측 테스트
+    """
+    from metrics import Metrics
+    
+    metrics = Metrics()
+    analyzer = GuidelineAnalyzer(metrics=metrics)
+    posts = [{"text": f"DM 주세요 자료 {i}번 드립니다", "link": str(i)} for i in range(5)]
+    analyzer.analyze_all_posts(posts)
+    report = metrics.to_dict()
+    
+    print("=== 계측 테스트 ===")
+    print(f"spans: {list(report['spans'])}, counters: {report['counters']}")
+    
+    assert report["counters"]["analysis.posts"] == 5
+    assert report["spans"]["analysis.rules"]["count"] == 1
+    assert report["spans"]["analysis.duplicates"]["count"] == 1
+    assert "analysis.history" not in report["spans"]
+    assert metrics.rate("analysis.posts", "analysis.rules") > 0
+    print("✅ 계측 테스트 통과\n")
+
+
+def test_feed_capture():
+    """
+    피드 JSON 응답에서 게시물/참여 수 추출 테스트
+    """
+    import json
+    from feed_capture import FeedCapture
+    
+    node = {
+        "pk": "1", "code": "C1abc", "taken_at": 1735689600, "like_count": 12,
+        "caption": {"text": "법인 스팩업 기억해"}, "user": {"username": "just_followtax"},
+        "text_post_app_info": {"direct_reply_count": 3, "repost_count": 2}
+    }
+    payload = {"data": {"mediaData": {"edges": [
+        {"node": {"thread_items": [{"post": node}, {"post": dict(node, code="C2def", caption=None)}]}}
+    ]}}}
+    
+    capture = FeedCapture()
+    added = capture.feed_json("for (;;);" + json.dumps(payload))
+    capture.feed_json(json.dumps(payload))
+    posts = capture.drain()
+    
+    print("=== 피드 응답 수집 테스트 ===")
+    print(f"수집: {posts}")
+    
+    assert added == 1 and len(posts) == 1
+    assert posts[0]["link"] == "https://www.threads.net/@just_followtax/post/C1abc"
+    assert posts[0]["datetime"] == "2025-01-01T00:00:00.000Z"
+    assert (posts[0]["likes"], posts[0]["replies"], posts[0]["reposts"]) == (12, 3, 2)
+    assert capture.drain() == []
+    
+    html = '<script type="application/json" data-sjs>' + json.dumps(payload) + '</script>'
+    assert FeedCapture().feed_html(html) == 1
+    print("✅ 피드 응답 수집 테스트 통과\n")
+
+
+def test_scroll_scheduler():
+    """
+    적응형 스크롤 대기 테스트 (신호가 오면 바로 진행, 없을 때만 대기 시간 증가)
+    """
+    import asyncio
+    from scroll_scheduler import ScrollScheduler
+    
+    class FakePage:
+        def __init__(self):
+            self.count = 0
+            self.grow = True
+            self.keyboard = self
+        
+        async def press(self, key):
+            pass
+        
+        async def wait_for_timeout(self, ms):
+            await asyncio.sleep(ms / 1000)
+            if self.grow:
+                self.count += 1
+        
+        async def evaluate(self, script):
+            return {"count": self.count, "height": 1000}
+    
+    page = FakePage()
+    scheduler = ScrollScheduler(min_wait_ms=20, max_wait_ms=60, backoff=2, poll_ms=5, stuck_timeout_ms=100)
+    
+    got_signal = asyncio.run(scheduler.scroll(page))
+    page.grow = False
+    waits = []
+    while not scheduler.exhausted:
+        asyncio.run(scheduler.scroll(page))
+        waits.append(scheduler.wait_ms)
+    
+    print("=== 적응형 스크롤 테스트 ===")
+    print(f"신호 후 대기: {waits}, 절약: {scheduler.time_saved_ms:.0f}ms")
+    
+    assert got_signal
+    assert waits[:3] == [40, 60, 60]
+    assert scheduler.idle_ms >= 100
+    assert scheduler.time_saved_ms > 0
+    
+    page.grow = True
+    assert asyncio.run(scheduler.scroll(page))
+    assert scheduler.wait_ms == 20 and not scheduler.exhausted
+    
+    # 피드 쿼리만 완료 신호로 사용 (좋아요/로깅 GraphQL 요청 제외)
+    class FakeRequest:
+        def __init__(self, name, post_data=""):
+            self.url = "https://www.threads.net/graphql/query"
+            self.headers = {"x-fb-friendly-name": name} if name else {}
+            self.post_data = post_data
+    
+    for request in (FakeRequest("useBarcelonaLikeMutationLikeMutation"),
+                    FakeRequest("", "av=1&fb_api_req_friendly_name=BarcelonaLoggingQuery&doc_id=2"),
+                    FakeRequest("BarcelonaProfileThreadsTabRefetchableDirectQuery"),
+                    FakeRequest("", "av=1&fb_api_req_friendly_name=BarcelonaProfileThreadsTabQuery&doc_id=1")):
+        scheduler._on_request(request)
+        scheduler._on_request_done(request)
+    assert scheduler._finished == 2 and scheduler._inflight == 0
+    print("✅ 적응형 스크롤 테스트 통과\n")
+
+
+def test_resource_blocker():
+    """
+    크롤링 요청 차단 규칙 테스트 (피드 API 는 항상 허용)
+    """
+    from resource_blocker import ResourceBlocker
+    
+    blocker = ResourceBlocker(enabled=True)
+    
+    print("=== 요청 차단 규칙 테스트 ===")
+    
+    assert blocker.should_block("https://scontent.cdninstagram.com/a.jpg", "image")
+    assert blocker.should_block("https://www.threads.net/font.woff2", "font")
+    assert blocker.should_block("https://www.googletagmanager.com/gtm.js", "script")
+    assert not blocker.should_block("https://www.threads.net/static/app.js", "script")
+    assert not blocker.should_block("https://www.threads.net/graphql/query", "fetch")
+    assert not blocker.should_block("https://www.threads.net/api/graphql", "xhr")
+    # /api/ 아래 로깅 요청은 차단
+    assert blocker.should_block("https://www.threads.net/api/v1/logging_client_events/", "xhr")
+    assert not blocker.should_block("https://www.threads.net/@user", "document")
+    assert ResourceBlocker().launch_args == [] and blocker.launch_args
+    print("✅ 요청 차단 규칙 테스트 통과\n")
+
+
+def test_crawl_checkpoint():
+    """
+    크롤링 체크포인트 재개 테스트 (중간에 끊긴 마지막 줄 무시)
+    """
+    import tempfile
+    from checkpoint import CrawlCheckpoint
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        first = CrawlCheckpoint(tmp, "@tester", "2025-01-01", "2025-01-31")
+        assert not first.load()
+        first.start()
+        first.add_pinned(["https://www.threads.net/@tester/post/P"])
+        first.add_post({"text": "첫 게시물", "link": "https://www.threads.net/@tester/post/A"})
+        first.add_seen(["https://www.threads.net/@tester/post/A", "https://www.threads.net/@tester/post/OLD"])
+        first.save_state(consecutive_old=3)
+        first.close()
+        with open(first.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "post", "po')
+        
+        resumed = CrawlCheckpoint(tmp, "tester", "2025-01-01", "2025-01-31")
+        
+        print("=== 크롤링 체크포인트 테스트 ===")
+        
+        assert resumed.load()
+        assert [p["link"] for p in resumed.posts] == ["https://www.threads.net/@tester/post/A"]
+        assert len(resumed.seen_links) == 2 and len(resumed.pinned_links) == 1
+        assert resumed.consecutive_old == 3
+        
+        # 중단된 실행이 결과를 내보낸 게시물은 재개 시 다시 분석하지 않음 (닫힌 뒤에도 기록)
+        assert not resumed.is_open
+        resumed.mark_analyzed(["https://www.threads.net/@tester/post/A"])
+        reloaded = CrawlCheckpoint(tmp, "tester", "2025-01-01", "2025-01-31")
+        assert reloaded.load() and reloaded.analyzed_links == {"https://www.threads.net/@tester/post/A"}
+        
+        resumed.start()
+        assert resumed.is_open
+        resumed.add_post({"text": "두 번째", "link": "https://www.threads.net/@tester/post/B"})
+        resumed.finish()
+        
+        finished = CrawlCheckpoint(tmp, "tester", "2025-01-01", "2025-01-31")
+        assert not finished.load() and finished.done and len(finished.posts) == 2
+    print("✅ 크롤링 체크포인트 테스트 통과\n")
+
+
+def test_high_water_marks():
+    """
+    계정별 최신 수집 기록 테스트 (요청 기간을 덮는 기록만 증분 크롤링에 사용)
+    """
+    import tempfile
+    from crawl_state import HighWaterMarkStore
+    
+    base = "https://www.threads.net/@tester/post/"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "marks.json")
+        store = HighWaterMarkStore(path)
+        assert store.stop_point("tester", "2025-01-01") is None
+        
+        store.update("@tester", [
+            {"link": base + "A", "datetime": "2025-03-01T10:00:00.000Z"},
+            {"link": base + "B", "datetime": "2025-03-05T09:00:00.000Z"},
+            {"link": base + "C", "datetime": ""},
+        ], "2025-01-01", "2025-12-31")
+        
+        print("=== 최신 수집 기록 테스트 ===")
+        
+        reloaded = HighWaterMarkStore(path)
+        point = reloaded.stop_point("tester", "2025-02-01")
+        print(f"기준: {point}")
+        assert point["link"] == base + "B" and point["datetime"].day == 5
+        # 기록보다 이전 기간을 요청하면 전체 크롤링
+        assert reloaded.stop_point("tester", "2024-06-01") is None
+        
+        # 이어지는 증분 실행은 최신 게시물만 갱신하고 시작일은 유지
+        reloaded.update("tester", [{"link": base + "D", "datetime": "2025-03-10T00:00:00.000Z"}],
+                        "2025-02-01", "2025-12-31")
+        assert reloaded.get("tester")["link"] == base + "D"
+        assert reloaded.get("tester")["covered_since"] == "2025-01-01"
+        
+        # 기록과 겹치지 않는 과거 기간만 수집했으면 그대로 유지
+        reloaded.update("tester", [{"link": base + "OLD", "datetime": "2024-01-10T00:00:00.000Z"}],
+                        "2024-01-01", "2024-02-01")
+        assert reloaded.get("tester")["link"] == base + "D"
+    print("✅ 최신 수집 기록 테스트 통과\n")
+
+
+def test_partial_crawl_high_water_mark():
+    """
+    시작일에 닿기 전에 멈춘 크롤링 테스트 (실제로 본 날짜까지만 덮은 것으로 기록)
+    """
+    import asyncio
+    import tempfile
+    from crawl_state import HighWaterMarkStore
+    from rate_limiter import RateLimiter
+    from resource_blocker import ResourceBlocker
+    from scraper import ThreadsScraper
+    
+    base = "https://www.threads.net/@tester/post/"
+    
+    class FakePage:
+        async def click(self, selector):
+            pass
+        
+        async def wait_for_timeout(self, ms):
+            pass
+        
+        def is_closed(self):
+            return False
+        
+        async def close(self):
+            pass
+    
+    class FakePool:
+        rate_limiter = RateLimiter(rate_per_second=0)
+        resource_blocker = ResourceBlocker()
+        login_generation = 0
+        
+        async def start(self):
+            pass
+        
+        async def new_page(self):
+            return FakePage()
+    
+    class FakeScheduler:
+        metrics = None
+        exhausted = False
+        
+        def reset(self):
+            pass
+        
+        def attach(self, page):
+            pass
+        
+        async def scroll(self, page):
+            pass
+    
+    def crawl(store, feed):
+        scraper = ThreadsScraper("tester", "2025-01-01", "2025-12-31", skip_pinned=0, extraction_mode="html",
+                                 scroll_scheduler=FakeScheduler(), high_water_marks=store,
+                                 browser_pool=FakePool())
+        
+        async def load_profile(page, limiter):
+            pass
+        
+        async def logged_in(page):
+            return True
+        
+        async def extract(page):
+            return feed, len(feed)
+        
+        scraper._load_profile = load_profile
+        scraper._check_login_status = logged_in
+        scraper._extract_posts = extract
+        return asyncio.run(scraper.scrape_posts())
+    
+    # 3월 20일 ~ 3월 10일 게시물까지만 로드되고 더 내려가지 않음 (새 게시물 없음으로 종료)
+    stuck_feed = [{"link": base + f"S{day}", "text": "본문", "datetime": f"2025-03-{day:02d}T12:00:00.000Z"}
+                  for day in range(20, 9, -1)]
+    # 시작일 이전 게시물이 연속으로 나와 정상 종료
+    full_feed = stuck_feed + [{"link": base + f"O{i}", "text": "본문", "datetime": "2024-12-01T12:00:00.000Z"}
+                              for i in range(20)]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        stuck_store = HighWaterMarkStore(os.path.join(tmp, "stuck.json"))
+        assert len(crawl(stuck_store, stuck_feed)) == 11
+        full_store = HighWaterMarkStore(os.path.join(tmp, "full.json"))
+        assert len(crawl(full_store, full_feed)) == 11
+    
+    print("=== 중간에 멈춘 크롤링 기록 테스트 ===")
+    print(f"멈춘 크롤링: {stuck_store.get('tester')}")
+    
+    assert stuck_store.get("tester")["link"] == base + "S20"
+    assert stuck_store.get("tester")["covered_since"] == "2025-03-11"
+    # 기록이 덮지 못한 기간을 요청하면 전체 크롤링
+    assert stuck_store.stop_point("tester", "2025-02-01") is None
+    assert stuck_store.stop_point("tester", "2025-03-15") is not None
+    assert full_store.get("tester")["covered_since"] == "2025-01-01"
+    print("✅ 중간에 멈춘 크롤링 기록 테스트 통과\n")
+
+
+def test_extraction_modes():
+    """
+    게시물 추출 방식 비교 테스트 (incremental 은 새 게시물만 1회씩, 모아 보면 html 전체 재파싱과 같음)
+    """
+    import asyncio
+    from bs4 import BeautifulSoup
+    from scraper import ThreadsScraper
+    
+    def container(code, text, day):
+        return (
+            '<div data-pressable-container="true">'
+            f'<a href="/@tester"><span><span>tester</span></span></a>'
+            f'<a href="/@tester/post/{code}"><time datetime="2025-03-{day:02d}T12:00:00.000Z">{day}일</time></a>'
+            f'<div class="x1a6qonq"><span><span> {text} </span></span><span><span>둘째 줄</span></span></div>'
+            '</div>'
+        )
+    
+    # 스크롤마다 보이는 컨테이너 (가상 스크롤로 B 는 다시 렌더링되어 표시가 없는 새 노드로 나타남)
+    snapshots = [
+        [container("A", "첫 글", 20), container("B", "둘째 글", 19)],
+        [container("B", "둘째 글", 19), container("C", "셋째 글", 18)],
+        [container("C", "셋째 글", 18), container("D", "넷째 글", 17), '<div data-pressable-container="true"></div>'],
+    ]
+    
+    class FakePage:
+        """
+        _EXTRACT_NEW_POSTS_JS 대신: 표시 없는 컨테이너만 읽고 표시
+        """
+        def __init__(self):
+            self.step = 0
+            self.marked = set()
+        
+        async def content(self):
+            return "<html><body>" + "".join(snapshots[self.step]) + "</body></html>"
+        
+        async def evaluate(self, script):
+            scraper = ThreadsScraper("tester", "2025-01-01", "2025-12-31")
+            items = []
+            for i, html in enumerate(snapshots[self.step]):
+                element = BeautifulSoup(html, "html.parser").select_one('[data-pressable-container="true"]')
+                post = scraper._extract_post_from_element(element)
+                if (self.step, i) in self.marked or not post or not post["link"]:
+                    continue
+                self.marked.add((self.step, i))
+                items.append({"href": element.select_one('a[href*="/post/"]')["href"], "text": post["text"],
+                              "datetime": post["datetime"], "username": post["username"]})
+            return items
+    
+    def run(mode):
+        scraper = ThreadsScraper("tester", "2025-01-01", "2025-12-31", extraction_mode=mode)
+        page = FakePage()
+        extracted = []
+        
+        async def scroll_all():
+            for step in range(len(snapshots)):
+                page.step = step
+                extracted.append(await scraper._extract_posts(page))
+        asyncio.run(scroll_all())
+        return scraper, extracted
+    
+    html_scraper, html_runs = run("html")
+    incremental_scraper, incremental_runs = run("incremental")
+    
+    def fields(post):
+        return {key: post[key] for key in ("username", "text", "datetime", "link")}
+    
+    html_posts = {}
+    for posts, _ in html_runs:
+        for post in posts:
+            html_posts.setdefault(post["link"], fields(post))
+    incremental_posts = [fields(post) for posts, _ in incremental_runs for post in posts]
+    
+    print("=== 게시물 추출 방식 비교 테스트 ===")
+    print(f"html: {[len(posts) for posts, _ in html_runs]}, incremental: {[len(posts) for posts, _ in incremental_runs]}")
+    
+    # 다시 렌더링된 게시물도 1회만 반환하고, 모으면 html 모드와 같은 게시물/필드
+    assert [len(posts) for posts, _ in incremental_runs] == [2, 1, 1]
+    assert incremental_posts == list(html_posts.values())
+    assert incremental_posts[0]["text"] == "첫 글\n둘째 줄"
+    assert incremental_posts[0]["link"] == "https://www.threads.net/@tester/post/A"
+    assert [count for _, count in incremental_runs] == [2, 3, 4]
+    
+    # html 모드만 같은 게시물을 매 스크롤 다시 읽으므로 날짜 파싱을 링크별로 기억
+    def count_date_parses(scraper, runs):
+        calls = []
+        parse_date = scraper._parse_date
+        scraper._parse_date = lambda value: calls.append(value) or parse_date(value)
+        for posts, _ in runs:
+            for post in posts:
+                assert scraper._post_date(post).day == int(post["datetime"][8:10])
+        return len(calls)
+    
+    assert sum(len(posts) for posts, _ in html_runs) == 6
+    assert count_date_parses(html_scraper, html_runs) == 4 and len(html_scraper._post_dates) == 4
+    assert count_date_parses(incremental_scraper, incremental_runs) == 4 and not incremental_scraper._post_dates
+    assert ThreadsScraper("tester", "2025-01-01", "2025-12-31").extraction_mode == "html"
+    print("✅ 게시물 추출 방식 비교 테스트 통과\n")
+
+
+def test_browser_pool_relogin():
+    """
+    공유 브라우저 재로그인 테스트 (동시에 만료를 확인해도 로그인은 1회, 브라우저 재시작 없음)
+    """
+    import asyncio
+    import browser_pool
+    from browser_pool import BrowserPool
+    
+    logins = []
+    
+    async def fake_login(playwright, cookies_file, user_data_dir=None):
+        logins.append(cookies_file)
+        await asyncio.sleep(0.01)
+        return [{"name": "sessionid", "value": "new"}]
+    
+    class FakeContext:
+        def __init__(self):
+            self.cookies = [{"name": "sessionid", "value": "old"}]
+        
+        async def clear_cookies(self):
+            self.cookies = []
+        
+        async def add_cookies(self, cookies):
+            self.cookies.extend(cookies)
+    
+    pool = BrowserPool()
+    context = FakeContext()
+    pool.context = context
+    original_login = browser_pool.interactive_login
+    browser_pool.interactive_login = fake_login
+    try:
+        async def expire_together():
+            generation = pool.login_generation
+            await asyncio.gather(*(pool.relogin(generation) for _ in range(3)))
+        asyncio.run(expire_together())
+    finally:
+        browser_pool.interactive_login = original_login
+    
+    print("=== 공유 브라우저 재로그인 테스트 ===")
+    print(f"로그인 횟수: {len(logins)}, 쿠키: {context.cookies}")
+    
+    assert len(logins) == 1
+    assert pool.context is context and pool.login_generation == 1
+    assert context.cookies == [{"name": "sessionid", "value": "new"}]
+    print("✅ 공유 브라우저 재로그인 테스트 통과\n")
+
+
+def test_browser_pool_shared_relogin():
+    """
+    크롤링 2개가 브라우저를 공유하는 중 재로그인 테스트 (컨텍스트를 닫지 않아 열린 페이지가 계속 동작)
+    """
+    import asyncio
+    import browser_pool
+    from browser_pool import BrowserPool
+    
+    logins = []
+    
+    async def fake_login(playwright, cookies_file, user_data_dir=None):
+        logins.append(user_data_dir)
+        await asyncio.sleep(0.01)
+        return [{"name": "sessionid", "value": "new"}]
+    
+    class FakePage:
+        def __init__(self, context):
+            self.context = context
+            self.visited = []
+        
+        def on(self, event, handler):
+            pass
+        
+        async def goto(self, url):
+            if self.context.closed:
+                raise RuntimeError("Target page, context or browser has been closed")
+            self.visited.append(url)
+    
+    class FakeContext:
+        def __init__(self):
+            self.closed = False
+            self.cookies = [{"name": "sessionid", "value": "old"}]
+        
+        async def new_page(self):
+            return FakePage(self)
+        
+        async def clear_cookies(self):
+            self.cookies = []
+        
+        async def add_cookies(self, cookies):
+            self.cookies.extend(cookies)
+        
+        async def close(self):
+            self.closed = True
+    
+    pool = BrowserPool(persistent=True)
+    context = FakeContext()
+    pool.context = context
+    original_login = browser_pool.interactive_login
+    browser_pool.interactive_login = fake_login
+    
+    async def crawl(name, delay):
+        page = await pool.new_page()
+        await page.goto(f"https://www.threads.net/@{name}")
+        generation = pool.login_generation
+        await asyncio.sleep(delay)
+        # 로그인 화면 확인 후 재로그인, 같은 페이지로 계속 크롤링
+        await pool.relogin(generation)
+        await page.goto(f"https://www.threads.net/@{name}?after_login")
+        return page
+    
+    try:
+        async def run():
+            return await asyncio.gather(crawl("a", 0), crawl("b", 0.005))
+        pages = asyncio.run(run())
+    finally:
+        browser_pool.interactive_login = original_login
+    
+    print("=== 공유 컨텍스트 재로그인 테스트 ===")
+    print(f"로그인 횟수: {len(logins)}, 컨텍스트 닫힘: {context.closed}")
+    
+    assert len(logins) == 1 and logins[0] is None
+    assert not context.closed and pool.context is context and pool.login_generation == 1
+    assert context.cookies == [{"name": "sessionid", "value": "new"}]
+    assert all(len(page.visited) == 2 for page in pages)
+    print("✅ 공유 컨텍스트 재로그인 테스트 통과\n")
+
+
+def test_engagement_fetcher():
+    """
+    상세 페이지 참여 수 수집 테스트 (동시 방문 수 제한 + 페이지 재사용)
+    """
+    import asyncio
+    import json
+    from engagement_fetcher import EngagementFetcher, engagement_from_html
+    from rate_limiter import RateLimiter
+    
+    def detail_html(code, likes):
+        node = {
+            "code": code, "taken_at": 1735689600, "like_count": likes,
+            "caption": {"text": "본문"}, "user": {"username": "tester"},
+            "text_post_app_info": {"direct_reply_count": 1, "repost_count": 2}
+        }
+        return '<script type="application/json">' + json.dumps({"thread_items": [{"post": node}]}) + '</script>'
+    
+    state = {"active": 0, "peak": 0, "pages": 0}
+    
+    class FakePage:
+        def __init__(self):
+            self.url = ""
+        
+        async def goto(self, url, **kwargs):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            self.url = url
+        
+        async def content(self):
+            code = self.url.rsplit("/", 1)[-1]
+            return detail_html(code, int(code[1:])) if code != "P404" else "<html></html>"
+        
+        def is_closed(self):
+            return False
+        
+        async def close(self):
+            pass
+    
+    class FakePool:
+        rate_limiter = RateLimiter(rate_per_second=0)
+        
+        async def new_page(self):
+            state["pages"] += 1
+            return FakePage()
+    
+    posts = [{"link": f"https://www.threads.net/@tester/post/P{i}", "likes": 0, "replies": 0, "reposts": 0}
+             for i in range(1, 9)]
+    posts.append({"link": "https://www.threads.net/@tester/post/P404", "likes": 0, "replies": 0, "reposts": 0})
+    posts.append({"link": "https://www.threads.net/@tester/post/P77", "likes": 5, "replies": 0, "reposts": 0})
+    
+    import tempfile
+    from post_sink import JsonlPostSink, SqlitePostSink
+    
+    def watched(sink_class):
+        # 저장소를 읽는 도중에 갱신하면 실패
+        class WatchedSink(sink_class):
+            reading = False
+            
+            def __iter__(self):
+                self.reading = True
+                try:
+                    yield from super().__iter__()
+                finally:
+                    self.reading = False
+            
+            def update(self, link, fields):
+                assert not self.reading, "읽는 중에 저장소 갱신"
+                super().update(link, fields)
+        return WatchedSink
+    
+    async def run(sinks):
+        async with EngagementFetcher(FakePool(), concurrency=3) as fetcher:
+            enriched = await fetcher.enrich(posts), fetcher.metrics
+        # 게시물 파일(post sink)은 작은 묶음으로 읽어 방문하고 값은 순회가 끝난 뒤 저장소에 기록
+        for sink in sinks:
+            async with EngagementFetcher(FakePool(), concurrency=2, batch_size=2) as fetcher:
+                assert await fetcher.enrich(sink) == 8
+        return enriched
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        sinks = [watched(JsonlPostSink)(os.path.join(tmp, "posts.jsonl")),
+                 watched(SqlitePostSink)(os.path.join(tmp, "posts.sqlite"))]
+        for sink in sinks:
+            sink.extend(dict(post) for post in posts)
+        enriched, metrics = asyncio.run(run(sinks))
+        for sink in sinks:
+            stored = {post["link"]: post for post in sink}
+            sink.close()
+            assert [stored[post["link"]]["likes"] for post in posts] == [post["likes"] for post in posts]
+    
+    print("=== 상세 페이지 참여 수 테스트 ===")
+    print(f"채움: {enriched}, 동시 최대: {state['peak']}, 페이지: {state['pages']}")
+    
+    assert enriched == 8
+    assert (posts[2]["likes"], posts[2]["replies"], posts[2]["reposts"]) == (3, 1, 2)
+    assert posts[-1]["likes"] == 5
+    assert state["peak"] <= 3 and state["pages"] == 3 + 2 + 2
+    assert metrics.counters["engagement.not_found"] == 1
+    assert engagement_from_html(detail_html("ABC", 9), "https://www.threads.net/@tester/post/ABC/")["likes"] == 9
+    print("✅ 상세 페이지 참여 수 테스트 통과\n")
+
+
+def test_multi_account_crawler():
+    """
+    여러 계정 동시 크롤링 테스트 (동시 실행 수 제한, 계정별 결과 + 합산 요약, 실패 계정 격리)
+    """
+    import asyncio
+    import tempfile
+    from multi_account import MultiAccountCrawler, parse_accounts
+    
+    accounts = parse_accounts("user_a, @user_b:2025-02-01:2025-02-28\nuser_c # 메모\nuser_a,broken",
+                              "2025-01-01", "2025-12-31")
+    assert accounts == [
+        ("user_a", "2025-01-01", "2025-12-31"), ("user_b", "2025-02-01", "2025-02-28"),
+        ("user_c", "2025-01-01", "2025-12-31"), ("broken", "2025-01-01", "2025-12-31"),
+    ]
+    try:
+        parse_accounts("user_d:2025-01-01", "2025-01-01", "2025-12-31")
+        assert False, "기간 형식 오류를 잡아야 함"
+    except ValueError:
+        pass
+    
+    state = {"active": 0, "peak": 0}
+    
+    class FakeScraper:
+        def __init__(self, username):
+            self.username = username
+        
+        async def scrape_posts(self):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            if self.username == "broken":
+                raise RuntimeError("로그인 실패")
+            return [
+                {"username": self.username, "text": "확정 수익 보장! DM 주세요", "datetime": "2025-03-01T00:00:00Z",
+                 "link": f"https://www.threads.net/@{self.username}/post/1"},
+                {"username": self.username, "text": "오늘 점심 뭐 먹지?", "datetime": "2025-03-02T00:00:00Z",
+                 "link": f"https://www.threads.net/@{self.username}/post/2"},
+            ]
+    
+    analyzer = GuidelineAnalyzer()
+    with tempfile.TemporaryDirectory() as tmp:
+        crawler = MultiAccountCrawler(
+            accounts,
+            scraper_factory=lambda username, start, end: FakeScraper(username),
+            analyze=lambda username, posts: analyzer.analyze_all_posts(posts),
+            output_dir=tmp,
+            concurrency=2
+        )
+        summary = asyncio.run(crawler.run())
+        
+        print("=== 여러 계정 크롤링 테스트 ===")
+        print(f"동시 최대: {state['peak']}, 합산: {summary['total_posts']}개")
+        
+        assert state["peak"] == 2
+        assert summary["total_posts"] == 6
+        assert crawler.status[accounts[3]]["status"].startswith("실패")
+        assert os.path.exists(os.path.join(tmp, "accounts", "user_b", "summary.txt"))
+        with open(os.path.join(tmp, "summary.txt"), encoding="utf-8") as f:
+            combined = f.read()
+        assert "@user_c" in combined and "실패" in combined
+    print("✅ 여러 계정 크롤링 테스트 통과\n")
+
+
+def test_rate_limiter():
+    """
+    호스트별 토큰 버킷 + 적응형 백오프 테스트
+    """
+    import asyncio
+    import time
+    from rate_limiter import RateLimiter
+    
+    limiter = RateLimiter(rate_per_second=50, burst=2, base_backoff_s=0.05, max_backoff_s=0.2, recover_step=0.25)
+    url = "https://www.threads.net/@tester"
+    
+    async def burst(count, target=url):
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(target) for _ in range(count)))
+        return time.monotonic() - started
+    
+    async def scenario():
+        # 버스트 2개 이후에는 초당 50개 (8개 -> 약 0.12초), 다른 호스트는 따로 계산
+        elapsed = await burst(8)
+        other = await burst(2, "https://cdn.example.com/a.jpg")
+        
+        # 동시에 들어온 감지는 한 번만 반영
+        first = limiter.throttled(url, "http_429")
+        assert limiter.throttled(url, "http_429") == 0
+        rate_after = limiter.current_rate(url)
+        blocked = await burst(1)
+        await asyncio.sleep(0.06)
+        second = limiter.throttled(url, "login_wall")
+        return elapsed, other, first, rate_after, blocked, second
+    
+    elapsed, other, first, rate_after, blocked, second = asyncio.run(scenario())
+    for _ in range(8):
+        limiter.succeeded(url)
+    
+    print("=== 요청 속도 제한 테스트 ===")
+    print(f"8개: {elapsed:.3f}s, 백오프: {first}s -> {second}s, 감지 후 속도: {rate_after}/s")
+    
+    assert 0.09 <= elapsed < 0.5
+    assert other < 0.02
+    assert first == 0.05 and second == 0.1
+    assert rate_after == 25 and blocked >= 0.04
+    assert limiter.current_rate(url) == 50
+    assert limiter.metrics.counters["ratelimit.throttled"] == 2
+    print("✅ 요청 속도 제한 테스트 통과\n")
+
+
+def test_reply_threads():
+    """
+    답글 스레드 펼치기 테스트 (원게시물에 이어지는 작성자 본인 답글만, 원게시물 연결)
+    """
+    import asyncio
+    import json
+    from engagement_fetcher import EngagementFetcher
+    from rate_limiter import RateLimiter
+    from csv_export import result_rows
+    
+    base = "https://www.threads.net/@tester/post/"
+    
+    def node(code, text, username="tester", likes=0):
+        return {"code": code, "taken_at": 1735689600, "like_count": likes, "caption": {"text": text},
+                "user": {"username": username}, "text_post_app_info": {"direct_reply_count": 0, "repost_count": 0}}
+    
+    # 상세 페이지: 원게시물 + 본인 답글 묶음, 다른 사용자 답글 묶음, 작성자의 관련 게시물 묶음
+    threads = {
+        "ROOT1": [[node("ROOT1", "세금 절약 팁 정리", likes=7), node("R1", "확정 수익 보장! DM 주세요"),
+                   node("X0", "중간에 끼어든 답글", username="someone"), node("R9", "다른 사람에게 단 답글")],
+                  [node("X1", "좋은 글이네요", username="someone"), node("R3", "감사합니다")],
+                  [node("ROOT2", "이미 수집한 게시물")], [node("OLD", "작성자의 예전 글")]],
+        "ROOT2": [[node("ROOT2", "두 번째 글"), node("R2", "자세한 내용은 프로필 링크")]],
+    }
+    visits = []
+    
+    class FakePage:
+        url = ""
+        
+        async def goto(self, url, **kwargs):
+            visits.append(url)
+            self.url = url
+        
+        async def content(self):
+            groups = threads[self.url.rsplit("/", 1)[-1]]
+            data = {"containing_thread": {"thread_items": [{"post": item} for item in groups[0]]},
+                    "reply_threads": [{"thread_items": [{"post": item} for item in group]} for group in groups[1:]]}
+            return '<script type="application/json">' + json.dumps(data) + '</script>'
+        
+        def is_closed(self):
+            return False
+        
+        async def close(self):
+            pass
+    
+    class FakePool:
+        rate_limiter = RateLimiter(rate_per_second=0)
+        
+        async def new_page(self):
+            return FakePage()
+    
+    posts = [{"username": "tester", "text": "세금 절약 팁 정리", "link": base + "ROOT1", "likes": 0},
+             {"username": "", "text": "두 번째 글", "link": base + "ROOT2", "likes": 0}]
+    
+    async def run():
+        async with EngagementFetcher(FakePool(), concurrency=2) as fetcher:
+            first = await fetcher.expand_threads(posts)
+            again = await fetcher.expand_threads(posts)
+            return first, again
+    replies, again = asyncio.run(run())
+    
+    print("=== 답글 스레드 테스트 ===")
+    print(f"답글: {[(r['link'], r['parent_link']) for r in replies]}")
+    
+    assert [r["link"] for r in replies] == [base + "R1", base + "R2"]
+    assert replies[0]["parent_link"] == base + "ROOT1"
+    assert again == [] and len(visits) == 2
+    assert len(posts) == 4 and posts[0]["likes"] == 7
+    
+    results = GuidelineAnalyzer().analyze_all_posts(posts)
+    assert results[2]["parent_link"] == base + "ROOT1" and results[2]["risk_score"] > 0
+    assert "parent_link" not in results[0]
+    assert result_rows(results)[2]["원게시물"] == base + "ROOT1"
+    print("✅ 답글 스레드 테스트 통과\n")
+
+
+def test_post_sink():
+    """
+    수집 게시물 파일 저장소 테스트 (list 처럼 추가/개수/순회, 다시 열어도 유지)
+    """
+    import tempfile
+    from post_sink import open_post_sink
+    from checkpoint import CrawlCheckpoint
+    
+    base = "https://www.threads.net/@tester/post/"
+    posts = [{"link": base + str(i), "text": f"게시물 {i}", "datetime": ""} for i in range(120)]
+    print("=== 게시물 파일 저장소 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in ("jsonl", "sqlite"):
+            sink = open_post_sink(kind, tmp, "@tester", "2025-01-01", "2025-12-31")
+            sink.clear()
+            sink.extend(posts[:100])
+            sink.append(posts[100])
+            # 닫은 뒤 추가/순회해도 다시 열림
+            sink.close()
+            sink.extend(posts[101:])
+            assert len(sink) == len(posts)
+            assert [post["link"] for post in sink] == [post["link"] for post in posts]
+            sink.close()
+            
+            reopened = open_post_sink(kind, tmp, "tester", "2025-01-01", "2025-12-31")
+            print(f"{kind}: {len(reopened)}개 ({reopened.path})")
+            assert len(reopened) == len(posts)
+            assert next(iter(reopened))["text"] == "게시물 0"
+            # 상세 페이지 값은 저장소에 반영 (다시 열어도 유지, 개수는 그대로)
+            reopened.update(base + "3", {"likes": 5})
+            reopened.update(base + "3", {"replies": 2})
+            reopened.close()
+            reopened = open_post_sink(kind, tmp, "tester", "2025-01-01", "2025-12-31")
+            updated = [post for post in reopened if post["link"] == base + "3"]
+            assert len(reopened) == len(posts) and updated[0]["likes"] == 5 and updated[0]["replies"] == 2
+            reopened.clear()
+            assert len(reopened) == 0 and list(reopened) == []
+            reopened.close()
+        
+        # 게시물을 저장소로 옮긴 체크포인트는 링크만 기억하고 게시물은 파일에만 기록
+        checkpoint = CrawlCheckpoint(tmp, "tester", "2025-01-01", "2025-12-31")
+        checkpoint.start()
+        checkpoint.add_post(posts[0])
+        checkpoint.release_posts()
+        checkpoint.add_post(posts[1])
+        checkpoint.close()
+        assert checkpoint.posts == [] and posts[1]["link"] in checkpoint.seen_links
+        resumed = CrawlCheckpoint(tmp, "tester", "2025-01-01", "2025-12-31")
+        assert resumed.load() and [post["link"] for post in resumed.posts] == [base + "0", base + "1"]
+        
+        # 결과를 하나씩 CSV 에 기록한 요약/상위 게시물은 전체 목록으로 만든 것과 같음
+        import pandas as pd
+        from csv_export import export_results_stream
+        results = GuidelineAnalyzer().analyze_all_posts(posts[:20] + [
+            {"link": base + "spam", "text": "확정 수익 보장! DM 주세요", "datetime": ""}])
+        csv_path = os.path.join(tmp, "results.csv")
+        accumulator, top_results = export_results_stream(iter(results), csv_path)
+        assert accumulator.to_dict() == generate_summary(results)
+        assert top_results == sorted(results, key=lambda r: r["risk_score"], reverse=True)[:10]
+        assert len(pd.read_csv(csv_path)) == len(results)
+    print("✅ 게시물 파일 저장소 테스트 통과\n")
+
+
+def test_keyword_automaton():
+    """
+    다중 키워드 오토마톤 테스트 (겹치는 키워드 포함)
+    """
+    automaton = KeywordAutomaton([
+        ("보장", "a"),
+        ("수익 보장", "b"),
+        ("100%", "c"),
+        ("100% 수익", "d"),
+        ("DM 주세요", "e"),
+    ]).build()
+    
+    hits = automaton.search("100% 수익 보장! dm 주세요".lower())
+    
+    print("=== 키워드 오토마톤 테스트 ===")
+    print(f"매칭: {sorted(hits)}")
+    
+    assert hits == {"a", "b", "c", "d", "e"}
+    assert automaton.search("오늘 점심 뭐 먹지?") == set()
+    print("✅ 키워드 오토마톤 테스트 통과\n")
+
+
+
+def test_compiled_guidelines_match_scan():
+    """
+    컴파일된 규칙 오토마톤 테스트 (키워드별/인디케이터별 부분 문자열 검사와 같은 결과)
+    """
+    import random
+    from compiled_guidelines import CompiledGuidelines
+    from guidelines import COMMUNITY_GUIDELINES, INDICATOR_WORD_MIN_LENGTH, INDICATOR_MATCH_RATIO
+    
+    def scan(text):
+        # 기존 방식: 하위 카테고리마다 키워드/인디케이터 단어를 본문에서 하나씩 검색
+        text_lower = text.lower()
+        matches = []
+        for category_data in COMMUNITY_GUIDELINES.values():
+            for subcat_data in category_data.get("subcategories", {}).values():
+                keywords = [k for k in subcat_data.get("keywords", []) if k.lower() in text_lower]
+                indicators = []
+                for indicator in subcat_data.get("indicators", []):
+                    words = [w for w in indicator.split() if len(w) >= INDICATOR_WORD_MIN_LENGTH]
+                    if words and sum(1 for w in words if w.lower() in text_lower) / len(words) >= INDICATOR_MATCH_RATIO:
+                        indicators.append(indicator)
+                if keywords or indicators:
+                    matches.append((keywords, indicators))
+        return matches
+    
+    phrases = []
+    for category_data in COMMUNITY_GUIDELINES.values():
+        for subcat_data in category_data.get("subcategories", {}).values():
+            phrases.extend(subcat_data.get("keywords", []))
+            phrases.extend(subcat_data.get("indicators", []))
+    rng = random.Random(42)
+    filler = ["오늘 점심 뭐 먹지?", "좋은 하루 되세요", "링크는 프로필에", "", "ㅋㅋㅋ"]
+    texts = phrases + filler
+    for _ in range(300):
+        words = " ".join(rng.sample(phrases, 3) + [rng.choice(filler)]).split()
+        # 단어 일부만 남기거나 대소문자를 바꿔 부분 매칭/겹침 확인
+        words = [w.upper() if rng.random() < 0.2 else w for w in words if rng.random() < 0.7]
+        texts.append(" ".join(words))
+    
+    compiled = CompiledGuidelines()
+    mismatches = matched = 0
+    for text in texts:
+        expected = scan(text)
+        actual = [
+            ([entry.keywords[i] for i in keyword_positions], [entry.indicators[i] for i in indicator_positions])
+            for entry, keyword_positions, indicator_positions in compiled.match(text)
+        ]
+        mismatches += actual != expected
+        matched += bool(expected)
+    
+    print("=== 컴파일된 규칙 매칭 테스트 ===")
+    print(f"게시물: {len(texts)}개, 위반: {matched}개, 불일치: {mismatches}개")
+    
+    assert mismatches == 0 and 0 < matched < len(texts)
+    print("✅ 컴파일된 규칙 매칭 테스트 통과\n")
+
+def test_benchmark_compare():
+    """
+    벤치마크 비교 테스트 (기준 대비 threshold 초과만 저하, 한쪽에만 있는 벤치마크 제외)
+    """
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from benchmarks.runner import compare
+    
+    def result(**medians):
+        return {"benchmarks": {name: {"median_seconds": value} for name, value in medians.items()}}
+    
+    baseline = result(analyze=1.0, dedup=2.0, parse=0.5, removed=1.0, zero=0.0)
+    current = result(analyze=1.2, dedup=2.2, parse=0.4, added=3.0, zero=0.1)
+    
+    rows = {row["name"]: row for row in compare(baseline, current, threshold=0.15)}
+    
+    print("=== 벤치마크 비교 테스트 ===")
+    for row in rows.values():
+        print(f"{row['name']}: {row['baseline']} → {row['current']} (x{row['ratio']}, 저하={row['regression']})")
+    
+    assert set(rows) == {"analyze", "dedup", "parse", "zero"}
+    assert rows["analyze"]["ratio"] == 1.2 and rows["analyze"]["regression"]
+    # 경계(+10%)와 개선은 저하 아님, 기준이 0 이면 비교하지 않음
+    assert rows["dedup"]["ratio"] == 1.1 and not rows["dedup"]["regression"]
+    assert not rows["parse"]["regression"] and not rows["zero"]["regression"]
+    assert not compare(baseline, current, threshold=0.25)[0]["regression"]
+    print("✅ 벤치마크 비교 테스트 통과\n")
+
 if __name__ == "__main__":
     print("=" * 50)
     print("Threads 분석기 테스트")
@@ -121,7 +1425,35 @@ if __name__ == "__main__":
     
     test_basic_analysis()
     test_duplicate_detection()
+    test_exact_duplicate_groups()
+    test_duplicate_similarity_meaning()
+    test_near_duplicate_candidates()
+    test_cross_run_duplicates()
+    test_parallel_analysis()
+    test_stream_analysis()
+    test_analysis_cache()
+    test_batch_risk_scoring()
+    test_compact_results()
     test_summary_generation()
+    test_summary_merge()
+    test_metrics()
+    test_feed_capture()
+    test_scroll_scheduler()
+    test_resource_blocker()
+    test_crawl_checkpoint()
+    test_high_water_marks()
+    test_partial_crawl_high_water_mark()
+    test_extraction_modes()
+    test_browser_pool_relogin()
+    test_browser_pool_shared_relogin()
+    test_engagement_fetcher()
+    test_multi_account_crawler()
+    test_rate_limiter()
+    test_reply_threads()
+    test_post_sink()
+    test_keyword_automaton()
+    test_compiled_guidelines_match_scan()
+    test_benchmark_compare()
     
     print("=" * 50)
     print("모든 테스트 통과! ✅")